@@ -1,8 +1,9 @@
+import logging
 import re
 import sys
 from typing import Tuple
 
-from son import SpiritOfNationsApp
+from son import SpiritOfNationsApp, DEFAULT_FPS, DEFAULT_MAP_NAME
 
 
 def get_resolution() -> Tuple[int, int]:
@@ -25,6 +26,40 @@ def get_resolution() -> Tuple[int, int]:
     return width, height
 
 
+def get_fps() -> int:
+    """
+    Check if the max number of frames per second has been given as an argument.
+    When it has, parse it, when not, get the default value.
+    :return: frames per second
+    """
+    fps = DEFAULT_FPS
+
+    for arg in sys.argv:
+        match = re.search('^fps=(\\d+)$', arg)
+        if match is not None:
+            fps = int(match.group(1))
+
+    return fps
+
+
+def get_map_name() -> str:
+    """
+    Check if the name of the played map has been given as an argument.
+    When it has, parse it, when not, get the default value.
+    :return: name of the map
+    """
+    map_name = DEFAULT_MAP_NAME
+
+    for arg in sys.argv:
+        match = re.search('^map=(\\w+)$', arg)
+        if match is not None:
+            map_name = match.group(1)
+
+    return map_name
+
+
 if __name__ == "__main__":
-    app = SpiritOfNationsApp(get_resolution())
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+
+    app = SpiritOfNationsApp(get_resolution(), fps=get_fps(), map_name=get_map_name())
     app.run()
@@ -1,5 +1,8 @@
-from son._app import SpiritOfNationsApp
+from son._app import SpiritOfNationsApp, DEFAULT_FPS
+from son.gameplay import DEFAULT_MAP_NAME
 
 __all__ = [
+    "DEFAULT_FPS",
+    "DEFAULT_MAP_NAME",
     "SpiritOfNationsApp"
 ]
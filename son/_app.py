@@ -1,45 +1,220 @@
+import os
 import sys
+from typing import List, Optional
 
 import pygame
+from pygame import Surface, Rect
+from pygame.event import Event
 from pygame.locals import *
 from pygame.time import Clock
 
-from son.core.scenes import SceneManager
+from son.core.scenes import SceneManager, SceneBase
 from son.core.vectors import VectorInt2D
-from son.gameplay import SceneGameplay
+from son.gameplay import SceneGameplay, DEFAULT_MAP_NAME
+from son.loading import SceneLoading
 from son.main_menu import SceneMainMenu
 
+DEFAULT_FPS = 30
+# Max time of waiting for an event while the app is idle in milliseconds
+IDLE_TIMEOUT = 500
+# Max area drawn outside the changed regions when they are merged into one clipped region, in pixels
+MAX_MERGE_OVERDRAW = 64 * 64
+
 
 class SpiritOfNationsApp:
     """
     Application: Spirit of Nations.
+
+    The frames are not run while the app is idle - when the last frame has handled no events, has drawn nothing
+    and the active scene is waiting for the input only. The app then waits for the next event instead, at most
+    IDLE_TIMEOUT milliseconds, so that it does not burn the CPU while nothing happens.
     """
 
-    def __init__(self, resolution: VectorInt2D) -> None:
+    def __init__(self, resolution: VectorInt2D, dirty_rendering: bool = True, fps: int = DEFAULT_FPS,
+                 headless: bool = False, map_name: str = DEFAULT_MAP_NAME,
+                 initial_scene_name: str = "MainMenu") -> None:
+        """
+        Initialize SpiritOfNationsApp.
+
+        :param resolution: resolution of the window
+        :param dirty_rendering: should only the changed regions of the screen be drawn and updated?
+        :param fps: max number of frames per second
+        :param headless: should the app run without a window? The SDL dummy video driver is used then and the scenes
+            are drawn to an offscreen surface, e.g. for the render benchmarks on a machine without any display
+        :param map_name: name of the map played in the gameplay scene
+        :param initial_scene_name: name of the scene shown first
+        :raises ValueError: when the number of frames per second is not positive
+        """
+        if headless:
+            # The driver is chosen by pygame.init(), so it must be set before
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+
         pygame.init()
         pygame.display.set_caption("Spirit of Nations")
 
-        self._surface = pygame.display.set_mode(resolution, flags=SCALED)
+        # The scaling needs a renderer, which is not available for the offscreen surface
+        self._surface = pygame.display.set_mode(resolution, flags=0 if headless else SCALED)
         self._clock = Clock()
+        self._dirty_rendering: bool = dirty_rendering
+        self._fps: int = DEFAULT_FPS
+        self.fps = fps
+        # Event that has ended the waiting of an idle app, it is handled before the events in the queue
+        self._waited_event: Optional[Event] = None
 
-        self._scene_manager = SceneManager(initial_scene_name="MainMenu")
+        self._scene_manager = SceneManager(initial_scene_name=initial_scene_name, loading_scene_name="Loading")
+        self._scene_manager.register_scene("Loading", SceneLoading)
         self._scene_manager.register_scene("MainMenu", SceneMainMenu)
-        self._scene_manager.register_scene("Gameplay", SceneGameplay)
+        self._scene_manager.register_scene("Gameplay", SceneGameplay, load_params={"map_name": map_name})
+
+    @property
+    def surface(self) -> Surface:
+        """
+        Surface of the window, or the offscreen surface in the headless mode, with the last drawn frame.
+
+        The surface must not be modified.
+        """
+        return self._surface
+
+    @property
+    def active_scene(self) -> SceneBase:
+        """
+        Scene shown at the moment, e.g. the loading scene while the next scene is loaded.
+        """
+        return self._scene_manager.active_scene
+
+    @property
+    def is_loading(self) -> bool:
+        """
+        Is any scene about to be shown, e.g. waiting for its data to be loaded?
+        """
+        return self._scene_manager.is_loading
+
+    @property
+    def fps(self) -> int:
+        """
+        Max number of frames per second, it can be changed while the app is running.
+        """
+        return self._fps
+
+    @fps.setter
+    def fps(self, value: int) -> None:
+        if value <= 0:
+            raise ValueError("Frames per second must be positive: {}".format(value))
+        self._fps = value
 
     def run(self) -> None:
         while True:
-            time_delta = self._clock.tick(30) * 0.001
+            time_delta = self._clock.tick(self._fps) * 0.001
+            if not self.run_frame(time_delta):
+                self._wait_for_event()
 
-            self._scene_manager.pre_update()
-            self._scene_manager.update(time_delta=time_delta)
+    def run_frame(self, time_delta: float) -> bool:
+        """
+        Run a single frame: update the active scene, handle the pending events and draw the scene.
 
-            for event in pygame.event.get():
-                if event.type == QUIT:
-                    pygame.quit()
-                    sys.exit()
+        It is called by run() in each frame, but it can also drive the app frame by frame, e.g. in benchmarks,
+        where the frames are not limited by the max number of frames per second.
 
-                self._scene_manager.handle_event(event)
+        :param time_delta: time passed since the previous frame in seconds
+        :return: has anything happened in the frame? It is False only when the frame has handled no events,
+            has drawn nothing and the active scene is idle.
+        """
+        self._scene_manager.pre_update()
+        self._scene_manager.update(time_delta=time_delta)
 
-            self._scene_manager.draw(self._surface)
+        events_count = self.handle_events()
+
+        is_drawn = self._draw()
+
+        return events_count > 0 or is_drawn or not self._scene_manager.is_idle
+
+    def handle_events(self) -> int:
+        """
+        Handle the pending events without updating and drawing the active scene.
+
+        The events posted while handling them are left in the queue, e.g. for the benchmarks to handle the input
+        before a measured frame, which then handles only its consequences.
+
+        :return: number of the handled events
+        """
+        events = pygame.event.get()
+        if self._waited_event is not None:
+            events.insert(0, self._waited_event)
+            self._waited_event = None
+
+        for event in events:
+            if event.type == QUIT:
+                pygame.quit()
+                sys.exit()
 
+            self._scene_manager.handle_event(event)
+
+        return len(events)
+
+    def _draw(self) -> bool:
+        """
+        Draw the active scene and update the display.
+
+        In the dirty rendering mode only the changed regions are drawn and updated, nothing at all when the screen
+        has not changed. Nearby regions are merged and each merged region is drawn under its own clip, so that
+        distant changes, e.g. the focus and the minimap, do not make the whole screen between them drawn. The whole
+        screen is drawn and flipped when the scene cannot tell what has changed, e.g. after scrolling.
+
+        :return: has anything on the screen changed?
+        """
+        dirty_rects = self._scene_manager.get_dirty_rects()
+
+        if dirty_rects is None or not self._dirty_rendering:
+            self._scene_manager.draw(self._surface)
             pygame.display.flip()
+        elif len(dirty_rects) > 0:
+            merged_rects = _merge_rects(dirty_rects)
+            for rect in merged_rects:
+                self._surface.set_clip(rect)
+                self._scene_manager.draw(self._surface)
+            self._surface.set_clip(None)
+            pygame.display.update(merged_rects)
+
+        return dirty_rects is None or len(dirty_rects) > 0
+
+    def _wait_for_event(self) -> None:
+        """
+        Wait until an event comes or IDLE_TIMEOUT passes, the event is kept for the next frame.
+
+        The event is not posted back to the queue, where it would get behind the events that have come meanwhile,
+        it is handled first by the next frame instead.
+        """
+        event = pygame.event.wait(IDLE_TIMEOUT)
+        if event.type != NOEVENT:
+            self._waited_event = event
+
+        # The time of waiting must not be passed to the next frame as the time delta
+        self._clock.tick()
+
+
+def _merge_rects(rects: List[Rect]) -> List[Rect]:
+    """
+    Merge the rects whose bounding rect adds at most MAX_MERGE_OVERDRAW pixels to their areas.
+
+    :param rects: rects to merge
+    :return: merged rects covering all the given rects
+    """
+    merged: List[Rect] = list()
+    for rect in rects:
+        rect = Rect(rect)
+        # A merged rect may reach other merged rects, so they are merged again until nothing changes
+        index = 0
+        while index < len(merged):
+            union = rect.union(merged[index])
+            if union.width * union.height <= _get_area(rect) + _get_area(merged[index]) + MAX_MERGE_OVERDRAW:
+                rect = union
+                del merged[index]
+                index = 0
+            else:
+                index += 1
+        merged.append(rect)
+    return merged
+
+
+def _get_area(rect: Rect) -> int:
+    return rect.width * rect.height
@@ -7,6 +7,8 @@ class Lifecycle:
     Base class for all classes that should go through the lifecycle in the main loop.
     """
 
+    __slots__ = ()
+
     def pre_update(self, *args, **kwargs) -> None:
         """
         Lifecycle hook: Pre-Update
@@ -0,0 +1,95 @@
+from bisect import insort
+from itertools import count
+from typing import Callable, Dict, List, Iterable, Tuple
+
+from pygame.event import Event
+
+# Function handling an event, it returns True when it has consumed the event
+EventHandler = Callable[[Event], bool]
+
+# Negated priority, order of subscribing and the handler, so that the handlers are sorted by the order of calling them
+_Subscription = Tuple[int, int, EventHandler]
+
+
+class EventBus:
+    """
+    Dispatcher of the events to the handlers subscribed to their types.
+
+    The handlers of an event type are called from the highest priority, the handlers with the same priority
+    in the order of subscribing. The event is not passed further once a handler consumes it by returning True,
+    the same as a component of a scene returning True from handle_event().
+
+    Dispatching an event costs time proportional to the number of the handlers of its type, so the components
+    of a scene are not asked about the events they do not handle.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize EventBus.
+        """
+        self._subscriptions: Dict[int, List[_Subscription]] = dict()
+        self._counter = count()
+
+    def subscribe(self, event_types: int or Iterable[int], handler: EventHandler, priority: int = 0) -> None:
+        """
+        Start calling the handler for the events of the given types.
+
+        :param event_types: event type or event types to handle
+        :param handler: function handling the events, it returns True when it has consumed the event
+        :param priority: priority of the handler, the handlers with higher priorities get the events first
+        """
+        for event_type in _get_event_types(event_types):
+            # The list is replaced instead of modified, so the handlers may subscribe during dispatching
+            subscriptions = self._subscriptions.get(event_type, list()).copy()
+            insort(subscriptions, (-priority, next(self._counter), handler), key=lambda s: s[:2])
+            self._subscriptions[event_type] = subscriptions
+
+    def unsubscribe(self, event_types: int or Iterable[int], handler: EventHandler) -> None:
+        """
+        Stop calling the handler for the events of the given types.
+
+        :param event_types: event type or event types handled by the handler
+        :param handler: function passed to subscribe()
+        :raises ValueError: when the handler is not subscribed to any of the event types
+        """
+        for event_type in _get_event_types(event_types):
+            subscriptions = self._subscriptions.get(event_type, list())
+            remaining = [subscription for subscription in subscriptions if subscription[2] != handler]
+            if len(remaining) == len(subscriptions):
+                raise ValueError("Handler not subscribed to the event type: {}".format(event_type))
+
+            if len(remaining) > 0:
+                self._subscriptions[event_type] = remaining
+            else:
+                del self._subscriptions[event_type]
+
+    def has_subscribers(self, event_type: int) -> bool:
+        """
+        Is any handler subscribed to the event type?
+
+        :param event_type: event type
+        """
+        return event_type in self._subscriptions
+
+    def dispatch(self, event: Event) -> bool:
+        """
+        Pass the event to the handlers subscribed to its type until any of them consumes it.
+
+        :param event: event to dispatch
+        :return: has any handler consumed the event?
+        """
+        subscriptions = self._subscriptions.get(event.type)
+        if subscriptions is None:
+            return False
+
+        for _, _, handler in subscriptions:
+            if handler(event):
+                return True
+
+        return False
+
+
+def _get_event_types(event_types: int or Iterable[int]) -> Iterable[int]:
+    if isinstance(event_types, int):
+        return event_types,
+    return event_types
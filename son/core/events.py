@@ -9,3 +9,5 @@ SELECT_MAP_OBJECT = pygame.event.custom_type()
 MOVE_MAP_OBJECT = pygame.event.custom_type()
 END_TURN = pygame.event.custom_type()
 START_TURN = pygame.event.custom_type()
+ZOOM = pygame.event.custom_type()
+CENTER_VIEW = pygame.event.custom_type()
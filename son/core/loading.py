@@ -0,0 +1,121 @@
+import threading
+import time
+from typing import Callable, Optional
+
+# Function receiving the progress of loading (0.0 - 1.0)
+ProgressCallback = Callable[[float], None]
+
+
+def scale_progress(callback: Optional[ProgressCallback], start: float, end: float) -> Optional[ProgressCallback]:
+    """
+    Get a function reporting the progress of one step of loading through the given callback.
+
+    The progress of the step (0.0 - 1.0) is mapped onto the given part of the whole progress.
+
+    :param callback: function receiving the whole progress (optional)
+    :param start: whole progress when the step starts
+    :param end: whole progress when the step ends
+    :return: function receiving the progress of the step or None, if no callback has been given
+    """
+    if callback is None:
+        return None
+    return lambda progress: callback(start + (end - start) * progress)
+
+
+class LoadingTask:
+    """
+    Task loading data, either on a worker thread while the main loop keeps running or synchronously.
+
+    The target function receives the task itself, so that it can report the progress of loading.
+    """
+
+    def __init__(self, target: Callable[["LoadingTask"], object]) -> None:
+        """
+        Initialize LoadingTask.
+
+        :param target: function loading the data, its return value is the result of the task
+        """
+        self._target = target
+
+        self._progress: float = 0.0
+        self._description: str = ""
+
+        self._result: object = None
+        self._error: Optional[BaseException] = None
+        self._done = threading.Event()
+
+    @property
+    def progress(self) -> float:
+        """
+        Progress of loading (0.0 - 1.0).
+        """
+        return self._progress
+
+    @property
+    def description(self) -> str:
+        """
+        Description of what is being loaded at the moment.
+        """
+        return self._description
+
+    @property
+    def is_done(self) -> bool:
+        """
+        Has the task finished, either successfully or with an error?
+        """
+        return self._done.is_set()
+
+    @property
+    def result(self) -> object:
+        """
+        Result of the task.
+
+        :raises: the error raised by the target function, if any
+        """
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def start(self) -> None:
+        """
+        Start the task on a worker thread.
+        """
+        thread = threading.Thread(target=self.run, name="LoadingTask", daemon=True)
+        thread.start()
+
+    def run(self) -> None:
+        """
+        Run the task on the current thread.
+        """
+        try:
+            self._result = self._target(self)
+            self.report(1.0)
+        except BaseException as e:
+            self._error = e
+        finally:
+            self._done.set()
+
+    def report(self, progress: float, description: Optional[str] = None) -> None:
+        """
+        Report the progress of loading.
+
+        :param progress: progress of loading (0.0 - 1.0)
+        :param description: description of what is being loaded (optional, the last one is kept if not given)
+        """
+        self._progress = min(max(progress, 0.0), 1.0)
+        if description is not None:
+            self._description = description
+
+        # Let the main thread run, so that loading does not slow down the main loop
+        time.sleep(0)
+
+    def get_progress_callback(self, start: float, end: float) -> ProgressCallback:
+        """
+        Get a function reporting the progress of one of the loading steps.
+
+        The progress of the step (0.0 - 1.0) is mapped onto the given part of the progress of the task.
+
+        :param start: progress of the task when the step starts
+        :param end: progress of the task when the step ends
+        """
+        return scale_progress(self.report, start, end)
@@ -0,0 +1,80 @@
+from typing import Dict, List, Iterator, Callable, MutableMapping, Any
+
+# Function called with the new value of an observed key
+Observer = Callable[[Any], None]
+
+
+class ObservableDict(MutableMapping[str, Any]):
+    """
+    Dictionary notifying the observers of its keys about the changes of their values.
+
+    The observers of a key are called only when its value is set to a different one, so setting the same value again,
+    e.g. on each turn, costs only the comparison.
+    """
+
+    __slots__ = ("_values", "_observers")
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Initialize ObservableDict.
+
+        :param args: arguments of dict() with the initial values
+        :param kwargs: keyword arguments of dict() with the initial values
+        """
+        self._values: Dict[str, Any] = dict(*args, **kwargs)
+        # Created with the first observer, most of the dictionaries are never observed
+        self._observers: Dict[str, List[Observer]] or None = None
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._values and self._values[key] == value:
+            return
+        self._values[key] = value
+
+        if self._observers is None:
+            return
+        observers = self._observers.get(key)
+        if observers is not None:
+            for observer in observers.copy():
+                observer(value)
+
+    def __delitem__(self, key: str) -> None:
+        del self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return "{}({!r})".format(type(self).__name__, self._values)
+
+    def observe(self, key: str, observer: Observer) -> None:
+        """
+        Start calling the observer whenever the value of the key changes.
+
+        :param key: key to observe
+        :param observer: function called with the new value
+        """
+        if self._observers is None:
+            self._observers = dict()
+        self._observers.setdefault(key, list()).append(observer)
+
+    def unobserve(self, key: str, observer: Observer) -> None:
+        """
+        Stop calling the observer when the value of the key changes.
+
+        :param key: observed key
+        :param observer: function passed to observe()
+        :raises ValueError: when the observer does not observe the key
+        """
+        observers = self._observers.get(key) if self._observers is not None else None
+        if observers is None or observer not in observers:
+            raise ValueError("Observer not observing the key: {}".format(key))
+
+        observers.remove(observer)
+        if len(observers) == 0:
+            del self._observers[key]
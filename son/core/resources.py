@@ -1,9 +1,13 @@
 import os
 from dataclasses import dataclass
-from typing import List
+from typing import List, Dict
 
 import pygame
-from pygame import Surface
+from pygame import Surface, Rect
+from pygame.locals import SRCALPHA
+
+# Default max size of the atlas pages in pixels
+DEFAULT_ATLAS_PAGE_SIZE = 1024
 
 
 class ResourceNotFoundError(Exception):
@@ -30,16 +34,39 @@ class ResourceManager:
     """
     Resource manager cares for loading the resources from the given list and provides an easy way to get them
     using their assigned name.
+
+    The loaded images are packed into atlas pages and the resources are served as subsurfaces of the pages.
+    The images with per-pixel alpha and the opaque ones are packed into separate pages, so that the opaque images
+    are never blended. When the display mode has been set before loading, the pages are converted to the pixel
+    format of the display, so that blitting the resources does not need any conversion.
     """
 
-    def __init__(self, paths: List[DataPath]) -> None:
+    def __init__(self, paths: List[DataPath], atlas_page_size: int = DEFAULT_ATLAS_PAGE_SIZE) -> None:
+        """
+        Initialize ResourceManager.
+
+        :param paths: resource directories to load the resources from
+        :param atlas_page_size: max width and height of the atlas pages in pixels, larger images get their own page
+        """
         self._paths: List[DataPath] = paths
-        self._resources = dict()
+        self._atlas_page_size: int = atlas_page_size
+        self._resources: Dict[str, Surface] = dict()
+        self._atlas_pages: List[Surface] = list()
+
+    @property
+    def atlas_pages(self) -> List[Surface]:
+        """
+        Atlas pages holding the pixels of all resources.
+
+        Any operations on the list will have no effect, since it is a shallow copy.
+        """
+        return self._atlas_pages.copy()
 
     def load_resources(self) -> None:
         """
         Load all resources from the specified data paths.
         """
+        images: Dict[str, Surface] = dict()
         data_path = os.path.join(os.getcwd(), "data")
         for path in self._paths:
             dir_path = os.path.join(data_path, path.path)
@@ -47,8 +74,12 @@ class ResourceManager:
                 el_path = os.path.join(dir_path, el)
                 if os.path.isfile(el_path):
                     name = self._get_resource_name(el, path)
-                    surface = pygame.image.load(el_path)
-                    self._resources[name] = surface
+                    images[name] = pygame.image.load(el_path)
+
+        alpha_images = {name: image for name, image in images.items() if image.get_flags() & SRCALPHA}
+        opaque_images = {name: image for name, image in images.items() if name not in alpha_images}
+        self._pack_images(alpha_images, True)
+        self._pack_images(opaque_images, False)
 
     def get_resource(self, name: str) -> Surface:
         """
@@ -61,6 +92,59 @@ class ResourceManager:
         except KeyError:
             raise ResourceNotFoundError(name)
 
+    def _pack_images(self, images: Dict[str, Surface], has_alpha: bool) -> None:
+        """
+        Pack the images into new atlas pages and store the resources as subsurfaces of the pages.
+
+        The images are placed in rows (shelves), from the highest to the lowest one.
+
+        :param images: images by the names of the resources
+        :param has_alpha: do the images have per-pixel alpha?
+        """
+        page_size = self._atlas_page_size
+        pages: List[Dict[str, Rect]] = list()
+        page: Dict[str, Rect] = dict()
+        shelf_x, shelf_y, shelf_height = 0, 0, 0
+
+        for name, image in sorted(images.items(), key=lambda item: item[1].get_height(), reverse=True):
+            width, height = image.get_size()
+            if width > page_size or height > page_size:
+                # The image does not fit any page, so it gets a page of its own
+                pages.append({name: Rect(0, 0, width, height)})
+                continue
+            if shelf_x + width > page_size:
+                shelf_x, shelf_y, shelf_height = 0, shelf_y + shelf_height, 0
+            if shelf_y + height > page_size:
+                pages.append(page)
+                page = dict()
+                shelf_x, shelf_y, shelf_height = 0, 0, 0
+            page[name] = Rect(shelf_x, shelf_y, width, height)
+            shelf_x += width
+            shelf_height = max(shelf_height, height)
+        if len(page) > 0:
+            pages.append(page)
+
+        for page in pages:
+            page_rect = Rect(0, 0, 0, 0).unionall(list(page.values()))
+            page_surface = Surface(page_rect.size, SRCALPHA if has_alpha else 0, 32)
+            page_surface.blits([(images[name], rect) for name, rect in page.items()], doreturn=False)
+            page_surface = self._convert(page_surface, has_alpha)
+            self._atlas_pages.append(page_surface)
+            for name, rect in page.items():
+                self._resources[name] = page_surface.subsurface(rect)
+
+    @staticmethod
+    def _convert(surface: Surface, has_alpha: bool) -> Surface:
+        """
+        Convert the surface to the pixel format of the display, if the display mode has been set.
+
+        :param surface: surface to convert
+        :param has_alpha: does the surface have per-pixel alpha?
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if has_alpha else surface.convert()
+
     @staticmethod
     def _get_resource_name(resource: str, path: DataPath) -> str:
         # Get rid of the extension
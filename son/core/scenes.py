@@ -1,13 +1,19 @@
-from typing import Type, Dict
+import gc
+import logging
+from functools import partial
+from typing import Type, Dict, List, Optional, Tuple
 
 import pygame.event
-from pygame import Surface
+from pygame import Surface, Rect
 from pygame.event import Event
 
 from son.core.base import Lifecycle
 from son.core.events import SCENE_FINISHED
+from son.core.loading import LoadingTask
 from son.core.utils.decorators import override
 
+_logger = logging.getLogger(__name__)
+
 
 def finish_scene(next_scene_name: str = "") -> None:
     """
@@ -21,8 +27,78 @@ def finish_scene(next_scene_name: str = "") -> None:
 class SceneBase(Lifecycle):
     """
     Base class for all scenes.
+
+    Scenes that need to load a lot of data set requires_loading to True and override load(). The data is then loaded
+    on a worker thread while the loading scene is shown, and passed to the constructor of the scene. What is loaded,
+    e.g. which map, is given by the load parameters the scene has been registered with. Scenes whose data holds
+    resources that must be released, e.g. open files, override unload() as well.
+    """
+
+    # Does the scene need to load data before it is created?
+    requires_loading: bool = False
+
+    @staticmethod
+    def load(task: LoadingTask, **kwargs) -> object:
+        """
+        Load the data needed by the scene.
+
+        It is called on a worker thread, so it must not touch the display nor the other scenes.
+
+        :param task: the loading task, used for reporting the progress
+        :param kwargs: load parameters given when the scene has been registered
+        :return: data passed to the constructor of the scene
+        """
+        return None
+
+    @staticmethod
+    def unload(data: object) -> None:
+        """
+        Release the data returned by load() that has never been passed to the constructor of the scene, e.g. when
+        another scene has been chosen while the data was being loaded.
+
+        :param data: data returned by load()
+        """
+        pass
+
+    def get_dirty_rects(self) -> Optional[List[Rect]]:
+        """
+        Get the regions of the screen that have changed since the scene was drawn the last time.
+
+        Scenes that do not track their changes keep the default, so they are drawn fully in each frame.
+
+        :return: list of the changed regions or None, when the whole scene must be drawn again
+        """
+        return None
+
+    def close(self) -> None:
+        """
+        Release the resources of the scene, it is called when the scene is replaced by another one.
+        """
+        pass
+
+    @property
+    def is_idle(self) -> bool:
+        """
+        Is the scene waiting for the input only, i.e. nothing changes in it on its own?
+
+        Idle scenes are neither updated nor drawn until an event comes. Scenes that are not sure keep the default,
+        so they are updated in each frame.
+        """
+        return False
+
+
+class SceneLoadingBase(SceneBase):
+    """
+    Base class for the scenes shown while another scene is being loaded.
     """
-    pass
+
+    def __init__(self, task: LoadingTask) -> None:
+        """
+        Initialize SceneLoadingBase.
+
+        :param task: task loading the data of the next scene
+        """
+        self._task: LoadingTask = task
 
 
 class SceneNotRegisteredError(Exception):
@@ -37,27 +113,147 @@ class SceneNotRegisteredError(Exception):
 class SceneManager(Lifecycle):
     """
     Scene Manager.
+
+    When loading the data of a scene fails, the error is logged and the scene shown before the loading is loaded again
+    instead, or the initial scene when there was none. The data of a loading that has been abandoned because another
+    scene has been chosen meanwhile is released as soon as the loading finishes.
     """
 
-    def __init__(self, initial_scene_name: str = ""):
+    def __init__(self, initial_scene_name: str = "", loading_scene_name: Optional[str] = None):
+        """
+        Initialize SceneManager.
+
+        :param initial_scene_name: name of the scene loaded first
+        :param loading_scene_name: name of the scene shown while scenes requiring loading are loaded (optional,
+            without it the data is loaded synchronously)
+        """
         self._registered_scenes: Dict[str, Type[SceneBase]] = dict()
-        self._active_scene: SceneBase
+        self._load_params: Dict[str, Dict[str, object]] = dict()
+        self._active_scene: SceneBase or None = None
         self._next_scene_name: str or None = initial_scene_name
+        self._initial_scene_name: str = initial_scene_name
+        self._loading_scene_name: Optional[str] = loading_scene_name
+        # Name of the last active scene other than the loading scene
+        self._active_scene_name: Optional[str] = None
+
+        # Scene waiting for its data to be loaded and the scene loaded instead, when the loading fails
+        self._loading_task: Optional[LoadingTask] = None
+        self._loaded_scene_name: Optional[str] = None
+        self._fallback_scene_name: Optional[str] = None
+        # Abandoned tasks that are still loading and the classes of their scenes, which release the loaded data
+        self._abandoned_tasks: List[Tuple[LoadingTask, Type[SceneBase]]] = list()
+        # Are the objects of the active scene frozen, i.e. ignored by the garbage collector?
+        self._is_gc_frozen: bool = False
+
+        # Has the active scene changed since the last drawing?
+        self._is_scene_changed: bool = True
 
     @override
     def pre_update(self, *args, **kwargs) -> None:
         if self._next_scene_name is not None:
-            self._load_scene(self._next_scene_name)
+            next_scene_name = self._next_scene_name
             self._next_scene_name = None
+            self._load_scene(next_scene_name, self._active_scene_name or self._initial_scene_name)
+
+        if self._loading_task is not None and self._loading_task.is_done:
+            task = self._loading_task
+            self._loading_task = None
+            self._is_scene_changed = True
+            self._activate_loaded_scene(self._loaded_scene_name, task, self._fallback_scene_name)
+
+        if len(self._abandoned_tasks) > 0:
+            self._unload_abandoned_tasks()
 
         self._active_scene.pre_update(*args, **kwargs)
 
-    def _load_scene(self, name: str) -> None:
+    def _load_scene(self, name: str, fallback_scene_name: Optional[str]) -> None:
+        scene_class = self._get_scene_class(name)
+
+        # Any unfinished loading is abandoned, its data is released once it is loaded
+        if self._loading_task is not None:
+            self._abandoned_tasks.append((self._loading_task, self._get_scene_class(self._loaded_scene_name)))
+            self._loading_task = None
+        self._is_scene_changed = True
+
+        if not scene_class.requires_loading:
+            self._set_active_scene(scene_class())
+            self._active_scene_name = name
+            return
+
+        task = LoadingTask(partial(scene_class.load, **self._load_params[name]))
+        if self._loading_scene_name is None:
+            task.run()
+            self._activate_loaded_scene(name, task, fallback_scene_name)
+            return
+
+        self._loading_task = task
+        self._loaded_scene_name = name
+        self._fallback_scene_name = fallback_scene_name
+        self._set_active_scene(self._get_scene_class(self._loading_scene_name)(task))
+        task.start()
+
+    def _activate_loaded_scene(self, name: str, task: LoadingTask, fallback_scene_name: Optional[str]) -> None:
+        """
+        Create the scene with the data loaded by the finished task or load the fallback scene, when the loading failed.
+
+        :param name: name of the loaded scene
+        :param task: finished task loading the data of the scene
+        :param fallback_scene_name: name of the scene loaded when the loading failed (optional, the error is raised
+            without it)
+        """
+        try:
+            data = task.result
+        except Exception:
+            if fallback_scene_name is None or fallback_scene_name == name:
+                raise
+            _logger.exception("Scene '%s' could not be loaded, loading the scene '%s' instead", name,
+                              fallback_scene_name)
+            # The fallback scene has no fallback, so a failure to load it is not retried over and over
+            self._load_scene(fallback_scene_name, None)
+            return
+
+        self._set_active_scene(self._get_scene_class(name)(data))
+        self._active_scene_name = name
+
+        # The loaded objects, e.g. the map objects, live as long as the scene, so they are moved out of the reach
+        # of the garbage collector; otherwise each full collection traverses all of them and stalls a frame.
+        # The freezing is process-wide, so it is done only now that the loading has finished, not for the loading
+        # scene while the worker thread is still allocating.
+        gc.freeze()
+        self._is_gc_frozen = True
+
+    def _unload_abandoned_tasks(self) -> None:
+        """
+        Release the data of the abandoned tasks that have finished loading.
+        """
+        running_tasks: List[Tuple[LoadingTask, Type[SceneBase]]] = list()
+        for task, scene_class in self._abandoned_tasks:
+            if not task.is_done:
+                running_tasks.append((task, scene_class))
+                continue
+            try:
+                data = task.result
+            except Exception as e:
+                # Nothing has been loaded, so there is nothing to release
+                _logger.debug("Abandoned loading of the scene %s failed: %s", scene_class.__name__, e)
+                continue
+            scene_class.unload(data)
+        self._abandoned_tasks = running_tasks
+
+    def _set_active_scene(self, scene: SceneBase) -> None:
+        if self._active_scene is not None:
+            self._active_scene.close()
+        if self._is_gc_frozen:
+            # The objects of the closed scene can be collected again
+            gc.unfreeze()
+            self._is_gc_frozen = False
+        self._active_scene = scene
+
+    def _get_scene_class(self, name: str) -> Type[SceneBase]:
         if name not in self._registered_scenes.keys():
             raise SceneNotRegisteredError(name)
 
-        scene_class = self._registered_scenes[name]
-        self._active_scene = scene_class()
+        return self._registered_scenes[name]
 
     @override
     def update(self, *args, **kwargs) -> None:
@@ -74,12 +270,47 @@ class SceneManager(Lifecycle):
     @override
     def draw(self, destination_surface: Surface, *args, **kwargs) -> None:
         self._active_scene.draw(destination_surface, *args, **kwargs)
+        self._is_scene_changed = False
+
+    def get_dirty_rects(self) -> Optional[List[Rect]]:
+        """
+        Get the regions of the screen that have changed since the active scene was drawn the last time.
+
+        :return: list of the changed regions or None, when the whole screen must be drawn again
+        """
+        if self._is_scene_changed:
+            return None
+        return self._active_scene.get_dirty_rects()
+
+    @property
+    def active_scene(self) -> SceneBase:
+        """
+        Scene shown at the moment, e.g. the loading scene while the next scene is loaded.
+        """
+        return self._active_scene
+
+    @property
+    def is_loading(self) -> bool:
+        """
+        Is any scene about to be shown, e.g. waiting for its data to be loaded?
+        """
+        return self._next_scene_name is not None or self._loading_task is not None
+
+    @property
+    def is_idle(self) -> bool:
+        """
+        Is the active scene idle and no other scene is about to be shown?
+        """
+        return not self.is_loading and not self._is_scene_changed and self._active_scene.is_idle
 
-    def register_scene(self, name: str, scene_class: Type[SceneBase]) -> None:
+    def register_scene(self, name: str, scene_class: Type[SceneBase],
+                       load_params: Optional[Dict[str, object]] = None) -> None:
         """
         Register a scene.
 
         :param name: name for a new scene
         :param scene_class: class of a new scene
+        :param load_params: keyword arguments passed to load() of the scene (optional)
         """
         self._registered_scenes[name] = scene_class
+        self._load_params[name] = dict(load_params) if load_params is not None else dict()
@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 import pygame.font
 from pygame import Surface
 from pygame.font import Font
@@ -9,10 +11,62 @@ if __name__ != "__main__":
 
 _FONT = Font(pygame.font.get_default_font(), FONT_SIZE)
 
+# Max number of the rendered texts kept in the cache
+DEFAULT_TEXT_CACHE_SIZE = 256
+
+
+class TextRenderer:
+    """
+    Renderer of the UI texts with the default font.
+
+    The rendered texts are cached, so that the texts shown again, e.g. the labels of a panel opened again or a value
+    switching between a few states, are not rendered at all. The least recently used texts are evicted when the cache
+    is full.
+    """
+
+    def __init__(self, font: Font, cache_size: int = DEFAULT_TEXT_CACHE_SIZE) -> None:
+        """
+        Initialize TextRenderer.
+
+        :param font: font to render the texts with
+        :param cache_size: max number of the rendered texts kept in the cache
+        """
+        self._font: Font = font
+        self._cache_size: int = max(0, cache_size)
+        self._cache: OrderedDict[str, Surface] = OrderedDict()
+
+    def render(self, text: str) -> Surface:
+        """
+        Get a surface with the given text on it.
+
+        The surface may be shared with the other callers, so it must not be modified.
+
+        :param text: text to render
+        """
+        surface = self._cache.get(text)
+        if surface is not None:
+            self._cache.move_to_end(text)
+            return surface
+
+        surface = self._font.render(text, True, COLOR_TEXT, COLOR_BACKGROUND)
+
+        if self._cache_size > 0:
+            self._cache[text] = surface
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        return surface
+
+
+_TEXT_RENDERER = TextRenderer(_FONT)
+
 
 def create_text(text: str) -> Surface:
     """
     Create a surface with the given text on it.
+
+    The surface may be shared with the other callers, so it must not be modified.
+
     :param text: text to render
     """
-    return _FONT.render(text, True, COLOR_TEXT, COLOR_BACKGROUND)
+    return _TEXT_RENDERER.render(text)
@@ -10,11 +10,15 @@ class UIWidget(Lifecycle):
     Abstract base class for all UI widgets.
 
     In the inheriting classes remember to call _update_surface() in the __init__ method after the super() call.
+
+    A widget is dirty when its look has changed since it was drawn the last time. The inheriting classes must set
+    _is_dirty when their look changes without updating the surface.
     """
 
     def __init__(self) -> None:
         self._surface = Surface((0, 0))
         self._rect = self._surface.get_rect()
+        self._is_dirty = True
 
     def _create_surface(self) -> Surface:
         raise NotImplementedError("UIWidget is an abstract base class.")
@@ -22,6 +26,7 @@ class UIWidget(Lifecycle):
     def _update_surface(self) -> None:
         self._surface = self._create_surface()
         self._rect.size = self._surface.get_size()
+        self._is_dirty = True
 
     @property
     def surface(self) -> Surface:
@@ -30,6 +35,19 @@ class UIWidget(Lifecycle):
         """
         return self._surface
 
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Has the look of the widget changed since it was drawn the last time?
+        """
+        return self._is_dirty
+
+    def clear_dirty(self) -> None:
+        """
+        Mark the widget as drawn.
+        """
+        self._is_dirty = False
+
     @property
     def rect(self) -> Rect:
         """
@@ -47,6 +65,7 @@ class UIWidget(Lifecycle):
     @pos.setter
     def pos(self, value):
         self._rect.topleft = value
+        self._is_dirty = True
 
 
 UIWidgetsList = List[UIWidget]
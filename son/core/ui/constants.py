@@ -2,5 +2,6 @@ COLOR_TEXT = (255, 255, 255)
 COLOR_BACKGROUND = (50, 50, 50)
 COLOR_FOCUS = (255, 0, 0)
 COLOR_BORDER = (255, 255, 255)
+COLOR_PROGRESS = (100, 150, 50)
 FONT_SIZE = 16
 DEFAULT_PADDING = 5
@@ -1,12 +1,16 @@
-from typing import List
+from typing import List, Dict
 
-from pygame import Surface
+from pygame import Surface, Rect, MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP
 from pygame.event import Event
 
 from son.core.base import Lifecycle
+from son.core.event_bus import EventBus
 from son.core.ui._widgets_base import UIWidget, UIWidgetsList
 from son.core.utils.decorators import override
 
+# Types of the events handled by the widgets
+WIDGET_EVENT_TYPES = (MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP)
+
 
 class UIController(Lifecycle):
     """
@@ -17,6 +21,10 @@ class UIController(Lifecycle):
         self._subcontrollers: List[UISubcontroller] = list()
         self._widgets: UIWidgetsList = list()
 
+        # Rects of the widgets when they were drawn the last time and regions left by the removed widgets
+        self._drawn_rects: Dict[UIWidget, Rect] = dict()
+        self._dirty_rects: List[Rect] = list()
+
     @property
     def widgets(self) -> UIWidgetsList:
         """
@@ -46,6 +54,30 @@ class UIController(Lifecycle):
         for subcontroller in self._subcontrollers:
             if subcontroller.handle_event(event, *args, **kwargs):
                 return True
+
+        return self._handle_widgets_event(event, *args, **kwargs)
+
+    def subscribe(self, event_bus: EventBus, priority: int = 0) -> None:
+        """
+        Subscribe the subcontrollers and the widgets to the events they handle.
+
+        It replaces handle_event() in the scenes dispatching the events by an event bus. The widgets handle only
+        the input of the mouse.
+
+        :param event_bus: event bus of the scene
+        :param priority: priority of the handlers
+        """
+        for subcontroller in self._subcontrollers:
+            subcontroller.subscribe(event_bus, priority)
+        event_bus.subscribe(WIDGET_EVENT_TYPES, self._handle_widgets_event, priority)
+
+    def _handle_widgets_event(self, event: Event, *args, **kwargs) -> bool:
+        """
+        Pass the event to the widgets until any of them handles it.
+
+        :param event: event to handle
+        :return: has any widget handled the event?
+        """
         for widget in self._widgets:
             if widget.handle_event(event, *args, **kwargs):
                 return True
@@ -56,8 +88,33 @@ class UIController(Lifecycle):
     def draw(self, destination_surface: Surface, *args, **kwargs) -> None:
         for subcontroller in self._subcontrollers:
             subcontroller.draw(destination_surface, *args, **kwargs)
-        for widget in self.widgets:
+        for widget in self._widgets:
             widget.draw(destination_surface, *args, **kwargs)
+            widget.clear_dirty()
+            self._drawn_rects[widget] = widget.rect
+        self._dirty_rects.clear()
+
+    def get_dirty_rects(self) -> List[Rect]:
+        """
+        Get the regions of the screen that have changed since the UI was drawn the last time.
+        """
+        dirty_rects = self._dirty_rects.copy()
+        for widget in self._widgets:
+            rect = widget.rect
+            drawn_rect = self._drawn_rects.get(widget)
+            if widget.is_dirty or drawn_rect != rect:
+                dirty_rects.append(rect)
+                if drawn_rect is not None and drawn_rect != rect:
+                    dirty_rects.append(drawn_rect)
+        return dirty_rects
+
+    def has_widget(self, widget: UIWidget) -> bool:
+        """
+        Is the widget owned by this controller?
+
+        :param widget: widget to look for
+        """
+        return widget in self._widgets
 
     def add_widget(self, widget: UIWidget) -> None:
         """
@@ -65,8 +122,9 @@ class UIController(Lifecycle):
 
         :param widget: widget to be added
         """
-        if widget not in self.widgets:
+        if widget not in self._widgets:
             self._widgets.append(widget)
+            self._dirty_rects.append(widget.rect)
 
     def remove_widget(self, widget: UIWidget) -> None:
         """
@@ -74,8 +132,9 @@ class UIController(Lifecycle):
 
         :param widget: widget to be removed
         """
-        if widget in self.widgets:
+        if widget in self._widgets:
             self._widgets.remove(widget)
+            self._dirty_rects.append(self._drawn_rects.pop(widget, widget.rect))
 
 
 class UISubcontroller(Lifecycle):
@@ -90,3 +149,14 @@ class UISubcontroller(Lifecycle):
         :param owner: UIController that governs this subcontroller
         """
         self._owner = owner
+
+    def subscribe(self, event_bus: EventBus, priority: int = 0) -> None:
+        """
+        Subscribe the handlers of the subcontroller to the events it handles.
+
+        Subcontrollers that do not handle any events keep the default, which subscribes nothing.
+
+        :param event_bus: event bus of the scene
+        :param priority: priority of the handlers
+        """
+        pass
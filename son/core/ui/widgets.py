@@ -3,6 +3,7 @@ from pygame import Surface
 from pygame.event import Event
 from pygame.locals import *
 
+from son.core.observable import ObservableDict
 from son.core.ui._text import create_text
 from son.core.ui._widgets_base import UIWidget, UIWidgetsList
 from son.core.ui.constants import *
@@ -13,12 +14,17 @@ from son.core.vectors import VectorInt2D
 class Box(UIWidget):
     """
     Box with a background.
+
+    The background and the widgets are composited into a single surface, which is rendered again only when any
+    of the widgets or the box itself changes, so drawing an unchanged box takes a single blit.
     """
 
     def __init__(self):
         super().__init__()
 
         self._surface_padding = Surface((0, 0))
+        # Background with the widgets drawn on it, None when it must be rendered again
+        self._composited_surface: Surface or None = None
 
         self._widgets: UIWidgetsList = list()
         self._padding = DEFAULT_PADDING
@@ -52,7 +58,7 @@ class Box(UIWidget):
         x_sizes = [10]
         y_sizes = [10]
 
-        for widget in self.widgets:
+        for widget in self._widgets:
             x_sizes.append(widget.rect.right)
             y_sizes.append(widget.rect.bottom)
 
@@ -75,16 +81,29 @@ class Box(UIWidget):
     def _update_surface(self) -> None:
         self._surface = self._create_surface()
         self._surface_padding = self._create_surface_padding()
+        self._composited_surface = None
         self._rect.size = self._surface_padding.get_size()
+        self._is_dirty = True
+
+    @property
+    @override
+    def is_dirty(self) -> bool:
+        return self._is_dirty or any(widget.is_dirty for widget in self._widgets)
+
+    @override
+    def clear_dirty(self) -> None:
+        self._is_dirty = False
+        for widget in self._widgets:
+            widget.clear_dirty()
 
     @override
     def pre_update(self, *args, **kwargs) -> None:
-        for widget in self.widgets:
+        for widget in self._widgets:
             widget.pre_update(*args, **kwargs)
 
     @override
     def update(self, *args, **kwargs) -> None:
-        for widget in self.widgets:
+        for widget in self._widgets:
             widget.update(*args, **kwargs)
 
     @override
@@ -93,7 +112,7 @@ class Box(UIWidget):
         if event.type == MOUSEMOTION:
             event_to_process = Event(MOUSEMOTION, {"pos": self._calc_mouse_pos_with_delta(event.pos)})
 
-        for widget in self.widgets:
+        for widget in self._widgets:
             if widget.handle_event(event_to_process, *args, **kwargs):
                 return True
 
@@ -106,13 +125,20 @@ class Box(UIWidget):
 
     @override
     def draw(self, destination_surface: Surface, *args, **kwargs) -> None:
-        surface_copy = self.surface.copy()
-        for widget in self.widgets:
-            widget.draw(surface_copy, *args, **kwargs)
+        if self._composited_surface is None or any(widget.is_dirty for widget in self._widgets):
+            self._composited_surface = self._create_composited_surface(*args, **kwargs)
+        destination_surface.blit(self._composited_surface, self._rect)
+
+    def _create_composited_surface(self, *args, **kwargs) -> Surface:
+        composited_surface = self._surface_padding.copy()
 
-        surface_padding_copy = self._surface_padding.copy()
-        surface_padding_copy.blit(surface_copy, (self.padding, self.padding))
-        destination_surface.blit(surface_padding_copy, self.rect)
+        # The widgets are drawn within the padding
+        content_surface = composited_surface.subsurface((self._padding, self._padding), self._surface.get_size())
+        content_surface.blit(self._surface, (0, 0))
+        for widget in self._widgets:
+            widget.draw(content_surface, *args, **kwargs)
+
+        return composited_surface
 
     def add_widget(self, widget) -> None:
         """
@@ -127,12 +153,18 @@ class Box(UIWidget):
 class Label(UIWidget):
     """
     Simple label.
+
+    The text of the label can be bound to a value in an ObservableDict, the label then follows the value and renders
+    its text again only when the value changes.
     """
 
     def __init__(self) -> None:
         super().__init__()
 
         self._text = "Label text"
+        # Source of the bound value and its key, None when the label is not bound
+        self._binding_source: ObservableDict or None = None
+        self._binding_key: str = ""
 
         self._surface = self._create_surface()
         self._rect = self._surface.get_rect()
@@ -146,8 +178,36 @@ class Label(UIWidget):
 
     @text.setter
     def text(self, value: str) -> None:
-        self._text = value
-        self._update_surface()
+        if value != self._text:
+            self._text = value
+            self._update_surface()
+
+    def bind(self, source: ObservableDict, key: str) -> None:
+        """
+        Show the value under the key of the source as the text of the label and follow its changes.
+
+        Any previous binding is removed. The label must be unbound when it is no longer shown, otherwise the source
+        keeps it alive.
+
+        :param source: observable dictionary with the value
+        :param key: key of the value
+        """
+        self.unbind()
+        self._binding_source = source
+        self._binding_key = key
+        source.observe(key, self._on_bound_value_changed)
+        self._on_bound_value_changed(source[key])
+
+    def unbind(self) -> None:
+        """
+        Stop following the bound value, the text of the label is kept.
+        """
+        if self._binding_source is not None:
+            self._binding_source.unobserve(self._binding_key, self._on_bound_value_changed)
+            self._binding_source = None
+
+    def _on_bound_value_changed(self, value: object) -> None:
+        self.text = str(value)
 
     @override
     def _create_surface(self) -> Surface:
@@ -191,7 +251,10 @@ class Button(Label):
     @override
     def handle_event(self, event: Event, *args, **kwargs) -> bool:
         if event.type == MOUSEMOTION:
-            self._is_focused = self.rect.collidepoint(event.pos)
+            is_focused = self.rect.collidepoint(event.pos)
+            if is_focused != self._is_focused:
+                self._is_focused = is_focused
+                self._is_dirty = True
             if self._is_focused:
                 return True
 
@@ -221,3 +284,125 @@ class Button(Label):
         self._on_click = action
         self._on_click_args = args
         self._on_click_kwargs = kwargs
+
+
+class ProgressBar(UIWidget):
+    """
+    Progress bar.
+    """
+
+    def __init__(self, size: VectorInt2D = (300, 20)) -> None:
+        """
+        Initialize ProgressBar.
+
+        :param size: size of the bar
+        """
+        super().__init__()
+
+        self._size: VectorInt2D = size
+        self._value: float = 0.0
+
+        self._update_surface()
+
+    @property
+    def value(self) -> float:
+        """
+        Value of the progress bar (0.0 - 1.0).
+        """
+        return self._value
+
+    @value.setter
+    def value(self, value: float) -> None:
+        value = min(max(value, 0.0), 1.0)
+        if value != self._value:
+            self._value = value
+            self._update_surface()
+
+    @override
+    def _create_surface(self) -> Surface:
+        surface = Surface(self._size)
+        surface.fill(COLOR_BACKGROUND)
+
+        width, height = self._size
+        pygame.draw.rect(surface, COLOR_PROGRESS, (0, 0, round(width * self._value), height))
+        pygame.draw.rect(surface, COLOR_BORDER, surface.get_rect(), width=1)
+
+        return surface
+
+    @override
+    def draw(self, destination_surface: Surface, *args, **kwargs) -> None:
+        destination_surface.blit(self.surface, self.rect)
+
+
+class Image(UIWidget):
+    """
+    Image showing a surface, it reports the position of the clicks within the image.
+    """
+
+    def __init__(self, size: VectorInt2D = (100, 100)) -> None:
+        """
+        Initialize Image.
+
+        :param size: size of the image shown until a surface is set
+        """
+        super().__init__()
+
+        self._image: Surface = Surface(size)
+        self._image.fill(COLOR_BACKGROUND)
+        self._mouse_pos: VectorInt2D or None = None
+
+        self._on_click = None
+        self._on_click_args = list()
+        self._on_click_kwargs = dict()
+
+        self._update_surface()
+
+    @property
+    def image(self) -> Surface:
+        """
+        Surface shown by the image, the size of the image follows its size.
+
+        The surface must not be modified after it is set, unless it is set again right after the modification.
+        """
+        return self._image
+
+    @image.setter
+    def image(self, value: Surface) -> None:
+        self._image = value
+        self._update_surface()
+
+    @override
+    def _create_surface(self) -> Surface:
+        return self._image
+
+    @override
+    def handle_event(self, event: Event, *args, **kwargs) -> bool:
+        if event.type == MOUSEMOTION:
+            if self.rect.collidepoint(event.pos):
+                self._mouse_pos = (event.pos[0] - self._rect.x, event.pos[1] - self._rect.y)
+                return True
+            self._mouse_pos = None
+
+        elif event.type == MOUSEBUTTONUP and event.button == 1:
+            if self._mouse_pos is not None:
+                if self._on_click is not None:
+                    self._on_click(self._mouse_pos, *self._on_click_args, **self._on_click_kwargs)
+                return True
+
+        return False
+
+    @override
+    def draw(self, destination_surface: Surface, *args, **kwargs) -> None:
+        destination_surface.blit(self.surface, self.rect)
+
+    def register_on_click(self, action: object, *args, **kwargs) -> None:
+        """
+        Register an action that should be executed when the image is clicked.
+
+        :param action: function to call on click, the position of the click within the image is passed first
+        :param args: arguments that will be passed to the method on click
+        :param kwargs: keyword arguments that will be passed to the method on click
+        """
+        self._on_click = action
+        self._on_click_args = args
+        self._on_click_kwargs = kwargs
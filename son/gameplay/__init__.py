@@ -1,5 +1,6 @@
-from son.gameplay._scene import SceneGameplay
+from son.gameplay._scene import SceneGameplay, DEFAULT_MAP_NAME
 
 __all__ = [
+    "DEFAULT_MAP_NAME",
     "SceneGameplay"
 ]
@@ -3,9 +3,11 @@ from pygame.event import Event
 from pygame.locals import *
 
 from son.core.base import Lifecycle
-from son.core.events import EDGE_SCROLL
+from son.core.event_bus import EventBus
+from son.core.events import EDGE_SCROLL, ZOOM, CENTER_VIEW
 from son.core.utils.decorators import override
 from son.core.vectors import VectorInt2D
+from son.gameplay.map import ZOOM_LEVELS, DEFAULT_ZOOM_LEVEL, get_cell_size
 
 SCROLL_SPEED = 500
 SCROLL_BORDER_SIZE = 10
@@ -15,23 +17,49 @@ MAX_SCROLL_OUT_OF_MAP = 50
 class EdgeScrollingController(Lifecycle):
     """
     Controller for edge scrolling.
+
+    It also zooms the map with the mouse wheel, keeping the point under the mouse in place, and centers the view on
+    a cell on request, e.g. when the minimap is clicked. The limits of scrolling follow the size of the map
+    at the current zoom level.
     """
 
-    def __init__(self, map_pixel_size: VectorInt2D) -> None:
+    def __init__(self, map_size: VectorInt2D) -> None:
+        """
+        Initialize EdgeScrollingController.
+
+        :param map_size: size of the map in cells
+        """
         resolution = pygame.display.get_window_size()
 
+        self._map_size: VectorInt2D = map_size
+        self._resolution: VectorInt2D = resolution
+        self._zoom_level: int = DEFAULT_ZOOM_LEVEL
+
         self._delta: VectorInt2D = (0, 0)
         self._delta_change: VectorInt2D = (0, 0)
+        self._is_scrolling: bool = False
 
         self._right_edge = resolution[0] - SCROLL_BORDER_SIZE
         self._bottom_edge = resolution[1] - SCROLL_BORDER_SIZE
 
-        self._max_scroll_right = map_pixel_size[0] - resolution[0] + MAX_SCROLL_OUT_OF_MAP
-        self._max_scroll_bottom = map_pixel_size[1] - resolution[1] + MAX_SCROLL_OUT_OF_MAP
+        self._max_scroll_right = 0
+        self._max_scroll_bottom = 0
+        self._update_scroll_limits()
+
+    @property
+    def is_scrolling(self) -> bool:
+        """
+        Has the map been scrolled by the last update?
+
+        The map is not scrolled when the mouse is not at any edge of the window or the limit of scrolling towards
+        that edge has been reached.
+        """
+        return self._is_scrolling
 
     @override
     def update(self, *args, **kwargs) -> None:
         time_delta: float = kwargs["time_delta"]
+        self._is_scrolling = False
         if self._delta_change[0] != 0 or self._delta_change[1] != 0:
             delta_x, delta_y = self._delta
             delta_change_x, delta_change_y = self._delta_change
@@ -46,30 +74,96 @@ class EdgeScrollingController(Lifecycle):
             elif delta_change_y == 1:
                 delta_y = min((delta_y + (SCROLL_SPEED * time_delta)), self._max_scroll_bottom)
 
-            self._delta = delta_x, delta_y
-            mouse_pos = pygame.mouse.get_pos()
+            if (delta_x, delta_y) != self._delta:
+                self._delta = delta_x, delta_y
+                self._is_scrolling = True
+                mouse_pos = pygame.mouse.get_pos()
 
-            pygame.event.post(Event(EDGE_SCROLL, {"delta": self._delta, "pos": mouse_pos}))
+                pygame.event.post(Event(EDGE_SCROLL, {"delta": self._delta, "pos": mouse_pos}))
 
-    @override
-    def handle_event(self, event: Event, *args, **kwargs) -> bool:
-        if event.type == MOUSEMOTION:
-            mouse_pos_x, mouse_pos_y = event.pos
-            delta_change_x = 0
-            delta_change_y = 0
+    def subscribe(self, event_bus: EventBus, priority: int = 0) -> None:
+        """
+        Subscribe the handlers of the controller to the events it handles.
 
-            if mouse_pos_x <= SCROLL_BORDER_SIZE:
-                delta_change_x = -1
+        :param event_bus: event bus of the scene
+        :param priority: priority of the handlers
+        """
+        event_bus.subscribe(MOUSEMOTION, self._on_mouse_motion, priority)
+        event_bus.subscribe(MOUSEWHEEL, self._on_mouse_wheel, priority)
+        event_bus.subscribe(CENTER_VIEW, self._on_center_view, priority)
 
-            elif mouse_pos_x >= self._right_edge:
-                delta_change_x = 1
+    def _on_mouse_motion(self, event: Event) -> bool:
+        mouse_pos_x, mouse_pos_y = event.pos
+        delta_change_x = 0
+        delta_change_y = 0
 
-            if mouse_pos_y <= SCROLL_BORDER_SIZE:
-                delta_change_y = -1
+        if mouse_pos_x <= SCROLL_BORDER_SIZE:
+            delta_change_x = -1
 
-            elif mouse_pos_y >= self._bottom_edge:
-                delta_change_y = 1
+        elif mouse_pos_x >= self._right_edge:
+            delta_change_x = 1
 
-            self._delta_change = delta_change_x, delta_change_y
+        if mouse_pos_y <= SCROLL_BORDER_SIZE:
+            delta_change_y = -1
 
+        elif mouse_pos_y >= self._bottom_edge:
+            delta_change_y = 1
+
+        self._delta_change = delta_change_x, delta_change_y
         return False
+
+    def _on_mouse_wheel(self, event: Event) -> bool:
+        # Scrolling the wheel up zooms in, i.e. moves to a lower index in ZOOM_LEVELS
+        zoom_level = min(max(self._zoom_level - event.y, 0), len(ZOOM_LEVELS) - 1)
+        if zoom_level != self._zoom_level:
+            self._zoom(zoom_level, pygame.mouse.get_pos())
+        return True
+
+    def _on_center_view(self, event: Event) -> bool:
+        self._center_view(event.grid_pos)
+        return True
+
+    def _center_view(self, grid_pos: VectorInt2D) -> None:
+        """
+        Scroll the map, so that the cell under the given position is in the center of the window.
+
+        :param grid_pos: cell position
+        """
+        cell_size = get_cell_size(self._zoom_level)
+        delta_x = (grid_pos[0] + 0.5) * cell_size - self._resolution[0] / 2
+        delta_y = (grid_pos[1] + 0.5) * cell_size - self._resolution[1] / 2
+        self._delta = (min(max(delta_x, -MAX_SCROLL_OUT_OF_MAP), self._max_scroll_right),
+                       min(max(delta_y, -MAX_SCROLL_OUT_OF_MAP), self._max_scroll_bottom))
+
+        pygame.event.post(Event(EDGE_SCROLL, {"delta": self._delta, "pos": pygame.mouse.get_pos()}))
+
+    def _zoom(self, zoom_level: int, mouse_pos: VectorInt2D) -> None:
+        """
+        Change the zoom level, so that the point of the map under the mouse stays in place.
+
+        :param zoom_level: new zoom level, an index in ZOOM_LEVELS
+        :param mouse_pos: position of the mouse
+        """
+        scale = get_cell_size(zoom_level) / get_cell_size(self._zoom_level)
+        self._zoom_level = zoom_level
+        self._update_scroll_limits()
+
+        mouse_pos_x, mouse_pos_y = mouse_pos
+        delta_x, delta_y = self._delta
+        delta_x = (delta_x + mouse_pos_x) * scale - mouse_pos_x
+        delta_y = (delta_y + mouse_pos_y) * scale - mouse_pos_y
+        self._delta = (min(max(delta_x, -MAX_SCROLL_OUT_OF_MAP), self._max_scroll_right),
+                       min(max(delta_y, -MAX_SCROLL_OUT_OF_MAP), self._max_scroll_bottom))
+
+        pygame.event.post(Event(ZOOM, {"zoom_level": zoom_level, "delta": self._delta, "pos": mouse_pos}))
+
+    def _update_scroll_limits(self) -> None:
+        """
+        Update the limits of scrolling for the size of the map at the current zoom level.
+        """
+        cell_size = get_cell_size(self._zoom_level)
+        # When the map is smaller than the window, it is kept at the top left corner
+        self._max_scroll_right = max(self._map_size[0] * cell_size - self._resolution[0] + MAX_SCROLL_OUT_OF_MAP,
+                                     -MAX_SCROLL_OUT_OF_MAP)
+        self._max_scroll_bottom = max(self._map_size[1] * cell_size - self._resolution[1] + MAX_SCROLL_OUT_OF_MAP,
+                                      -MAX_SCROLL_OUT_OF_MAP)
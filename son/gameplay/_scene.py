@@ -1,11 +1,17 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
 import pygame.event
-from pygame import Surface
+from pygame import Surface, Rect
 from pygame.event import Event
 
+from son.core.event_bus import EventBus
 from son.core.events import END_TURN, START_TURN
+from son.core.loading import LoadingTask
 from son.core.resources import ResourceManager, DataPath
 from son.core.scenes import SceneBase
 from son.core.utils.decorators import override
+from son.core.vectors import VectorInt2D
 from son.gameplay._edge_scrolling import EdgeScrollingController
 from son.gameplay._turn_tracking import TurnTracker
 from son.gameplay.map import Map
@@ -18,23 +24,65 @@ _DATA_PATHS = [
     DataPath(path="units", prefix="unit")
 ]
 
+DEFAULT_MAP_NAME = "test_map_1"
+
+# Priorities of the event handlers, the UI over the map gets the events before the map
+_PRIORITY_SCENE = 3
+_PRIORITY_UI = 2
+_PRIORITY_EDGE_SCROLLING = 1
+_PRIORITY_MAP = 0
+
+
+@dataclass
+class _GameplayData:
+    """
+    Data loaded before the gameplay scene is created.
+    """
+    resource_manager: ResourceManager
+    map: Map
+
 
 class SceneGameplay(SceneBase):
-    def __init__(self) -> None:
+    requires_loading = True
+
+    def __init__(self, data: _GameplayData) -> None:
         super().__init__()
 
-        self._resource_manager = ResourceManager(_DATA_PATHS)
-        self._resource_manager.load_resources()
+        self._resource_manager = data.resource_manager
 
         self._turn_tracker = TurnTracker()
 
-        self._ui_controller = UIGameplayController()
-        self._map = Map(self._resource_manager, (100, 100))
-        self._edge_scrolling_controller = EdgeScrollingController(self._map.pixel_size)
+        self._map = data.map
+        self._ui_controller = UIGameplayController(self._map.minimap)
+        self._edge_scrolling_controller = EdgeScrollingController(self._map.size)
+
+        # The components subscribe to the types of the events they handle, so the events are not broadcast to all
+        self._event_bus = EventBus()
+        self._event_bus.subscribe(END_TURN, self._on_end_turn, _PRIORITY_SCENE)
+        self._ui_controller.subscribe(self._event_bus, _PRIORITY_UI)
+        self._edge_scrolling_controller.subscribe(self._event_bus, _PRIORITY_EDGE_SCROLLING)
+        self._map.subscribe(self._event_bus, _PRIORITY_MAP)
 
         info = self._turn_tracker.turn_info
         pygame.event.post(Event(START_TURN, {"info": info}))
 
+    @staticmethod
+    @override
+    def load(task: LoadingTask, map_name: str = DEFAULT_MAP_NAME) -> _GameplayData:
+        task.report(0.0, "resources")
+        resource_manager = ResourceManager(_DATA_PATHS)
+        resource_manager.load_resources()
+
+        task.report(0.1, "map")
+        game_map = Map(resource_manager, map_name, progress=task.get_progress_callback(0.1, 1.0))
+
+        return _GameplayData(resource_manager=resource_manager, map=game_map)
+
+    @staticmethod
+    @override
+    def unload(data: _GameplayData) -> None:
+        data.map.close()
+
     @override
     def pre_update(self, *args, **kwargs) -> None:
         self._ui_controller.pre_update(*args, **kwargs)
@@ -43,28 +91,42 @@ class SceneGameplay(SceneBase):
 
     @override
     def update(self, *args, **kwargs) -> None:
-        self._ui_controller.update(focused_cell_info=self._map.info.focused_cell_info)
+        self._ui_controller.update(*args, **kwargs)
         self._edge_scrolling_controller.update(*args, **kwargs)
         self._map.update(*args, **kwargs)
 
     @override
     def handle_event(self, event: Event, *args, **kwargs) -> bool:
-        if event.type == END_TURN:
-            self._turn_tracker.skip_turn()
-            info = self._turn_tracker.turn_info
-            pygame.event.post(Event(START_TURN, {"info": info}))
-            return True
+        return self._event_bus.dispatch(event)
 
-        if self._ui_controller.handle_event(event):
-            return True
-
-        if self._edge_scrolling_controller.handle_event(event, *args, **kwargs):
-            return True
+    def _on_end_turn(self, event: Event) -> bool:
+        self._turn_tracker.skip_turn()
+        info = self._turn_tracker.turn_info
+        pygame.event.post(Event(START_TURN, {"info": info}))
+        return True
 
-        if self._map.handle_event(event, *args, **kwargs):
-            return True
+    @override
+    def close(self) -> None:
+        self._map.close()
 
-        return False
+    @override
+    def get_dirty_rects(self) -> Optional[List[Rect]]:
+        map_dirty_rects = self._map.get_dirty_rects()
+        if map_dirty_rects is None:
+            return None
+        return map_dirty_rects + self._ui_controller.get_dirty_rects()
+
+    @property
+    def map_size(self) -> VectorInt2D:
+        """
+        Size of the played map in cells.
+        """
+        return self._map.size
+
+    @property
+    @override
+    def is_idle(self) -> bool:
+        return not self._edge_scrolling_controller.is_scrolling and not self._map.is_animated
 
     def draw(self, destination_surface: Surface, *args, **kwargs) -> None:
         destination_surface.fill((0, 0, 0))
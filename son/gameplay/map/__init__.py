@@ -1,5 +1,20 @@
+from son.gameplay.map._constants import ZOOM_LEVELS, DEFAULT_ZOOM_LEVEL
 from son.gameplay.map._map import Map
+from son.gameplay.map._map_data import MapData, MapParseException
+from son.gameplay.map._map_generator import generate_map
+from son.gameplay.map._map_parser import convert_map, save_map
+from son.gameplay.map._minimap import MinimapImage
+from son.gameplay.map._zoom import get_cell_size
 
 __all__ = [
-    "Map"
+    "DEFAULT_ZOOM_LEVEL",
+    "Map",
+    "MapData",
+    "MapParseException",
+    "MinimapImage",
+    "ZOOM_LEVELS",
+    "convert_map",
+    "generate_map",
+    "get_cell_size",
+    "save_map"
 ]
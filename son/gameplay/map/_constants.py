@@ -1,3 +1,10 @@
 GRID_CELL_SIZE = 50
 GRID_CELL_SIZE_XY = (GRID_CELL_SIZE, GRID_CELL_SIZE)
+CHUNK_SIZE = 32
+DEFAULT_MAX_CELL_CHUNKS = 64
+TERRAIN_CHUNK_SIZE = 16
+DEFAULT_MAX_TERRAIN_CHUNKS = 24
+TERRAIN_BAKE_BATCH = 2048
 COLOR_FOCUS = (100, 100, 0)
+ZOOM_LEVELS = (1.0, 0.5, 0.25, 0.125)
+DEFAULT_ZOOM_LEVEL = 0
@@ -1,16 +1,33 @@
-from pygame import Surface
+from collections import OrderedDict
+from math import ceil
+from typing import List, Set, Tuple, Type, Optional, Sequence, Dict
+
+from pygame import Surface, Rect, MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP
 from pygame.event import Event
 
 from son.core.base import Lifecycle
-from son.core.events import EDGE_SCROLL, SELECT_MAP_OBJECT, MOVE_MAP_OBJECT
+from son.core.event_bus import EventBus
+from son.core.events import EDGE_SCROLL, SELECT_MAP_OBJECT, MOVE_MAP_OBJECT, START_TURN, ZOOM
+from son.core.loading import ProgressCallback, scale_progress
 from son.core.resources import ResourceManager
 from son.core.utils.decorators import override
 from son.core.vectors import VectorInt2D
+from son.gameplay.map._constants import CHUNK_SIZE, DEFAULT_MAX_CELL_CHUNKS
 from son.gameplay.map._map_cell import MapCell
-from son.gameplay.map._map_parser import parse_map
+from son.gameplay.map._map_chunk import MapChunk, load_chunk
+from son.gameplay.map._map_data import MapData
+from son.gameplay.map._map_grid import MapGrid, create_map_grid
+from son.gameplay.map._map_parser import parse_map, create_objects
+from son.gameplay.map._map_view import MapView
+from son.gameplay.map._minimap import MinimapImage
+from son.gameplay.map._terrain_cache import TerrainCache
+from son.gameplay.map._zoom import SpriteCache
 from son.gameplay.map.objects import MapObject, Movable
 from son.gameplay.types import MapInfo
 
+# Number of the cells around the view that are drawn too
+_VISIBLE_MARGIN = 1
+
 
 class MapError(Exception):
     """
@@ -19,23 +36,124 @@ class MapError(Exception):
 
 
 class Map(Lifecycle):
+    """
+    Grid-based map.
+
+    The map is split into square chunks of cells. A chunk is loaded when any of its cells is accessed for the first
+    time, either by the mouse, by the updates or by the game logic, and the least recently used chunks that are not
+    visible are unloaded when the number of the loaded chunks exceeds the limit. The chunks are unloaded only while
+    drawing, so the cells obtained from the map stay valid until the next frame is drawn.
+
+    The state of all cells, including their map objects, is stored in the map grid, which is dense and always kept
+    in memory whole - a few bytes per cell besides the map objects. The cells of the loaded chunks are only views
+    of the grid, so unloading a chunk loses nothing and the turns are processed for the whole grid at once. The limit
+    of the loaded chunks therefore bounds only the number of the cell objects, not the memory used by the map.
+
+    Only the cells visible through the view are drawn and updated in each frame, so the frame time depends on the size
+    of the view, not on the size of the map.
+
+    The terrain and the map objects of the view are kept in a cached surface, which is drawn again fully only after
+    zooming and otherwise only where the map objects or the terrain have changed. Scrolling shifts the cached surface
+    and draws only the strips of the view that have scrolled into it. The focus markers are drawn over it
+    in a separate overlay pass, so moving the mouse over the map costs only a few small blits.
+
+    The map can be zoomed out to any of ZOOM_LEVELS. The terrain and the map objects are scaled once per zoom level
+    and cached, the terrain chunks of the view are baked in small batches in the updates. Only the occupied cells
+    are visited while drawing, only the cells with map objects that implement the updates are updated and the focus
+    is found for the cell under the mouse directly, so the zoomed out views keep the frame rate even though many more
+    cells are visible.
+    """
 
-    def __init__(self, resource_manager: ResourceManager, size: VectorInt2D) -> None:
+    def __init__(self, resource_manager: ResourceManager, name: str, max_cell_chunks: int = DEFAULT_MAX_CELL_CHUNKS,
+                 grid_backend: Optional[str] = None, progress: Optional[ProgressCallback] = None) -> None:
+        """
+        Initialize Map.
+
+        :param resource_manager: the resource manager
+        :param name: name of the map file
+        :param max_cell_chunks: max number of the chunks whose cells are loaded at once (the visible chunks are never
+                                unloaded), it does not limit the memory used by the map grid
+        :param grid_backend: backend storing the map grid, "numpy" or "array" (optional, NumPy is used when it is
+                             available)
+        :param progress: function receiving the progress of loading the map (optional)
+        """
         # Dependencies
         self._resource_manager: ResourceManager = resource_manager
 
-        self._size = size
-        self._array = parse_map("test_map_1", self._resource_manager)
-        self._focused_cell: MapCell or None = None
+        self._map_data: MapData = parse_map(name, scale_progress(progress, 0.0, 0.9))
+        self._size: VectorInt2D = self._map_data.size
+        self._size_in_chunks: VectorInt2D = (ceil(self._size[0] / CHUNK_SIZE), ceil(self._size[1] / CHUNK_SIZE))
+
+        self._max_cell_chunks: int = max(1, max_cell_chunks)
+        self._chunks: OrderedDict[VectorInt2D, MapChunk] = OrderedDict()
+        self._visible_chunks: Set[VectorInt2D] = set()
+        # Visible cells with any map objects that are updated, row by row, and the positions of the first and the last
+        # visible cell
+        self._visible_cells: List[MapCell] = list()
+        self._visible_range: Tuple[VectorInt2D, VectorInt2D] or None = None
+        # Visible range and version of the map object index the visible cells were found for
+        self._visible_cells_key: Tuple[Tuple[VectorInt2D, VectorInt2D], int] or None = None
+        # Do the types of the map objects implement pre_update() or update()?
+        self._updated_types: Dict[Type[MapObject], bool] = dict()
+
+        self._grid: MapGrid = create_map_grid(self._map_data, grid_backend)
+        self._terrain_surfaces: List[Surface] = [
+            resource_manager.get_resource("terrain." + terrain) for terrain in self._map_data.terrain_types
+        ]
+        self._terrain_cache: TerrainCache = TerrainCache(self._grid, self._terrain_surfaces)
+        map_objects = create_objects(self._map_data, resource_manager, scale_progress(progress, 0.9, 1.0))
+        for pos, cell_map_objects in map_objects.items():
+            for map_object in cell_map_objects:
+                self._grid.add_object(pos, map_object)
+        self._grid.update_stats()
+        self._grid.clear_changed_cells()
+
+        self._view: MapView = MapView()
+        # Position of the cell under the mouse, only this cell handles the mouse clicks
+        self._focused_pos: VectorInt2D or None = None
+        # Must the whole map be drawn again, e.g. after scrolling?
+        self._is_fully_dirty: bool = True
         self._selected_object: MapObject or None = None
-        self._selected_object_pos: VectorInt2D or None = None
+
+        self._sprite_cache: SpriteCache = SpriteCache()
+        # Terrain and map objects of the view, without the focus markers, and the scroll delta they were drawn for
+        self._layers_surface: Surface or None = None
+        self._layers_delta: VectorInt2D or None = None
+        # Positions of the focused cells when the map was drawn the last time
+        self._drawn_focused_cells: Set[VectorInt2D] = set()
+        # Created on the first access, only the UI needs it
+        self._minimap: MinimapImage or None = None
+
+    @property
+    def size(self) -> VectorInt2D:
+        """
+        Size of the map in cells.
+        """
+        return self._size
+
+    def close(self) -> None:
+        """
+        Release the map data, e.g. the memory-mapped binary map file the terrain is read from.
+
+        The map must not be used afterwards.
+        """
+        self._grid.close()
+        self._map_data.close()
 
     @property
     def pixel_size(self) -> VectorInt2D:
         """
-        Size of the map in pixels.
+        Size of the map in pixels at the current zoom level.
         """
-        return self.get_cell((self._size[0] - 1, self._size[1] - 1)).rect.bottomright
+        cell_size = self._view.cell_size
+        return self._size[0] * cell_size, self._size[1] * cell_size
+
+    @property
+    def zoom_level(self) -> int:
+        """
+        Current zoom level, an index in ZOOM_LEVELS.
+        """
+        return self._view.zoom_level
 
     @property
     def info(self) -> MapInfo:
@@ -43,91 +161,189 @@ class Map(Lifecycle):
         Info about the current state of the map.
         """
         return MapInfo(
-            focused_cell_info=self._focused_cell.info if self._focused_cell is not None else None
+            focused_cell_info=self.get_cell(self._focused_pos).info if self._focused_pos is not None else None
         )
 
+    @property
+    def minimap(self) -> MinimapImage:
+        """
+        Image of the whole map with one pixel per cell.
+
+        The image is rendered on the first access and from then on its changed pixels are updated whenever the map
+        is drawn.
+        """
+        if self._minimap is None:
+            self._minimap = MinimapImage(self._grid, self._terrain_surfaces)
+        return self._minimap
+
+    @property
+    def is_animated(self) -> bool:
+        """
+        Are there any visible map objects that are updated in each frame or any terrain chunks left to bake?
+
+        Without them the map changes only on events, so it does not need to be updated while there are none.
+        """
+        return len(self._visible_cells) > 0 or self._terrain_cache.is_baking
+
+    @property
+    def loaded_chunks_count(self) -> int:
+        """
+        Number of the currently loaded chunks.
+        """
+        return len(self._chunks)
+
     @override
     def pre_update(self, *args, **kwargs) -> None:
-        self._focused_cell = None
-
-        for row in self._array:
-            for cell in row:
-                cell.pre_update(*args, **kwargs)
+        for cell in self._visible_cells:
+            cell.pre_update(*args, **kwargs)
 
     @override
     def update(self, *args, **kwargs) -> None:
-        for row in self._array:
-            for cell in row:
-                cell.update(*args, *kwargs)
+        for cell in self._visible_cells:
+            cell.update(*args, **kwargs)
+        self._terrain_cache.bake()
 
-    @override
-    def handle_event(self, event: Event, *args, **kwargs) -> bool:
-        for row in self._array:
-            for cell in row:
-                if cell.handle_event(event, *args, **kwargs):
-                    return True
+    def subscribe(self, event_bus: EventBus, priority: int = 0) -> None:
+        """
+        Subscribe the handlers of the map to the events it handles.
+
+        :param event_bus: event bus of the scene
+        :param priority: priority of the handlers
+        """
+        event_bus.subscribe(START_TURN, self._on_start_turn, priority)
+        event_bus.subscribe(EDGE_SCROLL, self._on_edge_scroll, priority)
+        event_bus.subscribe(ZOOM, self._on_zoom, priority)
+        event_bus.subscribe(MOUSEMOTION, self._on_mouse_motion, priority)
+        event_bus.subscribe((MOUSEBUTTONDOWN, MOUSEBUTTONUP), self._on_mouse_button, priority)
+        event_bus.subscribe(SELECT_MAP_OBJECT, self._on_select_map_object, priority)
+        event_bus.subscribe(MOVE_MAP_OBJECT, self._on_move_map_object, priority)
+
+    def _on_start_turn(self, event: Event) -> bool:
+        # The new turn is processed for the whole map at once, also for the chunks that are not loaded
+        index = self._grid.index
+        for map_object in self._grid.map_objects:
+            surface = map_object.surface
+            map_object.handle_event(event)
+            # Only the cells whose map objects have changed their look are drawn again
+            if map_object.surface is not surface:
+                self._grid.mark_changed(index.get_pos(map_object))
+        self._grid.update_stats()
+        return False
+
+    def _on_edge_scroll(self, event: Event) -> bool:
+        # Scrolling, zooming and moving the mouse only move the focus to the cell under the mouse
+        self._view.delta = event.delta
+        self._update_focus(event.pos)
+        return True
+
+    def _on_zoom(self, event: Event) -> bool:
+        self._view.zoom_level = event.zoom_level
+        self._view.delta = event.delta
+        self._terrain_cache.zoom_level = event.zoom_level
+        self._is_fully_dirty = True
+        self._update_focus(event.pos)
+        return True
+
+    def _on_mouse_motion(self, event: Event) -> bool:
+        self._update_focus(event.pos)
+        return False
+
+    def _on_mouse_button(self, event: Event) -> bool:
+        # The clicks are handled only by the cell under the mouse, found by the position instead of testing all cells
+        self._update_focus(event.pos)
+        if self._focused_pos is not None:
+            return self.get_cell(self._focused_pos).handle_event(event)
+        return False
 
-        if event.type == SELECT_MAP_OBJECT:
-            self._selected_object = event.map_object
-            self._selected_object_pos = event.pos
-            return True
+    def _on_select_map_object(self, event: Event) -> bool:
+        self._selected_object = event.map_object
+        return True
 
+    def _on_move_map_object(self, event: Event) -> bool:
         # Attempt of moving the selected map object (if not none) to a different cell
-        if event.type == MOVE_MAP_OBJECT:
-            if self._selected_object is not None and isinstance(self._selected_object, Movable):
-                if self._selected_object.movement_points == 0:
+        selected_object_pos = self.get_object_pos(self._selected_object)
+        if selected_object_pos is not None and isinstance(self._selected_object, Movable):
+            if self._selected_object.movement_points == 0:
+                # TODO Warning should be shown to the player
+                return True
+            else:
+                # Calculate the new position and get the new cell object
+                new_pos = self._calc_new_position_for_movement(selected_object_pos, event.target)
+                new_cell = self.get_cell(new_pos)
+
+                # Check if the selected object has enough movement points
+                if self._selected_object.movement_points < new_cell.stats.movement_cost:
                     # TODO Warning should be shown to the player
                     return True
-                else:
-                    # Calculate the new position and get the new cell object
-                    new_pos = self._calc_new_position_for_movement(self._selected_object_pos, event.target)
-                    new_cell = self.get_cell(new_pos)
 
-                    # Check if the selected object has enough movement points
-                    if self._selected_object.movement_points < new_cell.stats.movement_cost:
-                        # TODO Warning should be shown to the player
-                        return True
+                # Update the movement points of the selected object
+                self._selected_object.movement_points -= new_cell.stats.movement_cost
 
-                    # Remove the object from the old cell
-                    old_cell = self.get_cell(self._selected_object_pos)
-                    old_cell.remove_object(self._selected_object)
+                # Move the object to the new cell
+                self.move_object(self._selected_object, new_pos)
+        return True
 
-                    # Update the movement points of the selected object
-                    self._selected_object.movement_points -= new_cell.stats.movement_cost
+    @override
+    def draw(self, destination_surface: Surface, *args, **kwargs) -> None:
+        view_size = destination_surface.get_size()
+        self._update_visible_cells(view_size)
+        self._unload_chunks()
 
-                    # Add the object to the new cell
-                    new_cell.add_object(self._selected_object)
-                    # Update the position of the selected map object
-                    self._selected_object_pos = new_pos
-            return True
+        changed_cells = self._grid.changed_cells
+        if self._minimap is not None:
+            self._minimap.update(changed_cells)
+        self._grid.clear_changed_cells()
 
-        if event.type == EDGE_SCROLL:
-            return True
+        # There are 3 map layers to render:
+        #  0: base surface, baked into chunks of the terrain cache
+        #  1: game objects, submitted in a single batch
+        #  2: focus marker, drawn over the cached surface of the layers 0 and 1
+        if self._layers_surface is None or self._layers_surface.get_size() != view_size:
+            self._layers_surface = Surface(view_size, 0, destination_surface)
+            self._is_fully_dirty = True
+
+        if self._is_fully_dirty:
+            self._draw_layers(None)
+        else:
+            self._scroll_layers()
+            for rect in self._get_changed_cells_rects(changed_cells):
+                self._draw_layers(rect)
+        self._is_fully_dirty = False
+        self._layers_delta = self._view.delta
+
+        destination_surface.blit(self._layers_surface, (0, 0))
+
+        # layer numer is passed down as a kwarg
+        kwargs["layer"] = 2
+        self._drawn_focused_cells = self._grid.focused_cells
+        if self._visible_range is None:
+            return
+        (first_x, first_y), (last_x, last_y) = self._visible_range
+        for x, y in self._drawn_focused_cells:
+            if first_x <= x <= last_x and first_y <= y <= last_y:
+                self.get_cell((x, y)).draw(destination_surface, *args, **kwargs)
+
+    def get_dirty_rects(self) -> Optional[List[Rect]]:
+        """
+        Get the regions of the view that have changed since the map was drawn the last time.
 
-        return False
+        :return: list of the changed regions or None, when the whole map must be drawn again
+        """
+        if self._is_fully_dirty or self._layers_delta != self._view.delta:
+            return None
 
-    @override
-    def draw(self, destination_surface: Surface, *args, **kwargs) -> None:
-        # There are 3 map layers to render:
-        #  0: base surface
-        #  1: game objects
-        #  2: focus marker
-        for i in range(3):
-            # layer numer is passed down as a kwarg
-            kwargs["layer"] = i
-            for row in self._array:
-                for cell in row:
-                    cell.draw(destination_surface, *args, **kwargs)
+        # The focus markers are drawn within their cells
+        focus_changes = self._grid.focused_cells.symmetric_difference(self._drawn_focused_cells)
+        return (self._get_changed_cells_rects(self._grid.changed_cells)
+                + [self._view.get_cell_rect(pos) for pos in focus_changes])
 
     def get_cell(self, pos: VectorInt2D) -> MapCell:
         """
         Get the cell under the given position.
         :param pos: cell position
         """
-        try:
-            return self._array[pos[1]][pos[0]]
-        except IndexError:
-            raise MapError("Accessing a cell outside of the map: {}:{}".format(*pos))
+        self._check_pos(pos)
+        return self._get_chunk((pos[0] // CHUNK_SIZE, pos[1] // CHUNK_SIZE)).get_cell(pos)
 
     def spawn(self, pos: VectorInt2D, map_object: MapObject) -> None:
         """
@@ -138,6 +354,333 @@ class Map(Lifecycle):
         """
         self.get_cell(pos).add_object(map_object)
 
+    def set_terrain(self, pos: VectorInt2D, terrain_type: str) -> None:
+        """
+        Change the terrain type of the cell under the given position.
+
+        :param pos: cell position
+        :param terrain_type: one of the terrain types of the map
+        :raises MapError: when the position is outside of the map or the terrain type is not used by the map
+        """
+        self._check_pos(pos)
+        try:
+            terrain_id = self._grid.terrain_types.index(terrain_type)
+        except ValueError:
+            raise MapError("Terrain type not used by the map: {}".format(terrain_type))
+
+        self._grid.set_terrain_id(pos, terrain_id)
+        self._terrain_cache.invalidate(pos)
+
+    def remove_object(self, map_object: MapObject) -> None:
+        """
+        Remove a map object from the map.
+
+        :param map_object: map object to remove
+        :raises MapError: when the map object is not on the map
+        """
+        self.get_cell(self._get_object_pos_or_raise(map_object)).remove_object(map_object)
+
+    def move_object(self, map_object: MapObject, pos: VectorInt2D) -> None:
+        """
+        Move a map object into the cell under the given position.
+
+        :param map_object: map object to move
+        :param pos: cell position
+        :raises MapError: when the map object is not on the map
+        """
+        new_cell = self.get_cell(pos)
+        self.get_cell(self._get_object_pos_or_raise(map_object)).remove_object(map_object)
+        new_cell.add_object(map_object)
+
+    def invalidate_stats(self, pos: VectorInt2D) -> None:
+        """
+        Mark the stats of the cell under the given position to be updated on the start of the next turn.
+
+        Adding, moving and removing map objects invalidates the stats automatically, this must be called only when
+        the modifiers of a map object in the cell change.
+
+        :param pos: cell position
+        :raises MapError: when the position is outside of the map
+        """
+        self._check_pos(pos)
+        self._grid.invalidate_stats(pos)
+
+    def get_object_pos(self, map_object: MapObject or None) -> VectorInt2D or None:
+        """
+        Get the position of the cell with the given map object.
+
+        :param map_object: map object
+        :return: cell position or None, when the map object is not on the map
+        """
+        if map_object is None:
+            return None
+        return self._grid.index.get_pos(map_object)
+
+    def get_objects_of_type(self, object_type: Type[MapObject]) -> List[MapObject]:
+        """
+        Get all map objects of the given type, including its subclasses, in no particular order.
+
+        :param object_type: type of the map objects, e.g. Movable for all units
+        """
+        return self._grid.index.get_objects_of_type(object_type)
+
+    def find_objects_in_rect(self, rect: Rect, object_type: Optional[Type[MapObject]] = None) -> List[MapObject]:
+        """
+        Find the map objects in the cells within the given rectangle, in no particular order.
+
+        :param rect: rectangle in cells
+        :param object_type: type of the map objects to find, including its subclasses (optional)
+        """
+        return self._grid.index.find_in_rect(rect, object_type)
+
+    def find_objects_in_radius(self, center: VectorInt2D, radius: int,
+                               object_type: Optional[Type[MapObject]] = None) -> List[MapObject]:
+        """
+        Find the map objects at most the given number of cells away from the center, in no particular order.
+
+        The distance is measured in moves, i.e. diagonal steps count as one cell.
+
+        :param center: position of the center cell
+        :param radius: max distance in cells
+        :param object_type: type of the map objects to find, including its subclasses (optional)
+        """
+        return self._grid.index.find_in_radius(center, radius, object_type)
+
+    def _check_pos(self, pos: VectorInt2D) -> None:
+        """
+        Check that the given position is on the map.
+
+        :param pos: cell position
+        :raises MapError: when the position is outside of the map
+        """
+        x, y = pos
+        if not (0 <= x < self._size[0] and 0 <= y < self._size[1]):
+            raise MapError("Accessing a cell outside of the map: {}:{}".format(*pos))
+
+    def _get_object_pos_or_raise(self, map_object: MapObject) -> VectorInt2D:
+        pos = self._grid.index.get_pos(map_object)
+        if pos is None:
+            raise MapError("Map object not on the map: {}".format(map_object.info.name))
+        return pos
+
+    def _get_chunk(self, chunk_pos: VectorInt2D) -> MapChunk:
+        """
+        Get the chunk under the given position, load it if necessary and mark it as the most recently used one.
+
+        :param chunk_pos: position of the chunk in chunks
+        """
+        chunk = self._chunks.get(chunk_pos)
+        if chunk is None:
+            chunk = load_chunk(chunk_pos, self._grid, self._view)
+            self._chunks[chunk_pos] = chunk
+        else:
+            self._chunks.move_to_end(chunk_pos)
+        return chunk
+
+    def _get_changed_cells_rects(self, changed_cells: Set[VectorInt2D]) -> List[Rect]:
+        """
+        Get the regions of the view covered by the given changed cells.
+
+        :param changed_cells: positions of the cells whose terrain or map objects have changed
+        """
+        cell_size = self._view.cell_size
+        # The map objects may overflow their cells
+        return [self._view.get_cell_rect(pos).inflate(cell_size, cell_size) for pos in changed_cells]
+
+    def _draw_layers(self, rect: Optional[Rect]) -> None:
+        """
+        Draw the terrain and the map objects into the cached surface of the view.
+
+        :param rect: region of the view to draw or None, when the whole view must be drawn
+        """
+        surface = self._layers_surface
+        surface.set_clip(rect)
+        surface.fill((0, 0, 0))
+
+        cells_range = self._visible_range
+        if cells_range is not None and rect is not None:
+            cells_range = self._get_cells_range(rect)
+
+        if cells_range is not None:
+            first_pos, last_pos = cells_range
+            self._terrain_cache.draw(surface, self._view.delta, first_pos, last_pos)
+            self._draw_map_objects(surface, self._grid.index.get_occupied_cells(first_pos, last_pos))
+
+        surface.set_clip(None)
+
+    def _scroll_layers(self) -> None:
+        """
+        Shift the cached surface of the layers by the change of the scroll delta and draw the uncovered strips.
+        """
+        layers_delta_x, layers_delta_y = self._layers_delta
+        delta_x, delta_y = self._view.delta
+        shift_x = layers_delta_x - delta_x
+        shift_y = layers_delta_y - delta_y
+        if shift_x == 0 and shift_y == 0:
+            return
+
+        width, height = self._layers_surface.get_size()
+        if abs(shift_x) >= width or abs(shift_y) >= height:
+            self._draw_layers(None)
+            return
+
+        self._layers_surface.scroll(shift_x, shift_y)
+        if shift_x > 0:
+            self._draw_layers(Rect(0, 0, shift_x, height))
+        elif shift_x < 0:
+            self._draw_layers(Rect(width + shift_x, 0, -shift_x, height))
+        if shift_y > 0:
+            self._draw_layers(Rect(0, 0, width, shift_y))
+        elif shift_y < 0:
+            self._draw_layers(Rect(0, height + shift_y, width, -shift_y))
+
+    def _get_cells_range(self, rect: Rect) -> Optional[Tuple[VectorInt2D, VectorInt2D]]:
+        """
+        Get the range of the visible cells that must be drawn to draw the given region of the view.
+
+        :param rect: region of the view
+        :return: positions of the first and the last cell of the range or None, when no visible cell is in the region
+        """
+        (first_x, first_y), (last_x, last_y) = self._visible_range
+        rect_first_x, rect_first_y = self._view.get_grid_pos(rect.topleft)
+        rect_last_x, rect_last_y = self._view.get_grid_pos((rect.right - 1, rect.bottom - 1))
+
+        # The map objects may overflow their cells, so the cells right next to the region are drawn too
+        first_x = max(rect_first_x - _VISIBLE_MARGIN, first_x)
+        first_y = max(rect_first_y - _VISIBLE_MARGIN, first_y)
+        last_x = min(rect_last_x + _VISIBLE_MARGIN, last_x)
+        last_y = min(rect_last_y + _VISIBLE_MARGIN, last_y)
+        if first_x > last_x or first_y > last_y:
+            return None
+        return (first_x, first_y), (last_x, last_y)
+
+    def _draw_map_objects(self, destination_surface: Surface,
+                          occupied_cells: List[Tuple[VectorInt2D, Sequence[MapObject]]]) -> None:
+        """
+        Draw the map objects in the given cells with a single blits call.
+
+        The surfaces are scaled to the zoom level and centered in their cells, in the order of the cells and
+        of the objects in them.
+
+        :param destination_surface: surface to draw on
+        :param occupied_cells: cells with any map objects and their map objects, row by row
+        """
+        delta_x, delta_y = self._view.delta
+        zoom_level = self._view.zoom_level
+        cell_size = self._view.cell_size
+        sprites = self._sprite_cache.get_sprites(zoom_level)
+
+        blit_sequence: List[Tuple[Surface, VectorInt2D]] = list()
+        append = blit_sequence.append
+        for (x, y), map_objects in occupied_cells:
+            cell_x = x * cell_size - delta_x
+            cell_y = y * cell_size - delta_y
+            for map_object in map_objects:
+                sprite = sprites.get(map_object.surface)
+                if sprite is None:
+                    sprite = self._sprite_cache.get_sprite(map_object.surface, zoom_level)
+                scaled_surface, (offset_x, offset_y) = sprite
+                append((scaled_surface, (cell_x + offset_x, cell_y + offset_y)))
+
+        destination_surface.blits(blit_sequence, doreturn=False)
+
+    def _update_focus(self, mouse_pos: VectorInt2D) -> None:
+        """
+        Focus the cell under the mouse and unfocus the previously focused cell.
+
+        The cell is found by the position of the mouse and the view, so the cost does not depend on the size
+        of the map.
+
+        :param mouse_pos: position of the mouse
+        """
+        x, y = self._view.get_grid_pos(mouse_pos)
+        grid_pos = (x, y) if 0 <= x < self._size[0] and 0 <= y < self._size[1] else None
+        if grid_pos == self._focused_pos:
+            return
+
+        if self._focused_pos is not None:
+            self._grid.set_focused(self._focused_pos, False)
+        self._focused_pos = grid_pos
+        if grid_pos is not None:
+            self._grid.set_focused(grid_pos, True)
+            # The focused cell must be loaded to handle the mouse clicks
+            self._get_chunk((x // CHUNK_SIZE, y // CHUNK_SIZE))
+
+    def _unload_chunks(self) -> None:
+        """
+        Unload the least recently used chunks that are not visible until the limit of loaded chunks is kept.
+        """
+        if len(self._chunks) <= self._max_cell_chunks:
+            return
+
+        for chunk_pos in list(self._chunks.keys()):
+            if chunk_pos in self._visible_chunks:
+                continue
+            del self._chunks[chunk_pos]
+            if len(self._chunks) <= self._max_cell_chunks:
+                break
+
+    def _update_visible_cells(self, view_size: VectorInt2D) -> None:
+        """
+        Update the cells and the chunks visible through the view of the given size.
+
+        :param view_size: size of the view in pixels
+        """
+        delta_x, delta_y = self._view.delta
+        view_width, view_height = view_size
+        cell_size = self._view.cell_size
+
+        # The map objects may overflow their cells, so the cells right next to the view are visible too
+        first_x = max(int(delta_x // cell_size) - _VISIBLE_MARGIN, 0)
+        first_y = max(int(delta_y // cell_size) - _VISIBLE_MARGIN, 0)
+        last_x = min(int((delta_x + view_width - 1) // cell_size) + _VISIBLE_MARGIN, self._size[0] - 1)
+        last_y = min(int((delta_y + view_height - 1) // cell_size) + _VISIBLE_MARGIN, self._size[1] - 1)
+
+        if first_x > last_x or first_y > last_y:
+            self._visible_chunks = set()
+            self._visible_cells = list()
+            self._visible_range = None
+            self._visible_cells_key = None
+            return
+
+        chunks_x = range(first_x // CHUNK_SIZE, last_x // CHUNK_SIZE + 1)
+        chunks_y = range(first_y // CHUNK_SIZE, last_y // CHUNK_SIZE + 1)
+        # The visible chunks are not unloaded, but they are loaded only when any of their cells is needed - focused
+        # or updated, so that the zoomed out views do not create all their cells
+        self._visible_chunks = {(chunk_x, chunk_y) for chunk_y in chunks_y for chunk_x in chunks_x}
+
+        self._visible_range = ((first_x, first_y), (last_x, last_y))
+        self._terrain_cache.set_view(*self._visible_range)
+
+        # The map objects are looked up again only when the range or the map objects have changed
+        visible_cells_key = (self._visible_range, self._grid.index.version)
+        if visible_cells_key == self._visible_cells_key:
+            return
+        self._visible_cells_key = visible_cells_key
+
+        # Only the map objects of the updated types are looked up, the other ones are found only when they are drawn
+        index = self._grid.index
+        visible_rect = Rect(first_x, first_y, last_x - first_x + 1, last_y - first_y + 1)
+        positions = {index.get_pos(map_object) for object_type in index.types if self._is_updated(object_type)
+                     for map_object in index.find_in_rect(visible_rect, object_type)}
+        self._visible_cells = [self._get_chunk((x // CHUNK_SIZE, y // CHUNK_SIZE)).get_cell((x, y))
+                               for x, y in sorted(positions, key=lambda pos: (pos[1], pos[0]))]
+
+    def _is_updated(self, object_type: Type[MapObject]) -> bool:
+        """
+        Does the type of map objects implement pre_update() or update()?
+
+        The cells with no such map objects are not updated at all, which matters in the zoomed out views.
+
+        :param object_type: type of map objects
+        """
+        is_updated = self._updated_types.get(object_type)
+        if is_updated is None:
+            is_updated = (object_type.pre_update is not Lifecycle.pre_update
+                          or object_type.update is not Lifecycle.update)
+            self._updated_types[object_type] = is_updated
+        return is_updated
+
     @staticmethod
     def _calc_new_position_for_movement(old_pos: VectorInt2D, target: VectorInt2D) -> VectorInt2D:
         """
@@ -0,0 +1,199 @@
+"""
+Binary map format (.sonmap).
+
+All numbers are little-endian. The file consists of the following sections:
+    - header: magic bytes, format version, map size, number of terrain types, symbols and objects
+    - terrain table: names of the terrain types, the position in the table is the terrain id
+    - symbol table: names of the object types and the object parameters
+    - terrain grid: one byte with the terrain id per cell, row by row
+    - object section: one record per map object - position, symbol of the type and the parameters
+"""
+
+import mmap
+import struct
+from typing import List, Dict, Tuple, Callable
+
+from son.core.vectors import VectorInt2D
+from son.gameplay.map._map_data import MapData, MapObjectSpec, MapParseException
+
+MAGIC = b"SONMAP"
+FORMAT_VERSION = 1
+
+# magic, version, size x, size y, terrain types count, symbols count, objects count
+_HEADER = struct.Struct("<6sHIIHHI")
+# position x, position y, type symbol, parameters count
+_OBJECT = struct.Struct("<IIHB")
+# parameter symbol, value
+_PARAM = struct.Struct("<Hi")
+_NAME_LENGTH = struct.Struct("<B")
+
+
+def read_map_binary(path: str) -> MapData:
+    """
+    Read a binary map file.
+
+    The file is memory-mapped and the terrain grid is a view of the mapped file, so it is not copied into memory.
+    The returned map data must be closed when it is no longer needed.
+
+    :param path: path to the map file
+    :raises MapParseException: when the given file could not be parsed
+    """
+    with open(path, "rb") as file:
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise MapParseException("Empty map file: {}".format(path))
+
+    view = memoryview(buffer)
+
+    def close() -> None:
+        view.release()
+        buffer.close()
+
+    try:
+        return _read(view, close)
+    except (struct.error, UnicodeDecodeError):
+        close()
+        raise MapParseException("Corrupted map file: {}".format(path))
+    except MapParseException:
+        close()
+        raise
+
+
+def _read(view: memoryview, close: Callable) -> MapData:
+    """
+    Read the map data from the memory-mapped file.
+
+    :param view: view of the whole file
+    :param close: function closing the file
+    :raises MapParseException: when the file could not be parsed
+    """
+    magic, version, size_x, size_y, terrain_count, symbol_count, object_count = _HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise MapParseException("Not a binary map file")
+    if version != FORMAT_VERSION:
+        raise MapParseException("Unsupported map format version: {}".format(version))
+    if size_x == 0 or size_y == 0:
+        raise MapParseException("Invalid map size: {}x{}".format(size_x, size_y))
+
+    offset = _HEADER.size
+    terrain_types, offset = _read_names(view, offset, terrain_count)
+    symbols, offset = _read_names(view, offset, symbol_count)
+
+    grid_offset = offset
+    grid_size = size_x * size_y
+    if grid_offset + grid_size > len(view):
+        raise MapParseException("Incomplete terrain grid")
+    offset += grid_size
+
+    objects: Dict[VectorInt2D, List[MapObjectSpec]] = dict()
+    for _ in range(object_count):
+        x, y, tag, param_count = _OBJECT.unpack_from(view, offset)
+        offset += _OBJECT.size
+        if x >= size_x or y >= size_y:
+            raise MapParseException("Object outside of the map: {}:{}".format(x, y))
+
+        spec = MapObjectSpec(tag=_get_symbol(symbols, tag))
+        for _ in range(param_count):
+            key, value = _PARAM.unpack_from(view, offset)
+            offset += _PARAM.size
+            spec.params[_get_symbol(symbols, key)] = value
+
+        objects.setdefault((x, y), list()).append(spec)
+
+    # The terrain grid is a view of the file, it is created last so that there are no views left to release
+    # when any of the checks above fails.
+    terrain_grid = view[grid_offset:grid_offset + grid_size]
+    if max(terrain_grid) >= terrain_count:
+        terrain_grid.release()
+        raise MapParseException("Unknown terrain id in the terrain grid")
+
+    def on_close() -> None:
+        terrain_grid.release()
+        close()
+
+    return MapData((size_x, size_y), terrain_types, terrain_grid, objects, on_close)
+
+
+def _read_names(view: memoryview, offset: int, count: int) -> Tuple[List[str], int]:
+    """
+    Read a table of names.
+
+    :param view: view of the whole file
+    :param offset: offset of the table
+    :param count: number of names in the table
+    :return: names and the offset right after the table
+    """
+    names: List[str] = list()
+    for _ in range(count):
+        (length,) = _NAME_LENGTH.unpack_from(view, offset)
+        offset += _NAME_LENGTH.size
+        if offset + length > len(view):
+            raise MapParseException("Incomplete name table")
+        names.append(bytes(view[offset:offset + length]).decode("utf-8"))
+        offset += length
+    return names, offset
+
+
+def _get_symbol(symbols: List[str], symbol_id: int) -> str:
+    """
+    Get a symbol from the symbol table.
+
+    :param symbols: symbol table
+    :param symbol_id: id of the symbol
+    :raises MapParseException: when there is no symbol with the given id
+    """
+    try:
+        return symbols[symbol_id]
+    except IndexError:
+        raise MapParseException("Unknown symbol id: {}".format(symbol_id))
+
+
+def write_map_binary(map_data: MapData, path: str) -> None:
+    """
+    Write the map data into a binary map file.
+
+    :param map_data: map data to write
+    :param path: path to the map file
+    """
+    size_x, size_y = map_data.size
+
+    symbols: List[str] = list()
+    symbol_ids: Dict[str, int] = dict()
+
+    def get_symbol_id(symbol: str) -> int:
+        if symbol not in symbol_ids:
+            symbol_ids[symbol] = len(symbols)
+            symbols.append(symbol)
+        return symbol_ids[symbol]
+
+    object_count = 0
+    object_section = bytearray()
+    for (x, y), specs in sorted(map_data.objects.items(), key=lambda item: (item[0][1], item[0][0])):
+        for spec in specs:
+            object_section += _OBJECT.pack(x, y, get_symbol_id(spec.tag), len(spec.params))
+            for key, value in spec.params.items():
+                object_section += _PARAM.pack(get_symbol_id(key), value)
+            object_count += 1
+
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, size_x, size_y, len(map_data.terrain_types), len(symbols),
+                                object_count))
+        file.write(_pack_names(map_data.terrain_types))
+        file.write(_pack_names(symbols))
+        file.write(map_data.terrain_grid)
+        file.write(object_section)
+
+
+def _pack_names(names: List[str]) -> bytes:
+    """
+    Pack a table of names.
+
+    :param names: names to pack
+    """
+    packed = bytearray()
+    for name in names:
+        encoded = name.encode("utf-8")
+        packed += _NAME_LENGTH.pack(len(encoded))
+        packed += encoded
+    return bytes(packed)
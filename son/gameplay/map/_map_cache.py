@@ -0,0 +1,142 @@
+import hashlib
+import logging
+import os
+import re
+from typing import Optional
+
+from son.core.loading import ProgressCallback
+from son.gameplay.map._map_binary import read_map_binary, write_map_binary, FORMAT_VERSION
+from son.gameplay.map._map_data import MapData, MapParseException
+from son.gameplay.map._map_xml import read_map_xml, PARSER_VERSION
+
+# Directory with the cached maps
+CACHE_DIR = os.path.join(".cache", "maps")
+
+_EXTENSION = ".sonmap"
+_HASH_CHUNK_SIZE = 1024 * 1024
+_PATH_HASH_LENGTH = 16
+
+_logger = logging.getLogger(__name__)
+
+
+def read_map_xml_cached(path: str, cache_dir: str = CACHE_DIR, progress: Optional[ProgressCallback] = None) -> MapData:
+    """
+    Read an XML map file using the cache of the parsed maps.
+
+    The parsed map is stored in the cache in the binary format. The cache entry is identified by the hash
+    of the content of the XML file and the versions of the parser and the binary format, so a change of any of them
+    invalidates it. The name of the entry starts with the name of the map and the hash of the path to the XML file,
+    so that the maps with the same name in different directories do not replace each other's entries. Whether the map
+    has been loaded from the cache tells MapData.is_from_cache.
+
+    :param path: path to the XML map file
+    :param cache_dir: directory with the cached maps
+    :param progress: function receiving the progress of reading (optional)
+    :raises MapParseException: when the given file could not be parsed
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    prefix = "{}.{}".format(name, _get_path_hash(path))
+    cache_path = os.path.join(cache_dir, "{}.{}{}".format(prefix, _get_cache_key(path), _EXTENSION))
+
+    map_data = _read_cache_entry(cache_path)
+    if map_data is not None:
+        _logger.info("Map '%s' loaded from the cache (hit)", name)
+        if progress is not None:
+            progress(1.0)
+        return map_data
+
+    map_data = read_map_xml(path, progress)
+    _write_cache_entry(map_data, cache_dir, name, prefix, cache_path)
+    _logger.info("Map '%s' parsed from XML (cache miss)", name)
+
+    return map_data
+
+
+def _get_path_hash(path: str) -> str:
+    """
+    Get the hash of the absolute path to the given XML map file, it tells apart the maps with the same name.
+
+    :param path: path to the XML map file
+    """
+    return hashlib.sha256(os.path.abspath(path).encode("utf-8")).hexdigest()[:_PATH_HASH_LENGTH]
+
+
+def _get_cache_key(path: str) -> str:
+    """
+    Get the key of the cache entry for the given XML map file.
+
+    :param path: path to the XML map file
+    """
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(_HASH_CHUNK_SIZE), b""):
+            file_hash.update(chunk)
+
+    return "{}.p{}f{}".format(file_hash.hexdigest(), PARSER_VERSION, FORMAT_VERSION)
+
+
+def _read_cache_entry(cache_path: str) -> Optional[MapData]:
+    """
+    Read a map from the cache.
+
+    :param cache_path: path to the cache entry
+    :return: map data or None, when there is no valid cache entry
+    """
+    if not os.path.isfile(cache_path):
+        return None
+
+    try:
+        map_data = read_map_binary(cache_path)
+    except (MapParseException, OSError):
+        # Broken entries are treated as missing, they are overwritten with a new one
+        return None
+
+    map_data.is_from_cache = True
+    return map_data
+
+
+def _write_cache_entry(map_data: MapData, cache_dir: str, name: str, prefix: str, cache_path: str) -> None:
+    """
+    Write a map into the cache and remove the outdated entries of the same map.
+
+    The cache is only an optimization, so any errors while writing are ignored.
+
+    :param map_data: map data to write
+    :param cache_dir: directory with the cached maps
+    :param name: name of the map
+    :param prefix: prefix of the names of the entries of the map - its name and the hash of its path
+    :param cache_path: path to the new cache entry
+    """
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _remove_outdated_entries(cache_dir, prefix, cache_path)
+
+        # The entry is written under a temporary name first, so that no incomplete entries are left behind
+        temp_path = cache_path + ".tmp"
+        write_map_binary(map_data, temp_path)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        _logger.warning("Map '%s' could not be cached: %s", name, e)
+
+
+def _remove_outdated_entries(cache_dir: str, prefix: str, cache_path: str) -> None:
+    """
+    Remove the entries of the same map other than the given one.
+
+    Only the whole names of the entries are matched, so the entries of other maps are never removed, even when
+    the name of the map starts the same. An entry that could not be removed is left for the next time.
+
+    :param cache_dir: directory with the cached maps
+    :param prefix: prefix of the names of the entries of the map - its name and the hash of its path
+    :param cache_path: path to the new cache entry
+    """
+    pattern = re.compile(r"{}\.[0-9a-f]{{64}}\.p\d+f\d+{}".format(re.escape(prefix), re.escape(_EXTENSION)))
+
+    for entry in os.listdir(cache_dir):
+        entry_path = os.path.join(cache_dir, entry)
+        if pattern.fullmatch(entry) is None or entry_path == cache_path:
+            continue
+        try:
+            os.remove(entry_path)
+        except OSError as e:
+            _logger.debug("Outdated cache entry '%s' could not be removed: %s", entry, e)
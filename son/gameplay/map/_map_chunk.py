@@ -0,0 +1,70 @@
+from typing import List, Iterator
+
+from son.core.vectors import VectorInt2D
+from son.gameplay.map._constants import CHUNK_SIZE
+from son.gameplay.map._map_cell import MapCell
+from son.gameplay.map._map_grid import MapGrid
+from son.gameplay.map._map_view import MapView
+
+
+class MapChunk:
+    """
+    Square part of the map - the unit in which the cells are loaded and unloaded.
+    """
+
+    def __init__(self, chunk_pos: VectorInt2D, cells: List[List[MapCell]]) -> None:
+        """
+        Initialize MapChunk.
+
+        :param chunk_pos: position of the chunk in chunks
+        :param cells: cells of the chunk, row by row
+        """
+        self._chunk_pos: VectorInt2D = chunk_pos
+        self._cells: List[List[MapCell]] = cells
+
+    @property
+    def chunk_pos(self) -> VectorInt2D:
+        """
+        Position of the chunk in chunks.
+        """
+        return self._chunk_pos
+
+    @property
+    def cells(self) -> Iterator[MapCell]:
+        """
+        Iterator over all cells of the chunk, row by row.
+        """
+        for row in self._cells:
+            yield from row
+
+    def get_cell(self, pos: VectorInt2D) -> MapCell:
+        """
+        Get the cell under the given position.
+
+        :param pos: cell position on the map (not in the chunk)
+        """
+        return self._cells[pos[1] % CHUNK_SIZE][pos[0] % CHUNK_SIZE]
+
+
+def load_chunk(chunk_pos: VectorInt2D, grid: MapGrid, view: MapView) -> MapChunk:
+    """
+    Create the cells of a chunk.
+
+    The cells are views of the map grid, so the chunk can be dropped at any time without losing any state.
+
+    :param chunk_pos: position of the chunk in chunks
+    :param grid: grid storing the state of the cells
+    :param view: current view of the map
+    """
+    size_x, size_y = grid.size
+
+    first_x = chunk_pos[0] * CHUNK_SIZE
+    first_y = chunk_pos[1] * CHUNK_SIZE
+    last_x = min(first_x + CHUNK_SIZE, size_x)
+    last_y = min(first_y + CHUNK_SIZE, size_y)
+
+    cells: List[List[MapCell]] = list()
+    for y in range(first_y, last_y):
+        cells.append([MapCell(grid, (x, y), view) for x in range(first_x, last_x)])
+
+    return MapChunk(chunk_pos, cells)
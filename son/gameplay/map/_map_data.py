@@ -0,0 +1,98 @@
+from dataclasses import dataclass, field
+from typing import List, Dict, Callable, Optional
+
+from son.core.vectors import VectorInt2D
+
+
+class MapParseException(Exception):
+    """
+    Exception raised when a map file could not be parsed.
+    """
+    pass
+
+
+@dataclass
+class MapObjectSpec:
+    """
+    Description of a map object read from a map file.
+
+    Tag is the name of the object type, params are its numeric parameters, e.g. the density of a forest.
+    """
+    tag: str
+    params: Dict[str, int] = field(default_factory=dict)
+
+
+class MapData:
+    """
+    Raw content of a map file - the terrain grid and the map objects.
+
+    The terrain grid holds one terrain id per cell, row by row. The ids are indexes in the list of the terrain types.
+    The map objects are stored sparsely under the position of the cell they are placed on.
+    """
+
+    def __init__(self, size: VectorInt2D, terrain_types: List[str], terrain_grid,
+                 objects: Dict[VectorInt2D, List[MapObjectSpec]], on_close: Optional[Callable] = None) -> None:
+        """
+        Initialize MapData.
+
+        :param size: size of the map in cells
+        :param terrain_types: names of the terrain types, indexed by terrain ids
+        :param terrain_grid: bytes-like object with one terrain id per cell
+        :param objects: map object specs by the position of their cells
+        :param on_close: function releasing the resources the data is read from (optional)
+        """
+        self._size: VectorInt2D = size
+        self._terrain_types: List[str] = terrain_types
+        self._terrain_grid = terrain_grid
+        self._objects: Dict[VectorInt2D, List[MapObjectSpec]] = objects
+        self._on_close: Optional[Callable] = on_close
+
+        # Set by the loader when the data has been read from the cache of the parsed maps
+        self.is_from_cache: bool = False
+
+    @property
+    def size(self) -> VectorInt2D:
+        """
+        Size of the map in cells.
+        """
+        return self._size
+
+    @property
+    def terrain_types(self) -> List[str]:
+        """
+        Names of the terrain types, indexed by the terrain ids.
+        """
+        return self._terrain_types
+
+    @property
+    def terrain_grid(self):
+        """
+        Bytes-like object with one terrain id per cell, row by row.
+        """
+        return self._terrain_grid
+
+    @property
+    def objects(self) -> Dict[VectorInt2D, List[MapObjectSpec]]:
+        """
+        Map object specs by the position of their cells.
+        """
+        return self._objects
+
+    def get_terrain_type(self, pos: VectorInt2D) -> str:
+        """
+        Get the terrain type of the cell under the given position.
+
+        :param pos: cell position
+        """
+        return self._terrain_types[self._terrain_grid[pos[1] * self._size[0] + pos[0]]]
+
+    def close(self) -> None:
+        """
+        Release the resources the data is read from.
+
+        The terrain grid must not be used afterwards.
+        """
+        self._terrain_grid = None
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
@@ -0,0 +1,217 @@
+import heapq
+import random
+from typing import List, Dict, Sequence, Callable, Optional
+
+from son.core.vectors import VectorInt2D
+from son.gameplay.map._map_data import MapData, MapObjectSpec
+
+# Limits of the size of generated maps
+MIN_SIZE = 50
+MAX_SIZE = 4000
+
+# Size of the features of the noise in cells
+_NOISE_SCALE_TERRAIN = 32
+_NOISE_SCALE_FORESTS = 12
+
+# Max share of the empty cells that the map objects are placed in by drawing the cells at random
+_MAX_RANDOM_PLACEMENT_SHARE = 0.5
+# Max number of the rejected random cells in a row before the cells are chosen from all empty cells
+_MAX_FAILED_ATTEMPTS = 100
+
+# Max age of a generated forest (about 1000 years)
+_MAX_FOREST_AGE_IN_TURNS = 48000
+
+
+class _ValueNoise:
+    """
+    Seeded 2D value noise with values between 0.0 and 1.0.
+
+    Random values are placed on a lattice with the given spacing and interpolated between the lattice points.
+    """
+
+    def __init__(self, rng: random.Random, size: VectorInt2D, scale: int) -> None:
+        """
+        Initialize _ValueNoise.
+
+        :param rng: random generator providing the lattice values
+        :param size: size of the noise in cells
+        :param scale: spacing of the lattice in cells
+        """
+        self._scale: int = scale
+        self._lattice_size_x: int = size[0] // scale + 2
+        lattice_size_y = size[1] // scale + 2
+        self._lattice: List[float] = [rng.random() for _ in range(self._lattice_size_x * lattice_size_y)]
+
+    def get(self, x: int, y: int) -> float:
+        """
+        Get the value of the noise in the given cell.
+
+        :param x: position x of the cell
+        :param y: position y of the cell
+        """
+        lattice_x, offset_x = divmod(x, self._scale)
+        lattice_y, offset_y = divmod(y, self._scale)
+        weight_x = _smoothstep(offset_x / self._scale)
+        weight_y = _smoothstep(offset_y / self._scale)
+
+        index = lattice_y * self._lattice_size_x + lattice_x
+        lattice = self._lattice
+        top = lattice[index] + (lattice[index + 1] - lattice[index]) * weight_x
+        index += self._lattice_size_x
+        bottom = lattice[index] + (lattice[index + 1] - lattice[index]) * weight_x
+
+        return top + (bottom - top) * weight_y
+
+
+def _smoothstep(t: float) -> float:
+    return t * t * (3.0 - 2.0 * t)
+
+
+def generate_map(size: VectorInt2D, seed: int = 0, forests: float = 0.1, boulders: float = 0.01,
+                 tribes: float = 0.0005, terrain_types: Sequence[str] = ("grassland",)) -> MapData:
+    """
+    Generate a random map.
+
+    The same arguments always produce the same map. The terrain types are spread by a noise, the forests are grouped
+    in clusters following another noise, boulders and tribes are scattered evenly. There is at most one map object
+    in a cell.
+
+    :param size: size of the map in cells, from 50x50 to 4000x4000
+    :param seed: seed of the random generator
+    :param forests: share of the cells with forests (0.0 - 1.0)
+    :param boulders: share of the cells with boulders (0.0 - 1.0)
+    :param tribes: share of the cells with tribes (0.0 - 1.0)
+    :param terrain_types: terrain types to use, one of them is chosen for each cell by the noise
+    :raises ValueError: when the size, the shares or the terrain types are invalid
+    """
+    size_x, size_y = size
+    if not (MIN_SIZE <= size_x <= MAX_SIZE and MIN_SIZE <= size_y <= MAX_SIZE):
+        raise ValueError("Map size must be between {0}x{0} and {1}x{1}".format(MIN_SIZE, MAX_SIZE))
+    if min(forests, boulders, tribes) < 0.0 or forests + boulders + tribes > 1.0:
+        raise ValueError("Shares of the map objects must not be negative and must not exceed 1.0 in total")
+    if not (0 < len(terrain_types) <= 256):
+        raise ValueError("Between 1 and 256 terrain types must be given")
+
+    rng = random.Random(seed)
+    terrain_grid = _generate_terrain(rng, size, len(terrain_types))
+
+    objects: Dict[VectorInt2D, List[MapObjectSpec]] = dict()
+    cells_count = size_x * size_y
+
+    forest_noise = _ValueNoise(rng, size, _NOISE_SCALE_FORESTS)
+    _place_objects(rng, size, objects, round(cells_count * forests), _create_forest, forest_noise.get)
+    _place_objects(rng, size, objects, round(cells_count * boulders), _create_boulders)
+    _place_objects(rng, size, objects, round(cells_count * tribes), _create_tribe)
+
+    return MapData(size, list(terrain_types), terrain_grid, objects)
+
+
+def _generate_terrain(rng: random.Random, size: VectorInt2D, terrain_types_count: int) -> bytearray:
+    """
+    Generate the terrain grid.
+
+    :param rng: random generator
+    :param size: size of the map in cells
+    :param terrain_types_count: number of the terrain types
+    """
+    size_x, size_y = size
+    if terrain_types_count == 1:
+        return bytearray(size_x * size_y)
+
+    noise = _ValueNoise(rng, size, _NOISE_SCALE_TERRAIN)
+    max_id = terrain_types_count - 1
+
+    terrain_grid = bytearray()
+    for y in range(size_y):
+        terrain_grid += bytes(min(int(noise.get(x, y) * terrain_types_count), max_id) for x in range(size_x))
+
+    return terrain_grid
+
+
+def _place_objects(rng: random.Random, size: VectorInt2D, objects: Dict[VectorInt2D, List[MapObjectSpec]],
+                   count: int, create: Callable[[random.Random], MapObjectSpec],
+                   acceptance: Optional[Callable[[int, int], float]] = None) -> None:
+    """
+    Place map objects in random empty cells.
+
+    A cell drawn at random is accepted with the probability given by the acceptance function, which allows
+    the objects to be grouped. While the map is mostly empty, the time needed depends on the number of the objects,
+    not on the size of the map. Drawing the cells at random gets slow when only a few empty cells are left, so when
+    the objects fill most of the empty cells or too many cells in a row are rejected, the cells are chosen from all
+    empty cells instead, which takes time proportional to the size of the map.
+
+    :param rng: random generator
+    :param size: size of the map in cells
+    :param objects: already placed map objects by the position of their cells
+    :param count: number of the map objects to place
+    :param create: function creating a spec of the map object
+    :param acceptance: function giving the probability of accepting the given cell (optional)
+    """
+    size_x, size_y = size
+    free_cells_count = size_x * size_y - len(objects)
+    count = min(count, free_cells_count)
+    if count > free_cells_count * _MAX_RANDOM_PLACEMENT_SHARE:
+        for pos in _choose_free_cells(rng, size, objects, count, acceptance):
+            objects[pos] = [create(rng)]
+        return
+
+    placed = 0
+    failed_attempts = 0
+    while placed < count:
+        if failed_attempts == _MAX_FAILED_ATTEMPTS:
+            for pos in _choose_free_cells(rng, size, objects, count - placed, acceptance):
+                objects[pos] = [create(rng)]
+            return
+
+        pos = (rng.randrange(size_x), rng.randrange(size_y))
+        if pos in objects or (acceptance is not None and rng.random() >= acceptance(*pos)):
+            failed_attempts += 1
+            continue
+        objects[pos] = [create(rng)]
+        placed += 1
+        failed_attempts = 0
+
+
+def _choose_free_cells(rng: random.Random, size: VectorInt2D, objects: Dict[VectorInt2D, List[MapObjectSpec]],
+                       count: int, acceptance: Optional[Callable[[int, int], float]] = None) -> List[VectorInt2D]:
+    """
+    Choose distinct empty cells at random from all empty cells of the map.
+
+    With an acceptance function the cells are weighted by it, the same as when they are drawn at random one by one.
+    The weighted sampling without replacement gives each cell a random key, the power of a random number
+    to the inverse of its weight, and chooses the cells with the highest keys.
+
+    :param rng: random generator
+    :param size: size of the map in cells
+    :param objects: already placed map objects by the position of their cells
+    :param count: number of the cells to choose, at most the number of the empty cells
+    :param acceptance: function giving the weight of the given cell (optional)
+    """
+    size_x, size_y = size
+    free_cells = [(x, y) for y in range(size_y) for x in range(size_x) if (x, y) not in objects]
+    if acceptance is None:
+        return rng.sample(free_cells, count)
+
+    keys = list()
+    for pos in free_cells:
+        weight = acceptance(*pos)
+        # The cells that are never accepted are chosen only when there are no other empty cells
+        keys.append(rng.random() ** (1.0 / weight) if weight > 0.0 else -1.0)
+    return [free_cells[i] for i in heapq.nlargest(count, range(len(free_cells)), key=keys.__getitem__)]
+
+
+def _create_forest(rng: random.Random) -> MapObjectSpec:
+    age_in_turns = rng.randrange(_MAX_FOREST_AGE_IN_TURNS)
+    # Older forests tend to be denser
+    density = min(100, int(age_in_turns / _MAX_FOREST_AGE_IN_TURNS * 100) + rng.randrange(10))
+    return MapObjectSpec(tag="forest", params={"density": density, "age_in_turns": age_in_turns})
+
+
+# noinspection PyUnusedLocal
+def _create_boulders(rng: random.Random) -> MapObjectSpec:
+    return MapObjectSpec(tag="boulders")
+
+
+# noinspection PyUnusedLocal
+def _create_tribe(rng: random.Random) -> MapObjectSpec:
+    return MapObjectSpec(tag="tribe")
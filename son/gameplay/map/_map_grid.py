@@ -0,0 +1,494 @@
+from abc import ABC, abstractmethod
+from array import array
+from typing import List, Sequence, Iterator, Optional, Set
+
+from son.core.vectors import VectorInt2D
+from son.gameplay.map._map_data import MapData
+from son.gameplay.map._map_object_index import MapObjectIndex
+from son.gameplay.map.objects import MapObject, ModifiersHolder
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Backends storing the grid
+GRID_BACKEND_NUMPY = "numpy"
+GRID_BACKEND_ARRAY = "array"
+
+# Movement cost of a cell without any modifiers
+MOVEMENT_COST_BASE = 1
+
+
+class MapGrid(ABC):
+    """
+    State of all map cells stored as a struct of arrays.
+
+    Each property of the cells - terrain id, movement cost, focus flag and number of map objects - is stored in its own
+    dense array with one item per cell, row by row, so that the operations with the whole map do not need to touch
+    the cells one by one. The map objects themselves are kept in an index by their positions and types.
+
+    Changes of the map objects are applied to the movement modifiers at once and the changed cells are marked as
+    dirty. The movement costs of the dirty cells are updated only by update_stats() - on the start of a new turn,
+    so its cost depends on the number of the changes, not on the size of the map.
+    """
+
+    def __init__(self, map_data: MapData) -> None:
+        """
+        Initialize MapGrid.
+
+        :param map_data: content of the map file
+        """
+        self._size: VectorInt2D = map_data.size
+        self._terrain_types: List[str] = map_data.terrain_types
+        self._index: MapObjectIndex = MapObjectIndex()
+
+        # Indexes of the cells whose stats must be updated
+        self._dirty_cells: Set[int] = set()
+        # Positions of the cells whose look has changed
+        self._changed_cells: Set[VectorInt2D] = set()
+        # Positions of the focused cells
+        self._focused_cells: Set[VectorInt2D] = set()
+
+    @property
+    def size(self) -> VectorInt2D:
+        """
+        Size of the grid in cells.
+        """
+        return self._size
+
+    @property
+    def terrain_types(self) -> List[str]:
+        """
+        Terrain types of the grid, indexed by terrain ids.
+
+        Any operations on the list will have no effect, since it is a shallow copy.
+        """
+        return self._terrain_types.copy()
+
+    @property
+    def map_objects(self) -> Iterator[MapObject]:
+        """
+        Iterator over all map objects on the grid.
+        """
+        return iter(self._index)
+
+    @property
+    def changed_cells(self) -> Set[VectorInt2D]:
+        """
+        Positions of the cells whose terrain or map objects have changed since the last call of clear_changed_cells().
+
+        The focus is not included, it is drawn over the cells, so its changes do not affect them.
+
+        Any operations on the set will have no effect, since it is a shallow copy.
+        """
+        return self._changed_cells.copy()
+
+    @property
+    def focused_cells(self) -> Set[VectorInt2D]:
+        """
+        Positions of the focused cells.
+
+        Any operations on the set will have no effect, since it is a shallow copy.
+        """
+        return self._focused_cells.copy()
+
+    def mark_changed(self, pos: VectorInt2D) -> None:
+        """
+        Mark the look of the cell under the given position as changed, e.g. when a map object has changed its surface.
+
+        :param pos: cell position
+        """
+        self._changed_cells.add(pos)
+
+    def clear_changed_cells(self) -> None:
+        """
+        Forget the changes of the cells.
+        """
+        self._changed_cells.clear()
+
+    @property
+    def index(self) -> MapObjectIndex:
+        """
+        Index of the map objects on the grid.
+
+        The index must not be modified directly, use add_object() and remove_object() instead.
+        """
+        return self._index
+
+    def get_objects(self, pos: VectorInt2D) -> Sequence[MapObject]:
+        """
+        Get the map objects in the cell under the given position.
+
+        The returned sequence must not be modified, use add_object() and remove_object() instead.
+
+        :param pos: cell position
+        """
+        return self._index.get_objects(pos)
+
+    def add_object(self, pos: VectorInt2D, map_object: MapObject) -> None:
+        """
+        Add a map object to the cell under the given position.
+
+        :param pos: cell position
+        :param map_object: map object to add
+        :raises ValueError: when the map object is already on the grid
+        """
+        self._index.add(pos, map_object)
+        self._update_object(self._get_index(pos), map_object, 1)
+        self._changed_cells.add(pos)
+
+    def remove_object(self, pos: VectorInt2D, map_object: MapObject) -> None:
+        """
+        Remove a map object from the cell under the given position.
+
+        :param pos: cell position
+        :param map_object: map object to remove
+        :raises ValueError: when the map object is not in the cell
+        """
+        self._index.remove(pos, map_object)
+        self._update_object(self._get_index(pos), map_object, -1)
+        self._changed_cells.add(pos)
+
+    @abstractmethod
+    def get_terrain_id(self, pos: VectorInt2D) -> int:
+        """
+        Get the terrain id of the cell under the given position.
+
+        :param pos: cell position
+        """
+        pass
+
+    @abstractmethod
+    def get_terrain_ids(self) -> Sequence[int]:
+        """
+        Get the terrain ids of all cells, row by row.
+
+        The returned sequence supports the buffer protocol and must not be modified, use set_terrain_id() instead.
+        """
+        pass
+
+    def set_terrain_id(self, pos: VectorInt2D, terrain_id: int) -> None:
+        """
+        Set the terrain id of the cell under the given position.
+
+        :param pos: cell position
+        :param terrain_id: index of the terrain type in the terrain types of the grid
+        """
+        self._set_terrain_id(self._get_index(pos), terrain_id)
+        self._changed_cells.add(pos)
+
+    def get_terrain_type(self, pos: VectorInt2D) -> str:
+        """
+        Get the terrain type of the cell under the given position.
+
+        :param pos: cell position
+        """
+        return self._terrain_types[self.get_terrain_id(pos)]
+
+    @abstractmethod
+    def get_movement_cost(self, pos: VectorInt2D) -> int:
+        """
+        Get the movement cost of the cell under the given position.
+
+        :param pos: cell position
+        """
+        pass
+
+    @abstractmethod
+    def get_object_count(self, pos: VectorInt2D) -> int:
+        """
+        Get the number of the map objects in the cell under the given position.
+
+        :param pos: cell position
+        """
+        pass
+
+    @abstractmethod
+    def is_focused(self, pos: VectorInt2D) -> bool:
+        """
+        Is the cell under the given position focused?
+
+        :param pos: cell position
+        """
+        pass
+
+    def set_focused(self, pos: VectorInt2D, is_focused: bool) -> None:
+        """
+        Set whether the cell under the given position is focused.
+
+        :param pos: cell position
+        :param is_focused: is the cell focused?
+        """
+        if self.is_focused(pos) != is_focused:
+            self._set_focus_flag(self._get_index(pos), is_focused)
+            if is_focused:
+                self._focused_cells.add(pos)
+            else:
+                self._focused_cells.discard(pos)
+
+    def invalidate_stats(self, pos: VectorInt2D) -> None:
+        """
+        Recalculate the modifiers of the cell under the given position and mark its stats to be updated.
+
+        Adding and removing map objects invalidates the stats automatically, this must be called only when
+        the modifiers of a map object in the cell change.
+
+        :param pos: cell position
+        """
+        index = self._get_index(pos)
+        self._set_movement_modifier(index, sum(_get_movement_modifier(map_object)
+                                               for map_object in self._index.get_objects(pos)))
+        self._dirty_cells.add(index)
+
+    def update_stats(self) -> None:
+        """
+        Update the stats of the dirty cells with the modifiers of their map objects.
+        """
+        if len(self._dirty_cells) > 0:
+            self._update_movement_costs(self._dirty_cells)
+            self._dirty_cells.clear()
+
+    @abstractmethod
+    def _set_terrain_id(self, index: int, terrain_id: int) -> None:
+        """
+        Set the terrain id of a cell.
+
+        :param index: index of the cell in the arrays
+        :param terrain_id: index of the terrain type in the terrain types of the grid
+        """
+        pass
+
+    @abstractmethod
+    def _set_focus_flag(self, index: int, is_focused: bool) -> None:
+        """
+        Set the focus flag of a cell.
+
+        :param index: index of the cell in the arrays
+        :param is_focused: is the cell focused?
+        """
+        pass
+
+    @abstractmethod
+    def _update_movement_costs(self, indexes: Set[int]) -> None:
+        """
+        Update the movement costs of the given cells with their modifiers.
+
+        :param indexes: indexes of the cells in the arrays
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Release the terrain ids, which may be a view of the map data, so that the map data can be closed.
+
+        The grid must not be used afterwards.
+        """
+        pass
+
+    @abstractmethod
+    def _add_movement_modifier(self, index: int, value: int) -> None:
+        """
+        Add a value to the movement modifier of a cell.
+
+        :param index: index of the cell in the arrays
+        :param value: value to add
+        """
+        pass
+
+    @abstractmethod
+    def _set_movement_modifier(self, index: int, value: int) -> None:
+        """
+        Set the movement modifier of a cell.
+
+        :param index: index of the cell in the arrays
+        :param value: new value
+        """
+        pass
+
+    @abstractmethod
+    def _add_object_count(self, index: int, value: int) -> None:
+        """
+        Add a value to the number of the map objects in a cell.
+
+        :param index: index of the cell in the arrays
+        :param value: value to add
+        """
+        pass
+
+    def _get_index(self, pos: VectorInt2D) -> int:
+        return pos[1] * self._size[0] + pos[0]
+
+    def _update_object(self, index: int, map_object: MapObject, sign: int) -> None:
+        """
+        Apply a map object added to a cell (sign 1) or removed from it (sign -1) to the arrays.
+
+        :param index: index of the cell in the arrays
+        :param map_object: map object added or removed
+        :param sign: 1 when the map object has been added, -1 when it has been removed
+        """
+        self._add_object_count(index, sign)
+
+        movement_modifier = _get_movement_modifier(map_object)
+        if movement_modifier != 0:
+            self._add_movement_modifier(index, sign * movement_modifier)
+            self._dirty_cells.add(index)
+
+
+class _NumpyMapGrid(MapGrid):
+    """
+    Grid stored in NumPy arrays.
+    """
+
+    def __init__(self, map_data: MapData) -> None:
+        """
+        Initialize _NumpyMapGrid.
+
+        :param map_data: content of the map file
+        """
+        super().__init__(map_data)
+
+        cells_count = self._size[0] * self._size[1]
+        # The terrain ids are not copied until they are changed, the array uses the memory of the map data
+        self._terrain_ids = numpy.frombuffer(map_data.terrain_grid, dtype=numpy.uint8, count=cells_count)
+        self._movement_modifiers = numpy.zeros(cells_count, dtype=numpy.int16)
+        self._movement_costs = numpy.full(cells_count, MOVEMENT_COST_BASE, dtype=numpy.int16)
+        self._object_counts = numpy.zeros(cells_count, dtype=numpy.int16)
+        self._focus_flags = numpy.zeros(cells_count, dtype=numpy.bool_)
+
+    def get_terrain_id(self, pos: VectorInt2D) -> int:
+        return int(self._terrain_ids[self._get_index(pos)])
+
+    def get_terrain_ids(self) -> Sequence[int]:
+        return self._terrain_ids
+
+    def _set_terrain_id(self, index: int, terrain_id: int) -> None:
+        # The map data must not be changed
+        if self._terrain_ids.base is not None:
+            self._terrain_ids = self._terrain_ids.copy()
+        self._terrain_ids[index] = terrain_id
+
+    def get_movement_cost(self, pos: VectorInt2D) -> int:
+        return int(self._movement_costs[self._get_index(pos)])
+
+    def get_object_count(self, pos: VectorInt2D) -> int:
+        return int(self._object_counts[self._get_index(pos)])
+
+    def is_focused(self, pos: VectorInt2D) -> bool:
+        return bool(self._focus_flags[self._get_index(pos)])
+
+    def _set_focus_flag(self, index: int, is_focused: bool) -> None:
+        self._focus_flags[index] = is_focused
+
+    def _update_movement_costs(self, indexes: Set[int]) -> None:
+        indexes = numpy.fromiter(indexes, dtype=numpy.intp, count=len(indexes))
+        self._movement_costs[indexes] = self._movement_modifiers[indexes] + MOVEMENT_COST_BASE
+
+    def close(self) -> None:
+        self._terrain_ids = None
+
+    def _add_movement_modifier(self, index: int, value: int) -> None:
+        self._movement_modifiers[index] += value
+
+    def _set_movement_modifier(self, index: int, value: int) -> None:
+        self._movement_modifiers[index] = value
+
+    def _add_object_count(self, index: int, value: int) -> None:
+        self._object_counts[index] += value
+
+
+class _ArrayMapGrid(MapGrid):
+    """
+    Grid stored in the arrays of the standard library, used when NumPy is not available.
+    """
+
+    def __init__(self, map_data: MapData) -> None:
+        """
+        Initialize _ArrayMapGrid.
+
+        :param map_data: content of the map file
+        """
+        super().__init__(map_data)
+
+        cells_count = self._size[0] * self._size[1]
+        # The terrain ids are not copied until they are changed, the map data already stores them in a byte array
+        self._terrain_ids = map_data.terrain_grid
+        self._is_terrain_copied: bool = False
+        self._movement_modifiers = array("h", bytes(2 * cells_count))
+        self._movement_costs = array("h", [MOVEMENT_COST_BASE]) * cells_count
+        self._object_counts = array("h", bytes(2 * cells_count))
+        self._focus_flags = bytearray(cells_count)
+
+    def get_terrain_id(self, pos: VectorInt2D) -> int:
+        return self._terrain_ids[self._get_index(pos)]
+
+    def get_terrain_ids(self) -> Sequence[int]:
+        return self._terrain_ids
+
+    def _set_terrain_id(self, index: int, terrain_id: int) -> None:
+        # The map data must not be changed
+        if not self._is_terrain_copied:
+            self._terrain_ids = bytearray(self._terrain_ids)
+            self._is_terrain_copied = True
+        self._terrain_ids[index] = terrain_id
+
+    def get_movement_cost(self, pos: VectorInt2D) -> int:
+        return self._movement_costs[self._get_index(pos)]
+
+    def get_object_count(self, pos: VectorInt2D) -> int:
+        return self._object_counts[self._get_index(pos)]
+
+    def is_focused(self, pos: VectorInt2D) -> bool:
+        return self._focus_flags[self._get_index(pos)] != 0
+
+    def _set_focus_flag(self, index: int, is_focused: bool) -> None:
+        self._focus_flags[index] = is_focused
+
+    def _update_movement_costs(self, indexes: Set[int]) -> None:
+        for index in indexes:
+            self._movement_costs[index] = self._movement_modifiers[index] + MOVEMENT_COST_BASE
+
+    def close(self) -> None:
+        self._terrain_ids = None
+
+    def _add_movement_modifier(self, index: int, value: int) -> None:
+        self._movement_modifiers[index] += value
+
+    def _set_movement_modifier(self, index: int, value: int) -> None:
+        self._movement_modifiers[index] = value
+
+    def _add_object_count(self, index: int, value: int) -> None:
+        self._object_counts[index] += value
+
+
+def _get_movement_modifier(map_object: MapObject) -> int:
+    """
+    Get the sum of the movement cost modifiers of a map object.
+
+    :param map_object: map object
+    """
+    if not isinstance(map_object, ModifiersHolder):
+        return 0
+    return sum(value for name, value in map_object.modifiers if name == "movement_cost")
+
+
+def create_map_grid(map_data: MapData, backend: Optional[str] = None) -> MapGrid:
+    """
+    Create the grid of a map.
+
+    :param map_data: content of the map file
+    :param backend: backend storing the grid, "numpy" or "array" (optional, NumPy is used when it is available)
+    :raises ValueError: when the backend is unknown or not available
+    """
+    if backend is None:
+        backend = GRID_BACKEND_NUMPY if numpy is not None else GRID_BACKEND_ARRAY
+
+    if backend == GRID_BACKEND_NUMPY:
+        if numpy is None:
+            raise ValueError("Grid backend not available: {}".format(backend))
+        return _NumpyMapGrid(map_data)
+    if backend == GRID_BACKEND_ARRAY:
+        return _ArrayMapGrid(map_data)
+
+    raise ValueError("Unknown grid backend: {}".format(backend))
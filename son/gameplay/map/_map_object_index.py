@@ -0,0 +1,267 @@
+from typing import List, Dict, Set, Sequence, Iterator, Type, Optional, Iterable, Tuple
+
+from pygame import Rect
+
+from son.core.vectors import VectorInt2D
+from son.gameplay.map.objects import MapObject
+
+# Size of the square buckets the map objects are grouped in by their positions
+_BUCKET_SIZE = 16
+
+
+class MapObjectIndex:
+    """
+    Index of the map objects by their positions and types.
+
+    Besides the objects in each cell, the index knows the position of each object, the objects of each type and
+    the objects in each bucket - a square part of the map. Thanks to that the queries take time proportional to
+    the number of the found objects rather than to the size of the map.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize MapObjectIndex.
+        """
+        self._objects_by_pos: Dict[VectorInt2D, List[MapObject]] = dict()
+        self._positions: Dict[MapObject, VectorInt2D] = dict()
+        self._objects_by_type: Dict[Type[MapObject], Set[MapObject]] = dict()
+        self._objects_by_bucket: Dict[VectorInt2D, Set[MapObject]] = dict()
+        # Bounds of the occupied buckets in buckets, they are computed again only after a bucket gets empty
+        self._bucket_bounds: Optional[Rect] = None
+        self._is_bucket_bounds_valid: bool = True
+        self._version: int = 0
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __iter__(self) -> Iterator[MapObject]:
+        return iter(self._positions.keys())
+
+    def __contains__(self, map_object: MapObject) -> bool:
+        return map_object in self._positions
+
+    @property
+    def version(self) -> int:
+        """
+        Version of the index, it changes whenever a map object is added or removed.
+        """
+        return self._version
+
+    @property
+    def types(self) -> Iterable[Type[MapObject]]:
+        """
+        Types of the map objects in the index.
+        """
+        return self._objects_by_type.keys()
+
+    @property
+    def positions(self) -> Iterable[VectorInt2D]:
+        """
+        Positions of all cells with any map objects.
+        """
+        return self._objects_by_pos.keys()
+
+    def add(self, pos: VectorInt2D, map_object: MapObject) -> None:
+        """
+        Add a map object to the cell under the given position.
+
+        :param pos: cell position
+        :param map_object: map object to add
+        :raises ValueError: when the map object is already in the index
+        """
+        if map_object in self._positions:
+            raise ValueError("Map object already placed in the cell: {}:{}".format(*self._positions[map_object]))
+
+        self._objects_by_pos.setdefault(pos, list()).append(map_object)
+        self._positions[map_object] = pos
+        self._objects_by_type.setdefault(type(map_object), set()).add(map_object)
+        bucket = _get_bucket(pos)
+        self._objects_by_bucket.setdefault(bucket, set()).add(map_object)
+        if self._is_bucket_bounds_valid:
+            if self._bucket_bounds is None:
+                self._bucket_bounds = Rect(bucket, (1, 1))
+            elif not self._bucket_bounds.collidepoint(bucket):
+                self._bucket_bounds.union_ip(Rect(bucket, (1, 1)))
+        self._version += 1
+
+    def remove(self, pos: VectorInt2D, map_object: MapObject) -> None:
+        """
+        Remove a map object from the cell under the given position.
+
+        :param pos: cell position
+        :param map_object: map object to remove
+        :raises ValueError: when the map object is not in the cell
+        """
+        if self._positions.get(map_object) != pos:
+            raise ValueError("Map object not found in the cell: {}:{}".format(*pos))
+
+        _discard(self._objects_by_pos, pos, map_object)
+        del self._positions[map_object]
+        _discard(self._objects_by_type, type(map_object), map_object)
+        bucket = _get_bucket(pos)
+        _discard(self._objects_by_bucket, bucket, map_object)
+        if bucket not in self._objects_by_bucket:
+            self._is_bucket_bounds_valid = False
+        self._version += 1
+
+    def get_pos(self, map_object: MapObject) -> Optional[VectorInt2D]:
+        """
+        Get the position of the cell with the given map object.
+
+        :param map_object: map object
+        :return: cell position or None, when the object is not in the index
+        """
+        return self._positions.get(map_object)
+
+    def get_objects(self, pos: VectorInt2D) -> Sequence[MapObject]:
+        """
+        Get the map objects in the cell under the given position.
+
+        The returned sequence must not be modified.
+
+        :param pos: cell position
+        """
+        return self._objects_by_pos.get(pos, ())
+
+    def get_occupied_cells(self, first_pos: VectorInt2D,
+                           last_pos: VectorInt2D) -> List[Tuple[VectorInt2D, Sequence[MapObject]]]:
+        """
+        Get the map objects in the cells with any objects within the given range, row by row.
+
+        When the range has fewer objects than cells, e.g. a zoomed out view, the objects are collected from
+        the buckets instead of looking up every cell. The returned sequences must not be modified.
+
+        :param first_pos: position of the top left cell of the range
+        :param last_pos: position of the bottom right cell of the range
+        """
+        objects_by_pos = self._objects_by_pos
+        first_x, first_y = first_pos
+        last_x, last_y = last_pos
+        rect = Rect(first_x, first_y, last_x - first_x + 1, last_y - first_y + 1)
+
+        if self._count_in_buckets(rect) >= rect.width * rect.height:
+            occupied_cells: List[Tuple[VectorInt2D, Sequence[MapObject]]] = list()
+            for y in range(first_y, last_y + 1):
+                for x in range(first_x, last_x + 1):
+                    map_objects = objects_by_pos.get((x, y))
+                    if map_objects is not None:
+                        occupied_cells.append(((x, y), map_objects))
+            return occupied_cells
+
+        positions = self._positions
+        occupied_positions = {positions[map_object] for map_object in self._get_objects_in_buckets(rect)}
+        return [(pos, objects_by_pos[pos]) for pos in sorted(occupied_positions, key=_get_row_major_key)
+                if first_x <= pos[0] <= last_x and first_y <= pos[1] <= last_y]
+
+    def get_objects_of_type(self, object_type: Type[MapObject]) -> List[MapObject]:
+        """
+        Get all map objects of the given type, including its subclasses, in no particular order.
+
+        :param object_type: type of the map objects
+        """
+        found: List[MapObject] = list()
+        for indexed_type, map_objects in self._objects_by_type.items():
+            if issubclass(indexed_type, object_type):
+                found.extend(map_objects)
+        return found
+
+    def find_in_rect(self, rect: Rect, object_type: Optional[Type[MapObject]] = None) -> List[MapObject]:
+        """
+        Find the map objects in the cells within the given rectangle, in no particular order.
+
+        :param rect: rectangle in cells
+        :param object_type: type of the map objects to find, including its subclasses (optional)
+        """
+        candidates: Iterable[MapObject]
+        # The objects of the type are fewer than the cells of the rectangle, so they are cheaper to check
+        if object_type is not None and self._count_of_type(object_type) < rect.width * rect.height:
+            candidates = self.get_objects_of_type(object_type)
+        else:
+            candidates = self._get_objects_in_buckets(rect)
+
+        positions = self._positions
+        return [map_object for map_object in candidates
+                if rect.collidepoint(positions[map_object])
+                and (object_type is None or isinstance(map_object, object_type))]
+
+    def find_in_radius(self, center: VectorInt2D, radius: int,
+                       object_type: Optional[Type[MapObject]] = None) -> List[MapObject]:
+        """
+        Find the map objects at most the given number of cells away from the center, in no particular order.
+
+        The distance is measured in moves, i.e. diagonal steps count as one cell.
+
+        :param center: position of the center cell
+        :param radius: max distance in cells
+        :param object_type: type of the map objects to find, including its subclasses (optional)
+        """
+        center_x, center_y = center
+        return self.find_in_rect(Rect(center_x - radius, center_y - radius, 2 * radius + 1, 2 * radius + 1),
+                                 object_type)
+
+    def _count_of_type(self, object_type: Type[MapObject]) -> int:
+        return sum(len(map_objects) for indexed_type, map_objects in self._objects_by_type.items()
+                   if issubclass(indexed_type, object_type))
+
+    def _count_in_buckets(self, rect: Rect) -> int:
+        return sum(len(self._objects_by_bucket.get(bucket, ())) for bucket in self._get_buckets(rect))
+
+    def _get_objects_in_buckets(self, rect: Rect) -> Iterator[MapObject]:
+        for bucket in self._get_buckets(rect):
+            yield from self._objects_by_bucket.get(bucket, ())
+
+    def _get_buckets(self, rect: Rect) -> Iterable[VectorInt2D]:
+        """
+        Get the buckets overlapping the given rectangle, only within the bounds of the occupied buckets.
+
+        The number of the returned buckets is at most the number of the occupied buckets, so the rectangles reaching
+        far out of the map, e.g. of a big radius, cost no more than the whole map.
+
+        :param rect: rectangle in cells
+        """
+        bounds = self._get_bucket_bounds()
+        if bounds is None or rect.width <= 0 or rect.height <= 0:
+            return ()
+
+        first_x, first_y = _get_bucket(rect.topleft)
+        last_x, last_y = _get_bucket((rect.right - 1, rect.bottom - 1))
+        first_x, first_y = max(first_x, bounds.left), max(first_y, bounds.top)
+        last_x, last_y = min(last_x, bounds.right - 1), min(last_y, bounds.bottom - 1)
+        if first_x > last_x or first_y > last_y:
+            return ()
+
+        if (last_x - first_x + 1) * (last_y - first_y + 1) > len(self._objects_by_bucket):
+            return [(x, y) for x, y in self._objects_by_bucket if first_x <= x <= last_x and first_y <= y <= last_y]
+        return ((x, y) for y in range(first_y, last_y + 1) for x in range(first_x, last_x + 1))
+
+    def _get_bucket_bounds(self) -> Optional[Rect]:
+        """
+        Get the bounds of the occupied buckets in buckets or None, when the index is empty.
+        """
+        if not self._is_bucket_bounds_valid:
+            self._bucket_bounds = None
+            for bucket in self._objects_by_bucket:
+                if self._bucket_bounds is None:
+                    self._bucket_bounds = Rect(bucket, (1, 1))
+                elif not self._bucket_bounds.collidepoint(bucket):
+                    self._bucket_bounds.union_ip(Rect(bucket, (1, 1)))
+            self._is_bucket_bounds_valid = True
+        return self._bucket_bounds
+
+
+def _get_row_major_key(pos: VectorInt2D) -> VectorInt2D:
+    return pos[1], pos[0]
+
+
+def _get_bucket(pos: VectorInt2D) -> VectorInt2D:
+    return pos[0] // _BUCKET_SIZE, pos[1] // _BUCKET_SIZE
+
+
+def _discard(collections: dict, key, map_object: MapObject) -> None:
+    """
+    Remove a map object from the collection under the given key and drop the collection when it gets empty.
+    """
+    collection = collections[key]
+    collection.remove(map_object)
+    if len(collection) == 0:
+        del collections[key]
@@ -1,12 +1,27 @@
 import os.path
-from typing import List, Dict, Type
-from xml.etree import ElementTree
+from typing import List, Dict, Type, Optional
 
+from son.core.loading import ProgressCallback
 from son.core.resources import ResourceManager
-from son.gameplay.map._map_cell import MapCell
+from son.core.vectors import VectorInt2D
+from son.gameplay.map._map_binary import read_map_binary, write_map_binary
+from son.gameplay.map._map_cache import read_map_xml_cached
+from son.gameplay.map._map_data import MapData, MapObjectSpec, MapParseException
+from son.gameplay.map._map_xml import read_map_xml, write_map_xml
+from son.gameplay.map.objects import MapObject
 from son.gameplay.map.objects.static import Forest, Boulders
 from son.gameplay.map.objects.units import Tribe
 
+# Directory with the map files
+MAPS_DIR = "maps"
+
+# Extensions of the map files
+EXTENSION_XML = ".map"
+EXTENSION_BINARY = ".sonmap"
+
+# Number of processed cells between the progress reports
+_PROGRESS_INTERVAL = 1000
+
 # Tags for map objects and their corresponding types
 _OBJECTS: Dict[str, Type] = {
     "tribe": Tribe,
@@ -15,50 +30,120 @@ _OBJECTS: Dict[str, Type] = {
 }
 
 
-class MapParseException(Exception):
+def parse_map(name: str, progress: Optional[ProgressCallback] = None) -> MapData:
     """
-    Exception raised when a map file could not be parsed.
+    Parse a map file.
+
+    The binary version of the map is used when it exists and is not older than the XML version. Otherwise the XML
+    version is read through the cache of the parsed maps. A path to a map file with any of the extensions can be
+    given instead of the name, e.g. for the maps generated for benchmarks outside of the directory of the maps.
+    The returned map data must be closed when it is no longer needed.
+
+    :param name: name of the map or path to a map file
+    :param progress: function receiving the progress of parsing (optional)
+    :raises MapParseException: when the given file could not be parsed
     """
-    pass
+    extension = os.path.splitext(name)[1]
+    if extension == EXTENSION_BINARY or extension == EXTENSION_XML:
+        if not os.path.isfile(name):
+            raise MapParseException("Map not found: {}".format(name))
+        if extension == EXTENSION_XML:
+            return read_map_xml_cached(name, progress=progress)
+        map_data = read_map_binary(name)
+        if progress is not None:
+            progress(1.0)
+        return map_data
+
+    path_xml = os.path.join(MAPS_DIR, name + EXTENSION_XML)
+    path_binary = os.path.join(MAPS_DIR, name + EXTENSION_BINARY)
+
+    if os.path.isfile(path_binary):
+        if not os.path.isfile(path_xml) or os.path.getmtime(path_binary) >= os.path.getmtime(path_xml):
+            map_data = read_map_binary(path_binary)
+            if progress is not None:
+                progress(1.0)
+            return map_data
+
+    if not os.path.isfile(path_xml):
+        raise MapParseException("Map not found: {}".format(name))
 
+    return read_map_xml_cached(path_xml, progress=progress)
 
-def parse_map(name: str, resource_manager: ResourceManager) -> List[List[MapCell]]:
+
+def create_objects(map_data: MapData, resource_manager: ResourceManager,
+                   progress: Optional[ProgressCallback] = None) -> Dict[VectorInt2D, List[MapObject]]:
     """
-    Parse a map file.
+    Create all map objects from the map data.
 
-    :param name: name of the map
+    :param map_data: content of a map file
     :param resource_manager: resource manager
-    :raises MapParseException: when the given file could not be parsed
+    :param progress: function receiving the progress of creating the objects (optional)
+    :return: map objects by the position of their cells
+    :raises MapParseException: when any of the map objects is unknown
+    """
+    map_objects: Dict[VectorInt2D, List[MapObject]] = dict()
+    cells_count = len(map_data.objects)
+
+    for i, (pos, specs) in enumerate(map_data.objects.items()):
+        map_objects[pos] = [create_object(spec, resource_manager) for spec in specs]
+        if progress is not None and i % _PROGRESS_INTERVAL == 0:
+            progress(i / cells_count)
+
+    if progress is not None:
+        progress(1.0)
+
+    return map_objects
+
+
+def create_object(spec: MapObjectSpec, resource_manager: ResourceManager) -> MapObject:
     """
-    path = os.path.join('maps', name + '.map')
-    tree = ElementTree.parse(path)
-    root = tree.getroot()
-
-    size_x = int(root.attrib["size_x"])
-    size_y = int(root.attrib["size_y"])
-
-    array: List[List[MapCell]] = list()
-
-    for y in range(size_y):
-        row: List[MapCell] = list()
-        for x in range(size_x):
-            cell_info = root.find("./cell[@pos_x='{}'][@pos_y='{}']".format(x, y))
-            terrain = cell_info.find("./terrain").text
-            surface = resource_manager.get_resource("terrain." + terrain)
-
-            cell = MapCell((x, y), terrain, surface)
-
-            map_objects = cell_info.find("./objects")
-            if map_objects is not None:
-                for map_object in map_objects:
-                    try:
-                        object_type = _OBJECTS[map_object.tag]
-                        instance = object_type(resource_manager, map_object)
-                        cell.add_object(instance)
-                    except KeyError:
-                        raise MapParseException("Unknown object: {}".format(map_object.tag))
-
-            row.append(cell)
-        array.append(row)
-
-    return array
+    Create a map object from its spec.
+
+    :param spec: spec of the map object
+    :param resource_manager: resource manager
+    :raises MapParseException: when the type of the object is unknown
+    """
+    try:
+        object_type = _OBJECTS[spec.tag]
+    except KeyError:
+        raise MapParseException("Unknown object: {}".format(spec.tag))
+
+    # The parameters are already typed by the readers of both formats, so no text is parsed again
+    return object_type.from_params(resource_manager, spec.params)
+
+
+def convert_map(name: str) -> str:
+    """
+    Convert an XML map file into the binary format.
+
+    The binary file is saved next to the XML one.
+
+    :param name: name of the map
+    :return: path to the binary file
+    :raises MapParseException: when the XML file could not be parsed
+    """
+    path_binary = os.path.join(MAPS_DIR, name + EXTENSION_BINARY)
+
+    map_data = read_map_xml(os.path.join(MAPS_DIR, name + EXTENSION_XML))
+    write_map_binary(map_data, path_binary)
+
+    return path_binary
+
+
+def save_map(map_data: MapData, name: str, binary: bool = False) -> str:
+    """
+    Save the map data as a map file.
+
+    :param map_data: map data to save
+    :param name: name of the map
+    :param binary: should the map be saved in the binary format?
+    :return: path to the map file
+    """
+    if binary:
+        path = os.path.join(MAPS_DIR, name + EXTENSION_BINARY)
+        write_map_binary(map_data, path)
+    else:
+        path = os.path.join(MAPS_DIR, name + EXTENSION_XML)
+        write_map_xml(map_data, path)
+
+    return path
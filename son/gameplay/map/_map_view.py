@@ -0,0 +1,81 @@
+from math import floor
+
+from pygame import Rect
+
+from son.core.vectors import VectorInt2D
+from son.gameplay.map._constants import DEFAULT_ZOOM_LEVEL
+from son.gameplay.map._zoom import get_cell_size
+
+
+class MapView:
+    """
+    Part of the map shown on the screen - its scroll delta and zoom level.
+
+    The view is shared by the map and all its cells, so scrolling and zooming do not need to update the cells
+    one by one.
+    """
+
+    __slots__ = ("_delta", "_zoom_level", "_cell_size")
+
+    def __init__(self) -> None:
+        """
+        Initialize MapView.
+        """
+        self._delta: VectorInt2D = (0, 0)
+        self._zoom_level: int = DEFAULT_ZOOM_LEVEL
+        self._cell_size: int = get_cell_size(DEFAULT_ZOOM_LEVEL)
+
+    @property
+    def delta(self) -> VectorInt2D:
+        """
+        Scroll delta of the map in pixels at the current zoom level.
+
+        The delta is rounded down to whole pixels, so that scrolling shifts the drawn map by whole pixels.
+        """
+        return self._delta
+
+    @delta.setter
+    def delta(self, value: VectorInt2D) -> None:
+        self._delta = (floor(value[0]), floor(value[1]))
+
+    @property
+    def zoom_level(self) -> int:
+        """
+        Current zoom level, an index in ZOOM_LEVELS.
+        """
+        return self._zoom_level
+
+    @zoom_level.setter
+    def zoom_level(self, value: int) -> None:
+        self._zoom_level = value
+        self._cell_size = get_cell_size(value)
+
+    @property
+    def cell_size(self) -> int:
+        """
+        Size of a cell in pixels at the current zoom level.
+        """
+        return self._cell_size
+
+    def get_cell_rect(self, grid_pos: VectorInt2D) -> Rect:
+        """
+        Get the rect of a cell on the screen.
+
+        :param grid_pos: position of the cell on the map
+        """
+        grid_pos_x, grid_pos_y = grid_pos
+        delta_x, delta_y = self._delta
+        cell_size = self._cell_size
+        return Rect(grid_pos_x * cell_size - delta_x, grid_pos_y * cell_size - delta_y, cell_size, cell_size)
+
+    def get_grid_pos(self, pos: VectorInt2D) -> VectorInt2D:
+        """
+        Get the position of the cell under a point on the screen.
+
+        The position may be outside of the map.
+
+        :param pos: position of the point on the screen
+        """
+        delta_x, delta_y = self._delta
+        cell_size = self._cell_size
+        return int((pos[0] + delta_x) // cell_size), int((pos[1] + delta_y) // cell_size)
@@ -0,0 +1,240 @@
+import os
+from typing import List, Dict, Optional, BinaryIO
+from xml.etree import ElementTree
+from xml.etree.ElementTree import Element
+
+from son.core.loading import ProgressCallback
+from son.core.vectors import VectorInt2D
+from son.gameplay.map._map_data import MapData, MapObjectSpec, MapParseException
+
+# Version of the parser, it must be increased with every change of the way the map files are parsed
+PARSER_VERSION = 1
+
+# Number of read cells between the progress reports
+_PROGRESS_INTERVAL = 1000
+
+# Max number of missing cell positions listed in the error message
+_MAX_REPORTED_MISSING_CELLS = 10
+
+
+def read_map_xml(path: str, progress: Optional[ProgressCallback] = None) -> MapData:
+    """
+    Read an XML map file.
+
+    The file is read in a single pass. Every cell is stored as soon as its XML element has been read and the element
+    is discarded right after, so the reading time grows linearly with the number of cells and the parsed XML tree
+    is never kept in memory as a whole.
+
+    :param path: path to the map file
+    :param progress: function receiving the progress of reading (optional)
+    :raises MapParseException: when the given file could not be parsed
+    """
+    with open(path, "rb") as file:
+        return _read(file, path, progress)
+
+
+def _read(file: BinaryIO, path: str, progress: Optional[ProgressCallback]) -> MapData:
+    """
+    Read an XML map from the opened file.
+
+    :param file: opened map file
+    :param path: path to the map file
+    :param progress: function receiving the progress of reading (optional)
+    :raises MapParseException: when the given file could not be parsed
+    """
+    file_size = max(os.fstat(file.fileno()).st_size, 1)
+    cells_count = 0
+
+    try:
+        context = ElementTree.iterparse(file, events=("start", "end"))
+
+        # The first event is the start of the root element
+        _, root = next(context)
+        size_x, size_y = _parse_size(root)
+
+        terrain_types: List[str] = list()
+        terrain_ids: Dict[str, int] = dict()
+        terrain_grid = bytearray(size_x * size_y)
+        is_defined = bytearray(size_x * size_y)
+        objects: Dict[VectorInt2D, List[MapObjectSpec]] = dict()
+
+        for event, element in context:
+            if event != "end" or element.tag != "cell":
+                continue
+
+            x, y = _parse_cell_pos(element, size_x, size_y)
+            index = y * size_x + x
+            if is_defined[index]:
+                raise MapParseException("Duplicate cell: {}:{}".format(x, y))
+            is_defined[index] = 1
+
+            terrain = _parse_terrain(element, (x, y))
+            if terrain not in terrain_ids:
+                if len(terrain_types) > 255:
+                    raise MapParseException("Too many terrain types")
+                terrain_ids[terrain] = len(terrain_types)
+                terrain_types.append(terrain)
+            terrain_grid[index] = terrain_ids[terrain]
+
+            map_objects = element.find("./objects")
+            if map_objects is not None and len(map_objects) > 0:
+                objects[(x, y)] = [_parse_object(map_object) for map_object in map_objects]
+
+            # The cell has been consumed - the element and its children are no longer needed
+            root.clear()
+
+            cells_count += 1
+            if progress is not None and cells_count % _PROGRESS_INTERVAL == 0:
+                progress(file.tell() / file_size)
+
+    except ElementTree.ParseError as e:
+        raise MapParseException("Invalid map file '{}': {}".format(path, e))
+
+    _check_missing_cells(is_defined, size_x)
+
+    return MapData((size_x, size_y), terrain_types, terrain_grid, objects)
+
+
+def write_map_xml(map_data: MapData, path: str) -> None:
+    """
+    Write the map data into an XML map file.
+
+    :param map_data: map data to write
+    :param path: path to the map file
+    """
+    size_x, size_y = map_data.size
+    terrain_types = map_data.terrain_types
+    terrain_grid = map_data.terrain_grid
+
+    with open(path, "w", encoding="utf-8") as file:
+        file.write('<?xml version="1.0"?>\n<map size_x="{}" size_y="{}">\n'.format(size_x, size_y))
+
+        for y in range(size_y):
+            lines: List[str] = list()
+            for x in range(size_x):
+                lines.append('    <cell pos_x="{}" pos_y="{}">\n'.format(x, y))
+                lines.append("        <terrain>{}</terrain>\n".format(terrain_types[terrain_grid[y * size_x + x]]))
+
+                specs = map_data.objects.get((x, y))
+                if specs:
+                    lines.append("        <objects>\n")
+                    for spec in specs:
+                        lines.extend(_format_object(spec))
+                    lines.append("        </objects>\n")
+
+                lines.append("    </cell>\n")
+            file.write("".join(lines))
+
+        file.write("</map>")
+
+
+def _format_object(spec: MapObjectSpec) -> List[str]:
+    """
+    Format a map object as XML lines.
+
+    :param spec: spec of the map object
+    """
+    if len(spec.params) == 0:
+        return ["            <{}/>\n".format(spec.tag)]
+
+    lines = ["            <{}>\n".format(spec.tag)]
+    for key, value in spec.params.items():
+        lines.append("                <{0}>{1}</{0}>\n".format(key, value))
+    lines.append("            </{}>\n".format(spec.tag))
+    return lines
+
+
+def _parse_size(root: Element) -> VectorInt2D:
+    """
+    Parse the size of the map from the root element.
+
+    :param root: root element of the map file
+    :raises MapParseException: when the size is missing or invalid
+    """
+    try:
+        size_x = int(root.attrib["size_x"])
+        size_y = int(root.attrib["size_y"])
+    except (KeyError, ValueError):
+        raise MapParseException("Missing or invalid map size")
+
+    if size_x <= 0 or size_y <= 0:
+        raise MapParseException("Invalid map size: {}x{}".format(size_x, size_y))
+
+    return size_x, size_y
+
+
+def _parse_cell_pos(element: Element, size_x: int, size_y: int) -> VectorInt2D:
+    """
+    Parse the position of a cell and check if it lies within the map.
+
+    :param element: XML element of the cell
+    :param size_x: width of the map
+    :param size_y: height of the map
+    :raises MapParseException: when the position is missing, invalid or outside the map
+    """
+    try:
+        x = int(element.attrib["pos_x"])
+        y = int(element.attrib["pos_y"])
+    except (KeyError, ValueError):
+        raise MapParseException("Missing or invalid cell position")
+
+    if not (0 <= x < size_x and 0 <= y < size_y):
+        raise MapParseException("Cell outside of the map: {}:{}".format(x, y))
+
+    return x, y
+
+
+def _parse_terrain(element: Element, pos: VectorInt2D) -> str:
+    """
+    Parse the terrain type of a cell.
+
+    :param element: XML element of the cell
+    :param pos: position of the cell
+    :raises MapParseException: when the terrain is missing
+    """
+    element_terrain = element.find("./terrain")
+    if element_terrain is None or not element_terrain.text:
+        raise MapParseException("Missing terrain in the cell: {}:{}".format(*pos))
+
+    return element_terrain.text
+
+
+def _parse_object(element: Element) -> MapObjectSpec:
+    """
+    Parse a map object.
+
+    Each child element of the object is one of its parameters.
+
+    :param element: XML element of the map object
+    :raises MapParseException: when any of the parameters is not a number
+    """
+    spec = MapObjectSpec(tag=element.tag)
+    for element_param in element:
+        try:
+            spec.params[element_param.tag] = int(element_param.text)
+        except (TypeError, ValueError):
+            raise MapParseException("Invalid parameter '{}' of the object '{}'".format(element_param.tag, element.tag))
+
+    return spec
+
+
+def _check_missing_cells(is_defined: bytearray, size_x: int) -> None:
+    """
+    Check if all cells of the map have been defined.
+
+    :param is_defined: flags telling which cells have been defined, row by row
+    :param size_x: width of the map
+    :raises MapParseException: when any of the cells is missing
+    """
+    missing_count = is_defined.count(0)
+    if missing_count > 0:
+        missing = list()
+        index = is_defined.find(0)
+        while index != -1 and len(missing) < _MAX_REPORTED_MISSING_CELLS:
+            missing.append("{}:{}".format(index % size_x, index // size_x))
+            index = is_defined.find(0, index + 1)
+
+        listed = ", ".join(missing)
+        if missing_count > _MAX_REPORTED_MISSING_CELLS:
+            listed += ", ..."
+        raise MapParseException("Missing {} cell(s): {}".format(missing_count, listed))
@@ -0,0 +1,166 @@
+from typing import List, Dict, Iterable, Tuple, Set
+
+import pygame
+from pygame import Surface
+
+from son.core.vectors import VectorInt2D
+from son.gameplay.map._map_grid import MapGrid
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+Color = Tuple[int, int, int]
+
+
+class MinimapImage:
+    """
+    Image of the whole map with one pixel per cell.
+
+    The color of a cell is the average color of its top map object, or of its terrain when the cell is empty.
+    The image is rendered at once from the terrain ids and the colors of the map objects, with NumPy and surfarray
+    when NumPy is available. After that only the pixels of the changed cells are updated, e.g. when a forest grows
+    or a unit moves, so keeping the image up to date costs time proportional to the number of the changes.
+    The positions of the changed pixels are kept until they are cleared, so that the users of the image can update
+    only the parts derived from them.
+    """
+
+    def __init__(self, grid: MapGrid, terrain_surfaces: List[Surface]) -> None:
+        """
+        Initialize MinimapImage.
+
+        :param grid: grid storing the terrain and the map objects of the cells
+        :param terrain_surfaces: surfaces of the terrain types, indexed by terrain ids
+        """
+        self._grid: MapGrid = grid
+        self._terrain_colors: List[Color] = [_get_average_color(surface) for surface in terrain_surfaces]
+        self._object_colors: Dict[Surface, Color] = dict()
+        self._changed_cells: Set[VectorInt2D] = set()
+
+        self._surface: Surface = self._render()
+
+    @property
+    def surface(self) -> Surface:
+        """
+        Surface of the image, its size is the size of the map in cells.
+
+        The surface must not be modified.
+        """
+        return self._surface
+
+    @property
+    def changed_cells(self) -> Set[VectorInt2D]:
+        """
+        Positions of the cells whose pixels have changed since the last call of clear_changed_cells().
+
+        Any operations on the set will have no effect, since it is a shallow copy.
+        """
+        return self._changed_cells.copy()
+
+    def clear_changed_cells(self) -> None:
+        """
+        Forget the changes of the pixels.
+        """
+        self._changed_cells.clear()
+
+    def update(self, positions: Iterable[VectorInt2D]) -> None:
+        """
+        Update the pixels of the cells under the given positions.
+
+        :param positions: positions of the changed cells
+        """
+        surface = self._surface
+        for pos in positions:
+            color = self._get_cell_color(pos)
+            if surface.get_at(pos)[:3] != color:
+                surface.set_at(pos, color)
+                self._changed_cells.add(pos)
+
+    def _get_cell_color(self, pos: VectorInt2D) -> Color:
+        """
+        Get the color of the pixel of the cell under the given position.
+
+        :param pos: cell position
+        """
+        map_objects = self._grid.get_objects(pos)
+        if len(map_objects) > 0:
+            return self._get_object_color(map_objects[-1].surface)
+        return self._terrain_colors[self._grid.get_terrain_id(pos)]
+
+    def _get_object_color(self, surface: Surface) -> Color:
+        """
+        Get the color representing the given surface of a map object.
+
+        :param surface: surface of a map object
+        """
+        color = self._object_colors.get(surface)
+        if color is None:
+            color = _get_average_color(surface)
+            self._object_colors[surface] = color
+        return color
+
+    def _get_object_pixels(self) -> Tuple[List[int], List[Color]]:
+        """
+        Get the indexes of the cells with any map objects in the arrays and their colors.
+        """
+        size_x = self._grid.size[0]
+        indexes: List[int] = list()
+        colors: List[Color] = list()
+        for x, y in self._grid.index.positions:
+            indexes.append(y * size_x + x)
+            colors.append(self._get_object_color(self._grid.get_objects((x, y))[-1].surface))
+        return indexes, colors
+
+    def _render(self) -> Surface:
+        """
+        Render the image of the whole map.
+        """
+        if numpy is not None:
+            return self._render_numpy()
+        return self._render_bytes()
+
+    def _render_numpy(self) -> Surface:
+        """
+        Render the image with NumPy, the pixels are written to the surface by surfarray.
+        """
+        size_x, size_y = self._grid.size
+        palette = numpy.array(self._terrain_colors, dtype=numpy.uint8)
+        pixels = palette[numpy.frombuffer(self._grid.get_terrain_ids(), dtype=numpy.uint8, count=size_x * size_y)]
+
+        indexes, colors = self._get_object_pixels()
+        if len(indexes) > 0:
+            pixels[indexes] = colors
+
+        surface = Surface((size_x, size_y))
+        # surfarray indexes the pixels by columns first
+        pygame.surfarray.blit_array(surface, pixels.reshape(size_y, size_x, 3).transpose(1, 0, 2))
+        return surface
+
+    def _render_bytes(self) -> Surface:
+        """
+        Render the image in a byte array, used when NumPy is not available.
+        """
+        terrain_ids = bytes(self._grid.get_terrain_ids())
+        pixels = bytearray(3 * len(terrain_ids))
+        # Each color channel is translated from the terrain ids at once
+        for channel in range(3):
+            table = bytes(color[channel] for color in self._terrain_colors)
+            pixels[channel::3] = terrain_ids.translate(table.ljust(256, b"\0"))
+
+        for index, color in zip(*self._get_object_pixels()):
+            pixels[3 * index:3 * index + 3] = bytes(color)
+
+        return pygame.image.frombytes(bytes(pixels), self._grid.size, "RGB")
+
+
+def _get_average_color(surface: Surface) -> Color:
+    """
+    Get the average color of the visible pixels of a surface.
+
+    :param surface: surface
+    """
+    # The opaque surfaces have no alpha channel, their alpha is read as 0
+    consider_alpha = surface.get_flags() & pygame.SRCALPHA != 0
+    color = pygame.transform.average_color(surface, surface.get_rect(), consider_alpha)
+    return color[0], color[1], color[2]
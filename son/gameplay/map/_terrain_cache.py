@@ -0,0 +1,268 @@
+from typing import List, Dict, Set, Tuple, Optional
+
+from pygame import Surface
+
+from son.core.vectors import VectorInt2D
+from son.gameplay.map._constants import (TERRAIN_CHUNK_SIZE, DEFAULT_MAX_TERRAIN_CHUNKS, TERRAIN_BAKE_BATCH,
+                                         ZOOM_LEVELS, DEFAULT_ZOOM_LEVEL)
+from son.gameplay.map._map_grid import MapGrid
+from son.gameplay.map._zoom import get_cell_size, scale_surface
+
+
+class TerrainCache:
+    """
+    Terrain of the map pre-baked into surfaces of square chunks of cells.
+
+    The terrain never changes on its own, so drawing it takes only a few large blits. The chunks are baked ahead
+    of the drawing in small batches, one per frame: first the visible chunks, then the chunks around the view,
+    so that they are ready before scrolling reaches them. A visible chunk that is not baked yet is drawn cell by cell,
+    only in the drawn range of cells, so neither zooming nor scrolling stalls a frame on baking whole chunks.
+    A chunk is baked again only when the terrain of any of its cells changes. When the number of the baked chunks
+    exceeds the limit, the chunks farthest from the view are evicted.
+
+    The chunks are baked for the current zoom level. The lower the zoom level, the more cells a chunk has, so that
+    the number of the chunks covering the view stays about the same.
+    """
+
+    def __init__(self, grid: MapGrid, terrain_surfaces: List[Surface],
+                 max_chunks: int = DEFAULT_MAX_TERRAIN_CHUNKS) -> None:
+        """
+        Initialize TerrainCache.
+
+        :param grid: grid storing the terrain of the cells
+        :param terrain_surfaces: surfaces of the terrain types, indexed by terrain ids
+        :param max_chunks: max number of the baked chunks (the visible chunks are always kept)
+        """
+        self._grid: MapGrid = grid
+        self._terrain_surfaces: List[Surface] = terrain_surfaces
+        self._max_chunks: int = max(1, max_chunks)
+
+        self._zoom_level: int = DEFAULT_ZOOM_LEVEL
+        self._scaled_terrain_surfaces: List[Surface] = terrain_surfaces
+        self._cell_size: int = get_cell_size(DEFAULT_ZOOM_LEVEL)
+        self._chunk_size: int = TERRAIN_CHUNK_SIZE
+
+        self._surfaces: Dict[VectorInt2D, Surface] = dict()
+        # Chunk being baked, its surface and the number of its rows baked so far
+        self._baking: Tuple[VectorInt2D, Surface, int] or None = None
+        # Chunks visible when the terrain was drawn the last time and the chunks around them, the center of the view
+        # in chunks; the chunks are baked only for the last drawn view
+        self._visible_chunks: Set[VectorInt2D] = set()
+        self._kept_chunks: Set[VectorInt2D] = set()
+        self._center: Tuple[float, float] = (0.0, 0.0)
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    @property
+    def zoom_level(self) -> int:
+        """
+        Zoom level the chunks are baked for, an index in ZOOM_LEVELS.
+
+        Changing the zoom level drops all baked chunks.
+        """
+        return self._zoom_level
+
+    @zoom_level.setter
+    def zoom_level(self, value: int) -> None:
+        if value == self._zoom_level:
+            return
+        self._zoom_level = value
+        self._scaled_terrain_surfaces = [scale_surface(surface, value) for surface in self._terrain_surfaces]
+        self._cell_size = get_cell_size(value)
+        self._chunk_size = round(TERRAIN_CHUNK_SIZE / ZOOM_LEVELS[value])
+        self._surfaces.clear()
+        self._baking = None
+        self._visible_chunks = set()
+        self._kept_chunks = set()
+
+    @property
+    def is_baking(self) -> bool:
+        """
+        Are any chunks of the last drawn view or around it left to bake?
+        """
+        return self._baking is not None or self._get_next_chunk() is not None
+
+    def draw(self, destination_surface: Surface, delta: VectorInt2D, first_pos: VectorInt2D,
+             last_pos: VectorInt2D) -> None:
+        """
+        Draw the terrain of the given range of cells.
+
+        :param destination_surface: surface to draw on
+        :param delta: current scroll delta of the map
+        :param first_pos: position of the top left cell of the range
+        :param last_pos: position of the bottom right cell of the range
+        """
+        delta_x, delta_y = delta
+        chunk_size = self._chunk_size
+        chunks_x = range(first_pos[0] // chunk_size, last_pos[0] // chunk_size + 1)
+        chunks_y = range(first_pos[1] // chunk_size, last_pos[1] // chunk_size + 1)
+        chunk_pixel_size = chunk_size * self._cell_size
+
+        blit_sequence: List[Tuple[Surface, VectorInt2D]] = list()
+        for chunk_y in chunks_y:
+            for chunk_x in chunks_x:
+                surface = self._surfaces.get((chunk_x, chunk_y))
+                if surface is not None:
+                    blit_sequence.append((surface, (chunk_x * chunk_pixel_size - delta_x,
+                                                    chunk_y * chunk_pixel_size - delta_y)))
+                else:
+                    # Only the drawn part of the chunk is drawn, the whole chunk is baked later
+                    self._draw_cells(blit_sequence, delta,
+                                     (max(chunk_x * chunk_size, first_pos[0]), max(chunk_y * chunk_size, first_pos[1])),
+                                     (min((chunk_x + 1) * chunk_size - 1, last_pos[0]),
+                                      min((chunk_y + 1) * chunk_size - 1, last_pos[1])))
+        destination_surface.blits(blit_sequence, doreturn=False)
+
+    def set_view(self, first_pos: VectorInt2D, last_pos: VectorInt2D) -> None:
+        """
+        Set the range of the visible cells, the chunks are baked for it.
+
+        :param first_pos: position of the top left visible cell
+        :param last_pos: position of the bottom right visible cell
+        """
+        chunk_size = self._chunk_size
+        chunks_x = range(first_pos[0] // chunk_size, last_pos[0] // chunk_size + 1)
+        chunks_y = range(first_pos[1] // chunk_size, last_pos[1] // chunk_size + 1)
+        visible_chunks = {(chunk_x, chunk_y) for chunk_y in chunks_y for chunk_x in chunks_x}
+        if visible_chunks == self._visible_chunks:
+            return
+
+        self._visible_chunks = visible_chunks
+        self._center = ((chunks_x.start + chunks_x.stop) / 2, (chunks_y.start + chunks_y.stop) / 2)
+
+        # The chunks around the view are baked too, unless they would not fit into the limit together with the view
+        size_x, size_y = self._grid.size
+        last_chunk_x = (size_x - 1) // chunk_size
+        last_chunk_y = (size_y - 1) // chunk_size
+        kept_chunks = {(chunk_x, chunk_y)
+                       for chunk_y in range(max(chunks_y.start - 1, 0), min(chunks_y.stop, last_chunk_y) + 1)
+                       for chunk_x in range(max(chunks_x.start - 1, 0), min(chunks_x.stop, last_chunk_x) + 1)}
+        self._kept_chunks = kept_chunks if len(kept_chunks) <= self._max_chunks else visible_chunks
+
+        if self._baking is not None and self._baking[0] not in self._kept_chunks:
+            self._baking = None
+        self._evict()
+
+    def bake(self, max_cells: int = TERRAIN_BAKE_BATCH) -> None:
+        """
+        Bake the next batch of the cells of the chunks that are visible or around the view.
+
+        The visible chunks are baked first, the nearest to the center of the view first.
+
+        :param max_cells: max number of the baked cells, whole rows of a chunk are baked at least
+        """
+        while max_cells > 0:
+            if self._baking is None:
+                chunk_pos = self._get_next_chunk()
+                if chunk_pos is None:
+                    return
+                self._baking = (chunk_pos, self._create_surface(chunk_pos), 0)
+
+            chunk_pos, surface, baked_rows = self._baking
+            chunk_size = self._chunk_size
+            first_x = chunk_pos[0] * chunk_size
+            first_y = chunk_pos[1] * chunk_size
+            width, height = surface.get_size()
+            cells_x = width // self._cell_size
+            cells_y = height // self._cell_size
+
+            rows = min(max(max_cells // cells_x, 1), cells_y - baked_rows)
+            blit_sequence: List[Tuple[Surface, VectorInt2D]] = list()
+            self._draw_cells(blit_sequence, (first_x * self._cell_size, first_y * self._cell_size),
+                             (first_x, first_y + baked_rows), (first_x + cells_x - 1, first_y + baked_rows + rows - 1))
+            surface.blits(blit_sequence, doreturn=False)
+            max_cells -= rows * cells_x
+
+            if baked_rows + rows < cells_y:
+                self._baking = (chunk_pos, surface, baked_rows + rows)
+            else:
+                self._baking = None
+                self._surfaces[chunk_pos] = surface
+                self._evict()
+
+    def invalidate(self, pos: VectorInt2D) -> None:
+        """
+        Drop the baked chunk with the cell under the given position, so that it is baked again.
+
+        :param pos: cell position
+        """
+        chunk_pos = (pos[0] // self._chunk_size, pos[1] // self._chunk_size)
+        self._surfaces.pop(chunk_pos, None)
+        if self._baking is not None and self._baking[0] == chunk_pos:
+            self._baking = None
+
+    def _get_next_chunk(self) -> Optional[VectorInt2D]:
+        """
+        Get the position of the next chunk to bake or None, when all chunks of the view and around it are baked.
+        """
+        missing_chunks = [chunk_pos for chunk_pos in self._kept_chunks if chunk_pos not in self._surfaces]
+        if len(missing_chunks) == 0:
+            return None
+        return min(missing_chunks, key=lambda chunk_pos: (chunk_pos not in self._visible_chunks,
+                                                          self._get_distance(chunk_pos), chunk_pos))
+
+    def _create_surface(self, chunk_pos: VectorInt2D) -> Surface:
+        """
+        Create an empty surface of a chunk.
+
+        :param chunk_pos: position of the chunk in chunks
+        """
+        size_x, size_y = self._grid.size
+        chunk_size = self._chunk_size
+        cells_x = min(chunk_size, size_x - chunk_pos[0] * chunk_size)
+        cells_y = min(chunk_size, size_y - chunk_pos[1] * chunk_size)
+        # The chunk surface has the same format as the terrain surfaces, so that blitting them is fast
+        return Surface((cells_x * self._cell_size, cells_y * self._cell_size), 0, self._scaled_terrain_surfaces[0])
+
+    def _draw_cells(self, blit_sequence: List[Tuple[Surface, VectorInt2D]], delta: VectorInt2D,
+                    first_pos: VectorInt2D, last_pos: VectorInt2D) -> None:
+        """
+        Add the blits of the terrain of the given range of cells to a blit sequence.
+
+        The terrain ids are read row by row from the grid, not cell by cell.
+
+        :param blit_sequence: blit sequence to extend
+        :param delta: position of the top left corner of the map relative to the destination surface, negated
+        :param first_pos: position of the top left cell of the range
+        :param last_pos: position of the bottom right cell of the range
+        """
+        delta_x, delta_y = delta
+        first_x, first_y = first_pos
+        last_x, last_y = last_pos
+        size_x = self._grid.size[0]
+        cell_size = self._cell_size
+        terrain_surfaces = self._scaled_terrain_surfaces
+        terrain_ids = self._grid.get_terrain_ids()
+        pixels_x = [x * cell_size - delta_x for x in range(first_x, last_x + 1)]
+
+        for y in range(first_y, last_y + 1):
+            pixel_y = y * cell_size - delta_y
+            row = bytes(terrain_ids[y * size_x + first_x:y * size_x + last_x + 1])
+            blit_sequence.extend((terrain_surfaces[terrain_id], (pixel_x, pixel_y))
+                                 for terrain_id, pixel_x in zip(row, pixels_x))
+
+    def _evict(self) -> None:
+        """
+        Evict the chunks farthest from the view until the limit of the baked chunks is kept.
+
+        The visible chunks are never evicted, the chunks around the view only when nothing else is left.
+        """
+        if len(self._surfaces) <= self._max_chunks:
+            return
+
+        hidden_chunks = sorted((chunk_pos for chunk_pos in self._surfaces.keys()
+                                if chunk_pos not in self._visible_chunks),
+                               key=lambda chunk_pos: (chunk_pos not in self._kept_chunks,
+                                                      self._get_distance(chunk_pos)))
+        while len(self._surfaces) > self._max_chunks and len(hidden_chunks) > 0:
+            del self._surfaces[hidden_chunks.pop()]
+
+    def _get_distance(self, chunk_pos: VectorInt2D) -> float:
+        """
+        Get the squared distance of a chunk from the center of the view in chunks.
+
+        :param chunk_pos: position of the chunk in chunks
+        """
+        center_x, center_y = self._center
+        return (chunk_pos[0] - center_x) ** 2 + (chunk_pos[1] - center_y) ** 2
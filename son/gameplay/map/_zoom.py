@@ -0,0 +1,76 @@
+from typing import List, Dict, Tuple
+
+import pygame
+from pygame import Surface
+
+from son.core.vectors import VectorInt2D
+from son.gameplay.map._constants import GRID_CELL_SIZE, ZOOM_LEVELS
+
+
+def get_cell_size(zoom_level: int) -> int:
+    """
+    Get the size of a cell in pixels at the given zoom level.
+
+    :param zoom_level: index of the zoom level in ZOOM_LEVELS
+    """
+    return max(1, round(GRID_CELL_SIZE * ZOOM_LEVELS[zoom_level]))
+
+
+def scale_surface(surface: Surface, zoom_level: int) -> Surface:
+    """
+    Scale a surface drawn for the full size of the cells to the given zoom level.
+
+    The surface itself is returned at the full zoom.
+
+    :param surface: surface to scale
+    :param zoom_level: index of the zoom level in ZOOM_LEVELS
+    """
+    cell_size = get_cell_size(zoom_level)
+    if cell_size == GRID_CELL_SIZE:
+        return surface
+
+    width, height = surface.get_size()
+    return pygame.transform.smoothscale(surface, (max(1, round(width * cell_size / GRID_CELL_SIZE)),
+                                                  max(1, round(height * cell_size / GRID_CELL_SIZE))))
+
+
+class SpriteCache:
+    """
+    Surfaces of the map objects scaled to the zoom levels, together with their offsets in the cells.
+
+    Each surface is scaled only once per zoom level, the first time it is drawn at that level.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize SpriteCache.
+        """
+        self._sprites: List[Dict[Surface, Tuple[Surface, VectorInt2D]]] = [dict() for _ in ZOOM_LEVELS]
+
+    def get_sprites(self, zoom_level: int) -> Dict[Surface, Tuple[Surface, VectorInt2D]]:
+        """
+        Get the scaled surfaces cached for the given zoom level.
+
+        The returned dictionary maps the original surfaces to the scaled ones and their offsets from the top left
+        corner of the cells, which center them in the cells. It must not be modified.
+
+        :param zoom_level: index of the zoom level in ZOOM_LEVELS
+        """
+        return self._sprites[zoom_level]
+
+    def get_sprite(self, surface: Surface, zoom_level: int) -> Tuple[Surface, VectorInt2D]:
+        """
+        Get a surface scaled to the given zoom level and its offset from the top left corner of the cells.
+
+        :param surface: surface drawn for the full size of the cells
+        :param zoom_level: index of the zoom level in ZOOM_LEVELS
+        """
+        sprites = self._sprites[zoom_level]
+        sprite = sprites.get(surface)
+        if sprite is None:
+            scaled_surface = scale_surface(surface, zoom_level)
+            cell_size = get_cell_size(zoom_level)
+            width, height = scaled_surface.get_size()
+            sprite = (scaled_surface, (cell_size // 2 - width // 2, cell_size // 2 - height // 2))
+            sprites[surface] = sprite
+        return sprite
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Dict, Tuple
 
 from pygame import Surface
 from pygame.event import Event
@@ -11,6 +11,9 @@ from son.core.resources import ResourceManager
 from son.core.utils.decorators import override
 from son.gameplay.types import MapObjectInfo
 
+# Info of the static map objects, shared by all objects with the same name
+_STATIC_INFOS: Dict[str, MapObjectInfo] = dict()
+
 
 class MapObject(Lifecycle, ABC):
     """
@@ -18,8 +21,13 @@ class MapObject(Lifecycle, ABC):
 
     Defines the in-game name for the object, provides basic information that can be displayed and implements
     the rendering.
+
+    In the inheriting classes remember to call _update_surface() in the __init__ method once _get_surface() can be
+    called, and again whenever the surface it returns changes.
     """
 
+    __slots__ = ("_name", "_info", "_current_surface")
+
     def __init__(self, name: str) -> None:
         """
         Initialize MapObject.
@@ -28,7 +36,8 @@ class MapObject(Lifecycle, ABC):
         """
 
         self._name: str = name
-        self._info = MapObjectInfo(name=self._name, type="Generic Map Object")
+        self._info: MapObjectInfo = self._create_info()
+        self._current_surface: Surface or None = None
 
     @property
     def info(self) -> MapObjectInfo:
@@ -37,6 +46,13 @@ class MapObject(Lifecycle, ABC):
         """
         return self._info
 
+    @property
+    def surface(self) -> Surface:
+        """
+        Surface currently representing the object on the map.
+        """
+        return self._current_surface
+
     @override
     def draw(self, destination_surface: Surface, *args, **kwargs) -> None:
         # The cell_rect must be passed by the map in the keyword arguments.
@@ -46,7 +62,7 @@ class MapObject(Lifecycle, ABC):
         except KeyError:
             raise TypeError("missing parameter 'cell_rect' when drawing the map object '{}'".format(self._name))
 
-        surface = self._get_surface()
+        surface = self._current_surface
         rect = surface.get_rect()
         rect.center = cell_rect.center
         destination_surface.blit(surface, rect)
@@ -61,6 +77,18 @@ class MapObject(Lifecycle, ABC):
         """
         pass
 
+    def _update_surface(self) -> None:
+        """
+        Update the surface representing the object on the map with the one returned by _get_surface().
+        """
+        self._current_surface = self._get_surface()
+
+    def _create_info(self) -> MapObjectInfo:
+        """
+        Create the MapObjectInfo.
+        """
+        return MapObjectInfo(name=self._name, type="Generic Map Object")
+
     def _update_info(self):
         """
         Update the MapObjectInfo.
@@ -71,29 +99,32 @@ class MapObject(Lifecycle, ABC):
 class ModifiersHolder:
     """
     Class that adds the cell modifiers to an inheriting object.
+
+    The modifiers are defined by the inheriting class in MODIFIERS, so they are shared by all objects of the class.
     """
 
-    def __init__(self) -> None:
-        """
-        Initialize Modifiers Holder
-        """
-        self._modifiers: List[Tuple[str, int]] = list()
+    __slots__ = ()
+
+    MODIFIERS: Tuple[Tuple[str, int], ...] = ()
 
     @property
-    def modifiers(self) -> List[Tuple[str, int]]:
+    def modifiers(self) -> Tuple[Tuple[str, int], ...]:
         """
-        List of the modifiers this map object applies to the map cell where it is placed.
+        Modifiers this map object applies to the map cell where it is placed.
         """
-        return self._modifiers.copy()
+        return self.MODIFIERS
 
 
 class Static(MapObject):
     """
     Simple map object that does not move and is not animated.
 
-    It always renders the resource specified on creation.
+    It always renders the resource specified on creation. Its info never changes, so it is shared by all static
+    objects with the same name.
     """
 
+    __slots__ = ("_surface",)
+
     def __init__(self, name: str, resource: str, resource_manager: ResourceManager) -> None:
         """
         Initialize Static.
@@ -104,16 +135,27 @@ class Static(MapObject):
         """
         super().__init__(name)
         self._surface = resource_manager.get_resource(resource)
+        self._update_surface()
 
     def _get_surface(self) -> Surface:
         return self._surface
 
+    @override
+    def _create_info(self) -> MapObjectInfo:
+        info = _STATIC_INFOS.get(self._name)
+        if info is None:
+            info = super()._create_info()
+            _STATIC_INFOS[self._name] = info
+        return info
+
 
 class StaticModifiersHolder(Static, ModifiersHolder):
     """
     Map object that does not move and is not animated but modifies the cell where it is.
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str, resource: str, resource_manager: ResourceManager) -> None:
         """
         Initialize StaticModifiersHolder.
@@ -123,7 +165,6 @@ class StaticModifiersHolder(Static, ModifiersHolder):
         :param resource_manager: the resource manager
         """
         Static.__init__(self, name, resource, resource_manager)
-        ModifiersHolder.__init__(self)
 
 
 class Movable(MapObject, ABC):
@@ -131,6 +172,8 @@ class Movable(MapObject, ABC):
     Map object that can move on the map.
     """
 
+    __slots__ = ("_max_movement_points", "_movement_points")
+
     def __init__(self, name: str) -> None:
         """
         Initialize Movable.
@@ -1,10 +1,24 @@
+from typing import Dict
+
 from son.core.resources import ResourceManager
 from son.gameplay.map.objects import StaticModifiersHolder
 
 
 class Boulders(StaticModifiersHolder):
-    # TODO args and kwargs can be replaced with xml node argument later. see _forest.py
-    # noinspection PyUnusedLocal
-    def __init__(self, resource_manager: ResourceManager, *args, **kwargs):
+    __slots__ = ()
+
+    MODIFIERS = (("movement_cost", 1),)
+
+    def __init__(self, resource_manager: ResourceManager):
         super().__init__("Boulders", "object.boulders", resource_manager)
-        self._modifiers.append(("movement_cost", 1))
+
+    # noinspection PyUnusedLocal
+    @classmethod
+    def from_params(cls, resource_manager: ResourceManager, params: Dict[str, int]) -> "Boulders":
+        """
+        Create boulders from their parameters read from a map file, the boulders have no parameters.
+
+        :param resource_manager: the resource manager
+        :param params: numeric parameters of the boulders
+        """
+        return cls(resource_manager)
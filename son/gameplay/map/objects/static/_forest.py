@@ -1,6 +1,6 @@
 import random
-from typing import List, Optional
-from xml.etree.ElementTree import Element
+from typing import Tuple, Dict
+from weakref import WeakKeyDictionary
 
 from pygame import Surface
 from pygame.event import Event
@@ -34,28 +34,26 @@ GROWTH_CHANCES = {
     STAGE_OLD: 1
 }
 
+# Surfaces of the growth stages, shared by all forests using the same resource manager
+_SURFACES: "WeakKeyDictionary[ResourceManager, Tuple[Surface, ...]]" = WeakKeyDictionary()
 
-class _ForestParser:
-    """
-    Parser that loads information about the forst game object from an XML node form a map file.
-    """
-
-    def __init__(self, xml_element: Element) -> None:
-        """
-        Initialize forest parser.
 
-        :param xml_element: XML node from a map file
-        """
-        self.density: int = 0
-        self.age_in_turns: int = 0
-
-        element_density: Optional[Element] = xml_element.find("./density")
-        if element_density is not None:
-            self.density = int(element_density.text)
+def _get_surfaces(resource_manager: ResourceManager) -> Tuple[Surface, ...]:
+    """
+    Get the surfaces of the growth stages.
 
-        element_age_in_turns: Optional[Element] = xml_element.find("./age_in_turns")
-        if element_age_in_turns is not None:
-            self.age_in_turns = int(element_age_in_turns.text)
+    :param resource_manager: the resource manager
+    """
+    surfaces = _SURFACES.get(resource_manager)
+    if surfaces is None:
+        surfaces = (
+            resource_manager.get_resource("object.forest_01.stage_1"),
+            resource_manager.get_resource("object.forest_01.stage_2"),
+            resource_manager.get_resource("object.forest_01.stage_3"),
+            resource_manager.get_resource("object.forest_01.stage_4")
+        )
+        _SURFACES[resource_manager] = surfaces
+    return surfaces
 
 
 class _ForestStats:
@@ -63,26 +61,24 @@ class _ForestStats:
     Stats of the forest map object.
     """
 
-    def __init__(self, xml_parser: Optional[_ForestParser] = None) -> None:
+    __slots__ = ("_density", "_age_in_turns", "_cached_age", "_cached_growth_stage")
+
+    def __init__(self, density: int = 0, age_in_turns: int = 0) -> None:
         """
         Initialize forest stats.
 
-        :param xml_parser: object with parsed XML data from a map file (optional)
+        :param density: density of the forest in percents (0% - 100%)
+        :param age_in_turns: age of the forest in turns
         """
-        self._density: int = 0
-        self._age_in_turns: int = 0
+        self._density: int = density
+        self._age_in_turns: int = age_in_turns
 
         # Cached
         self._cached_age = 0
         self._cached_growth_stage = STAGE_YOUNG
 
-        # Parse stats from XML values
-        if xml_parser is not None:
-            self._density = xml_parser.density
-            self._age_in_turns = xml_parser.age_in_turns
-
-            self._update_cached_growth_stage()
-            self._update_cached_age()
+        self._update_cached_growth_stage()
+        self._update_cached_age()
 
     @property
     def density(self) -> int:
@@ -170,32 +166,36 @@ class Forest(MapObject, ModifiersHolder):
     Forest game object.
     """
 
-    def __init__(self, resource_manager: ResourceManager, xml_element: Optional[Element] = None) -> None:
+    __slots__ = ("_stats", "_surfaces")
+
+    MODIFIERS = (("movement_cost", 2),)
+
+    def __init__(self, resource_manager: ResourceManager, density: int = 0, age_in_turns: int = 0) -> None:
         """
         Initialize Forest.
 
         :param resource_manager: the resource manager
-        :param xml_element: XML node from a map file (optional)
+        :param density: density of the forest in percents (0% - 100%)
+        :param age_in_turns: age of the forest in turns
         """
         MapObject.__init__(self, "Forest")
-        ModifiersHolder.__init__(self)
 
-        self._modifiers.append(("movement_cost", 2))
+        self._stats: _ForestStats = _ForestStats(density, age_in_turns)
 
-        parser: Optional[_ForestParser] = None
-        if xml_element is not None:
-            parser = _ForestParser(xml_element)
+        self._surfaces: Tuple[Surface, ...] = _get_surfaces(resource_manager)
 
-        self._stats: _ForestStats = _ForestStats(parser)
+        self._update_surface()
+        self._update_info()
 
-        self._surfaces: List[Surface] = [
-            resource_manager.get_resource("object.forest_01.stage_1"),
-            resource_manager.get_resource("object.forest_01.stage_2"),
-            resource_manager.get_resource("object.forest_01.stage_3"),
-            resource_manager.get_resource("object.forest_01.stage_4")
-        ]
+    @classmethod
+    def from_params(cls, resource_manager: ResourceManager, params: Dict[str, int]) -> "Forest":
+        """
+        Create a forest from its parameters read from a map file.
 
-        self._update_info()
+        :param resource_manager: the resource manager
+        :param params: numeric parameters of the forest, the missing ones get the default values
+        """
+        return cls(resource_manager, density=params.get("density", 0), age_in_turns=params.get("age_in_turns", 0))
 
     def _get_surface(self) -> Surface:
         return self._surfaces[self._stats.growth_stage]
@@ -203,6 +203,7 @@ class Forest(MapObject, ModifiersHolder):
     def handle_event(self, event: Event, *args, **kwargs) -> bool:
         if event.type == START_TURN:
             self._stats.update_on_new_turn(event.info)
+            self._update_surface()
             self._update_info()
         return False
 
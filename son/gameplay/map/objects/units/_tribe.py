@@ -1,3 +1,5 @@
+from typing import Dict
+
 from pygame import Surface
 
 from son.core.resources import ResourceManager
@@ -5,11 +7,12 @@ from son.gameplay.map.objects._base import Movable
 
 
 class Tribe(Movable):
-    # TODO args and kwargs can be replaced with xml node argument later. see _forest.py
-    # noinspection PyUnusedLocal
-    def __init__(self, resource_manager: ResourceManager, *args, **kwargs) -> None:
+    __slots__ = ("_surface",)
+
+    def __init__(self, resource_manager: ResourceManager) -> None:
         super().__init__("Tribe")
         self._surface = resource_manager.get_resource("unit.tribe")
+        self._update_surface()
 
         # Set the defaults for movement.
         self._max_movement_points = 5
@@ -18,5 +21,16 @@ class Tribe(Movable):
         # Update the info object with the new defaults.
         self._update_info()
 
+    # noinspection PyUnusedLocal
+    @classmethod
+    def from_params(cls, resource_manager: ResourceManager, params: Dict[str, int]) -> "Tribe":
+        """
+        Create a tribe from its parameters read from a map file, the tribes have no parameters yet.
+
+        :param resource_manager: the resource manager
+        :param params: numeric parameters of the tribe
+        """
+        return cls(resource_manager)
+
     def _get_surface(self) -> Surface:
         return self._surface
@@ -1,18 +1,22 @@
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import List
 
+from son.core.observable import ObservableDict
 
-@dataclass
+
+@dataclass(slots=True)
 class MapObjectInfo:
     """
     Info about a map object.
+
+    The attributes notify their observers when they change, so that the UI can show them without polling.
     """
     name: str
     type: str
-    attributes: Dict[str, str] = field(default_factory=dict)
+    attributes: ObservableDict = field(default_factory=ObservableDict)
 
 
-@dataclass
+@dataclass(slots=True)
 class CellInfo:
     """
     Info about a map cell.
@@ -23,7 +27,7 @@ class CellInfo:
     objects: List[MapObjectInfo]
 
 
-@dataclass
+@dataclass(slots=True)
 class MapInfo:
     """
     Info about the current state of a map.
@@ -31,7 +35,7 @@ class MapInfo:
     focused_cell_info: CellInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnInfo:
     """
     Info about the current turn.
@@ -86,7 +86,7 @@ class UICellInfoController(UISubcontroller):
         """
         self._info = cell_info
 
-        if self._box in self._owner.widgets:
+        if self._owner.has_widget(self._box):
             self._owner.remove_widget(self._box)
 
         if self._info is not None:
@@ -97,7 +97,7 @@ class UICellInfoController(UISubcontroller):
         """
         Hide the box.
         """
-        if self._box in self._owner.widgets:
+        if self._owner.has_widget(self._box):
             self._owner.remove_widget(self._box)
 
     @staticmethod
@@ -1,9 +1,12 @@
 from pygame.event import Event
 
+from son.core.event_bus import EventBus
 from son.core.events import SHOW_CELL_INFO, SHOW_MAP_OBJECT_INFO, HIDE_MAP_OBJECT_INFO
 from son.core.ui.controller import UIController
 from son.core.utils.decorators import override
+from son.gameplay.map import MinimapImage
 from son.gameplay.ui._cell_info_controller import UICellInfoController
+from son.gameplay.ui._minimap_controller import UIMinimapController
 from son.gameplay.ui._top_bar_controller import UITopBarController
 from son.gameplay.ui._unit_info_controller import UIUnitInfoController
 
@@ -13,9 +16,11 @@ class UIGameplayController(UIController):
     UI Controller for the gameplay scene.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, minimap: MinimapImage) -> None:
         """
         Initialize UIGameplayController.
+
+        :param minimap: image of the map shown by the minimap
         """
         super().__init__()
 
@@ -23,34 +28,36 @@ class UIGameplayController(UIController):
         self._top_bar_controller = UITopBarController(self)
         self._cell_info_controller = UICellInfoController(self)
         self._unit_info_controller = UIUnitInfoController(self)
+        self._minimap_controller = UIMinimapController(self, minimap)
 
         # Add subcontrollers to the list
         self._subcontrollers.append(self._top_bar_controller)
         self._subcontrollers.append(self._cell_info_controller)
         self._subcontrollers.append(self._unit_info_controller)
+        self._subcontrollers.append(self._minimap_controller)
 
     @override
-    def handle_event(self, event: Event, *args, **kwargs) -> bool:
-        if super().handle_event(event, *args, **kwargs):
-            return True
+    def subscribe(self, event_bus: EventBus, priority: int = 0) -> None:
+        super().subscribe(event_bus, priority)
+        event_bus.subscribe(SHOW_MAP_OBJECT_INFO, self._on_show_map_object_info, priority)
+        event_bus.subscribe(HIDE_MAP_OBJECT_INFO, self._on_hide_map_object_info, priority)
+        event_bus.subscribe(SHOW_CELL_INFO, self._on_show_cell_info, priority)
 
+    def _on_show_map_object_info(self, event: Event) -> bool:
         # A map object has been selected - we show the info panel.
         # TODO For now only one kind of info box can be shown - unit info.
         #  When more map object come, the appropriate info box should be shown according to the type of the object.
-        if event.type == SHOW_MAP_OBJECT_INFO:
-            map_object_type = event.map_object_info.type
-            if map_object_type == "Unit":
-                self._unit_info_controller.show_box(event.map_object_info)
-            return True
+        map_object_type = event.map_object_info.type
+        if map_object_type == "Unit":
+            self._unit_info_controller.show_box(event.map_object_info)
+        return True
 
+    def _on_hide_map_object_info(self, event: Event) -> bool:
         # No map object selected - we hide the info panel.
-        if event.type == HIDE_MAP_OBJECT_INFO:
-            self._unit_info_controller.hide_box()
-            return True
+        self._unit_info_controller.hide_box()
+        return True
 
+    def _on_show_cell_info(self, event: Event) -> bool:
         # A map cell has been selected - we show the info box.
-        if event.type == SHOW_CELL_INFO:
-            self._cell_info_controller.show_box(event.cell_info, event.pos)
-            return True
-
-        return False
+        self._cell_info_controller.show_box(event.cell_info, event.pos)
+        return True
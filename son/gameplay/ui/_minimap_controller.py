@@ -0,0 +1,163 @@
+from math import gcd
+from typing import Iterable, Set
+
+import pygame
+from pygame import Surface, Rect
+from pygame.event import Event
+
+from son.core.event_bus import EventBus
+from son.core.events import EDGE_SCROLL, ZOOM, CENTER_VIEW
+from son.core.ui.constants import COLOR_BORDER
+from son.core.ui.controller import UIController, UISubcontroller
+from son.core.ui.widgets import Box, Image
+from son.core.utils.decorators import override
+from son.core.vectors import VectorInt2D
+from son.gameplay.map import MinimapImage, DEFAULT_ZOOM_LEVEL, get_cell_size
+
+# Max size of the minimap in pixels
+MINIMAP_SIZE = 200
+# Space between the minimap and the edges of the window
+MINIMAP_MARGIN = 20
+
+
+class UIMinimapController(UISubcontroller):
+    """
+    Controller of the minimap in the bottom right corner of the window.
+
+    The minimap shows the whole map with a block of pixels per cell, or with a pixel per several cells for the big
+    maps, and the rectangle of the part of the map in the view. Clicking the minimap centers the view on the clicked
+    cell.
+
+    The image of the map is scaled once. After that only the blocks of pixels of the changed cells are filled again
+    when the map is enlarged, or only the tiles with the changed cells are scaled again when it is shrunk. The edges
+    of the tiles fall on the edges of the cells, so a tile scaled on its own has the same pixels, up to the rounding,
+    as when the whole image is scaled. Moving the view only draws the scaled image and the rectangle again.
+    """
+
+    def __init__(self, owner: UIController, minimap: MinimapImage) -> None:
+        """
+        Initialize UIMinimapController.
+
+        :param owner: UIController that governs this subcontroller
+        :param minimap: image of the map with one pixel per cell
+        """
+        super().__init__(owner)
+        self._minimap: MinimapImage = minimap
+        self._map_size: VectorInt2D = minimap.surface.get_size()
+        self._resolution: VectorInt2D = pygame.display.get_window_size()
+
+        self._delta: VectorInt2D = (0, 0)
+        self._cell_size: int = get_cell_size(DEFAULT_ZOOM_LEVEL)
+
+        # Pixels of the minimap per cell, the small maps are enlarged by whole blocks of pixels
+        map_size_x, map_size_y = self._map_size
+        scale = MINIMAP_SIZE / max(map_size_x, map_size_y)
+        if scale >= 1.0:
+            scale = float(int(scale))
+        self._scale: float = scale
+        self._size: VectorInt2D = (max(1, round(map_size_x * scale)), max(1, round(map_size_y * scale)))
+
+        # Size of the tiles scaled on their own in cells and in pixels of the minimap
+        size_x, size_y = self._size
+        divisor_x, divisor_y = gcd(map_size_x, size_x), gcd(map_size_y, size_y)
+        self._tile_cells: VectorInt2D = (map_size_x // divisor_x, map_size_y // divisor_y)
+        self._tile_size: VectorInt2D = (size_x // divisor_x, size_y // divisor_y)
+
+        self._scaled_surface: Surface = self._scale_minimap()
+        minimap.clear_changed_cells()
+
+        # The image of the minimap is drawn on the same surface each time, which is then set to the widget again
+        self._image_surface: Surface = Surface(self._size)
+        self._image: Image = Image(self._size)
+        self._update_image()
+        self._image.register_on_click(self._image_on_click)
+
+        self._box: Box = Box()
+        self._box.add_widget(self._image)
+        box_width, box_height = self._box.rect.size
+        self._box.pos = (self._resolution[0] - box_width - MINIMAP_MARGIN,
+                         self._resolution[1] - box_height - MINIMAP_MARGIN)
+
+        self._owner.add_widget(self._box)
+
+    @override
+    def update(self, *args, **kwargs) -> None:
+        changed_cells = self._minimap.changed_cells
+        if len(changed_cells) > 0:
+            self._minimap.clear_changed_cells()
+            self._update_scaled_surface(changed_cells)
+            self._update_image()
+
+    @override
+    def subscribe(self, event_bus: EventBus, priority: int = 0) -> None:
+        event_bus.subscribe(EDGE_SCROLL, self._on_edge_scroll, priority)
+        event_bus.subscribe(ZOOM, self._on_zoom, priority)
+
+    def _on_edge_scroll(self, event: Event) -> bool:
+        # The view is moved by the edge scrolling controller, the minimap only follows it
+        if event.delta != self._delta:
+            self._delta = event.delta
+            self._update_image()
+        return False
+
+    def _on_zoom(self, event: Event) -> bool:
+        self._delta = event.delta
+        self._cell_size = get_cell_size(event.zoom_level)
+        self._update_image()
+        return False
+
+    def _scale_minimap(self) -> Surface:
+        """
+        Scale the image of the map to the size of the minimap.
+        """
+        if self._scale >= 1.0:
+            return pygame.transform.scale(self._minimap.surface, self._size)
+        return pygame.transform.smoothscale(self._minimap.surface, self._size)
+
+    def _update_scaled_surface(self, changed_cells: Iterable[VectorInt2D]) -> None:
+        """
+        Update the pixels of the scaled image of the map derived from the changed cells.
+
+        :param changed_cells: positions of the cells whose pixels have changed
+        """
+        source_surface = self._minimap.surface
+        if self._scale >= 1.0:
+            block_size = int(self._scale)
+            for x, y in changed_cells:
+                self._scaled_surface.fill(source_surface.get_at((x, y)),
+                                          (x * block_size, y * block_size, block_size, block_size))
+            return
+
+        tile_cells_x, tile_cells_y = self._tile_cells
+        tile_size_x, tile_size_y = self._tile_size
+        tiles: Set[VectorInt2D] = {(x // tile_cells_x, y // tile_cells_y) for x, y in changed_cells}
+        for tile_x, tile_y in tiles:
+            tile_rect = Rect(tile_x * tile_cells_x, tile_y * tile_cells_y, tile_cells_x, tile_cells_y)
+            self._scaled_surface.blit(pygame.transform.smoothscale(source_surface.subsurface(tile_rect),
+                                                                   self._tile_size),
+                                      (tile_x * tile_size_x, tile_y * tile_size_y))
+
+    def _update_image(self) -> None:
+        """
+        Draw the scaled image of the map and the rectangle of the view in the image of the minimap.
+        """
+        surface = self._image_surface
+        surface.blit(self._scaled_surface, (0, 0))
+
+        scale = self._scale / self._cell_size
+        delta_x, delta_y = self._delta
+        view_rect = Rect(round(delta_x * scale), round(delta_y * scale),
+                         max(1, round(self._resolution[0] * scale)), max(1, round(self._resolution[1] * scale)))
+        pygame.draw.rect(surface, COLOR_BORDER, view_rect, width=1)
+
+        self._image.image = surface
+
+    def _image_on_click(self, pos: VectorInt2D) -> None:
+        """
+        Callback method for the minimap image, it centers the view on the clicked cell.
+
+        :param pos: position of the click within the image
+        """
+        map_size_x, map_size_y = self._map_size
+        grid_pos = (min(int(pos[0] / self._scale), map_size_x - 1), min(int(pos[1] / self._scale), map_size_y - 1))
+        pygame.event.post(Event(CENTER_VIEW, {"grid_pos": grid_pos}))
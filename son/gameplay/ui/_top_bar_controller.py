@@ -1,6 +1,7 @@
 import pygame
 from pygame.event import Event
 
+from son.core.event_bus import EventBus
 from son.core.events import END_TURN, START_TURN
 from son.core.ui.controller import UIController, UISubcontroller
 from son.core.ui.widgets import Box, Label, Button
@@ -49,10 +50,12 @@ class UITopBarController(UISubcontroller):
         self._owner.add_widget(self._box)
 
     @override
-    def handle_event(self, event: Event, *args, **kwargs) -> bool:
+    def subscribe(self, event_bus: EventBus, priority: int = 0) -> None:
+        event_bus.subscribe(START_TURN, self._on_start_turn, priority)
+
+    def _on_start_turn(self, event: Event) -> bool:
         # When a new turn starts, we have to update the info.
-        if event.type == START_TURN:
-            self.update_info(event.info)
+        self.update_info(event.info)
         return False
 
     def update_info(self, info: TurnInfo) -> None:
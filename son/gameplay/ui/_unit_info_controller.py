@@ -2,7 +2,6 @@ from typing import Optional
 
 from son.core.ui.controller import UIController, UISubcontroller
 from son.core.ui.widgets import Box, Label
-from son.core.utils.decorators import override
 from son.gameplay.types import MapObjectInfo
 
 
@@ -23,11 +22,6 @@ class UIUnitInfoController(UISubcontroller):
         self._box: Optional[Box] = None
         self._label_movement: Optional[Label] = None
 
-    @override
-    def update(self, *args, **kwargs) -> None:
-        if self._info is not None:
-            self._label_movement.text = self._info.attributes["movement"]
-
     def show_box(self, map_object_info: MapObjectInfo) -> None:
         """
         Show the box on the screen.
@@ -37,8 +31,7 @@ class UIUnitInfoController(UISubcontroller):
 
         self._info = map_object_info
 
-        if self._box in self._owner.widgets:
-            self._owner.remove_widget(self._box)
+        self.hide_box()
 
         if self._info is not None:
             self._create_box()
@@ -65,9 +58,9 @@ class UIUnitInfoController(UISubcontroller):
         label_movement_text.pos = (0, next_pos_y)
         self._box.add_widget(label_movement_text)
 
-        # Label: movement - value
+        # Label: movement - value, it follows the changes of the movement points
         self._label_movement = Label()
-        self._label_movement.text = self._info.attributes["movement"]
+        self._label_movement.bind(self._info.attributes, "movement")
         self._label_movement.pos = (100, next_pos_y)
         self._box.add_widget(self._label_movement)
 
@@ -75,5 +68,8 @@ class UIUnitInfoController(UISubcontroller):
         """
         Hide the box.
         """
-        if self._box in self._owner.widgets:
+        if self._label_movement is not None:
+            self._label_movement.unbind()
+
+        if self._owner.has_widget(self._box):
             self._owner.remove_widget(self._box)
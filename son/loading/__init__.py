@@ -0,0 +1,5 @@
+from son.loading._scene import SceneLoading
+
+__all__ = [
+    "SceneLoading"
+]
@@ -0,0 +1,29 @@
+from pygame import Surface
+
+from son.core.loading import LoadingTask
+from son.core.scenes import SceneLoadingBase
+from son.core.utils.decorators import override
+from son.loading._ui import LoadingUIController
+
+
+class SceneLoading(SceneLoadingBase):
+    """
+    Scene: Loading.
+
+    Shown while the data of the next scene is loaded on a worker thread.
+    """
+
+    def __init__(self, task: LoadingTask) -> None:
+        super().__init__(task)
+
+        self._ui_controller = LoadingUIController()
+
+    @override
+    def update(self, *args, **kwargs) -> None:
+        self._ui_controller.update_progress(self._task.progress, self._task.description)
+        self._ui_controller.update(*args, **kwargs)
+
+    @override
+    def draw(self, destination_surface: Surface, *args, **kwargs) -> None:
+        destination_surface.fill((0, 0, 0))
+        self._ui_controller.draw(destination_surface, *args, **kwargs)
@@ -0,0 +1,38 @@
+from son.core.ui.controller import UIController
+from son.core.ui.widgets import Box, Label, ProgressBar
+
+
+class LoadingUIController(UIController):
+    """
+    UI Controller for the scene loading.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        box = Box()
+        box.pos = (50, 50)
+
+        self._label = Label()
+        self._label.text = "Loading..."
+        self._label.pos = (0, 0)
+
+        self._progress_bar = ProgressBar()
+        self._progress_bar.pos = (0, 30)
+
+        box.add_widget(self._label)
+        box.add_widget(self._progress_bar)
+
+        self.add_widget(box)
+
+    def update_progress(self, progress: float, description: str) -> None:
+        """
+        Update the shown progress of loading.
+
+        :param progress: progress of loading (0.0 - 1.0)
+        :param description: description of what is being loaded
+        """
+        text = "Loading {}...".format(description) if description else "Loading..."
+        if text != self._label.text:
+            self._label.text = text
+        self._progress_bar.value = progress
@@ -1,4 +1,6 @@
-from pygame import Surface
+from typing import List, Optional
+
+from pygame import Surface, Rect
 from pygame.event import Event
 
 from son.core.scenes import SceneBase
@@ -28,6 +30,16 @@ class SceneMainMenu(SceneBase):
     def handle_event(self, event: Event, *args, **kwargs) -> None:
         self._ui_controller.handle_event(event, *args, **kwargs)
 
+    @override
+    def get_dirty_rects(self) -> Optional[List[Rect]]:
+        return self._ui_controller.get_dirty_rects()
+
+    @property
+    @override
+    def is_idle(self) -> bool:
+        # The menu changes only on the input
+        return True
+
     @override
     def draw(self, destination_surface: Surface, *args, **kwargs) -> None:
         destination_surface.fill((0, 0, 0))
@@ -0,0 +1,64 @@
+import random
+
+import pygame
+import pytest
+from pygame import Rect
+from pygame.event import Event
+from pygame.locals import USEREVENT
+
+from son._app import SpiritOfNationsApp, _merge_rects, MAX_MERGE_OVERDRAW
+
+
+def _covers(merged_rects, rect: Rect) -> bool:
+    return any(merged_rect.contains(rect) for merged_rect in merged_rects)
+
+
+def test_merge_rects_covers_all_rects():
+    generator = random.Random(1)
+    for _ in range(100):
+        rects = [Rect(generator.randrange(1280), generator.randrange(720), generator.randrange(1, 200),
+                      generator.randrange(1, 200)) for _ in range(generator.randrange(1, 20))]
+        merged_rects = _merge_rects(rects)
+
+        assert len(merged_rects) <= len(rects)
+        assert all(_covers(merged_rects, rect) for rect in rects)
+
+
+def test_merge_rects_merges_near_rects():
+    assert _merge_rects([Rect(0, 0, 10, 10), Rect(10, 0, 10, 10)]) == [Rect(0, 0, 20, 10)]
+
+
+def test_merge_rects_keeps_distant_rects():
+    rects = [Rect(0, 0, 10, 10), Rect(1000, 600, 10, 10)]
+    assert _merge_rects(rects) == rects
+
+
+def test_merge_rects_limits_overdraw():
+    side = int(MAX_MERGE_OVERDRAW ** 0.5)
+    # The gap between the squares adds just MAX_MERGE_OVERDRAW pixels, one column wider gap adds more
+    assert len(_merge_rects([Rect(0, 0, side, side), Rect(2 * side, 0, side, side)])) == 1
+    assert len(_merge_rects([Rect(0, 0, side, side), Rect(2 * side + 1, 0, side, side)])) == 2
+
+
+def test_merge_rects_merges_again_after_growing():
+    # The last rect joins the first one, which then reaches the second one
+    rects = [Rect(0, 0, 50, 50), Rect(200, 0, 50, 50), Rect(50, 0, 150, 50)]
+    assert _merge_rects(rects) == [Rect(0, 0, 250, 50)]
+
+
+@pytest.mark.filterwarnings("ignore:no fast renderer")
+def test_waited_event_handled_first(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    app = SpiritOfNationsApp((320, 240))
+    handled_events = list()
+    monkeypatch.setattr(app._scene_manager, "handle_event", lambda event: handled_events.append(event.type))
+
+    pygame.event.clear()
+    # The first event ends the waiting, the second one is already in the queue behind it
+    pygame.event.post(Event(USEREVENT))
+    pygame.event.post(Event(USEREVENT + 1))
+    app._wait_for_event()
+
+    assert app.handle_events() == 2
+    assert handled_events == [USEREVENT, USEREVENT + 1]
+    pygame.quit()
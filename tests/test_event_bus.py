@@ -0,0 +1,75 @@
+import pytest
+from pygame.event import Event
+from pygame.locals import USEREVENT, KEYDOWN
+
+from son.core.event_bus import EventBus
+
+
+def _create_handler(calls: list, name: str, consumes: bool = False):
+    def handler(event: Event) -> bool:
+        calls.append(name)
+        return consumes
+    return handler
+
+
+def test_priority_order():
+    event_bus = EventBus()
+    calls = list()
+    event_bus.subscribe(USEREVENT, _create_handler(calls, "low"), -1)
+    event_bus.subscribe(USEREVENT, _create_handler(calls, "first"))
+    event_bus.subscribe(USEREVENT, _create_handler(calls, "high"), 2)
+    event_bus.subscribe(USEREVENT, _create_handler(calls, "second"))
+
+    assert not event_bus.dispatch(Event(USEREVENT))
+    assert calls == ["high", "first", "second", "low"]
+
+
+def test_consumed_event_not_passed_further():
+    event_bus = EventBus()
+    calls = list()
+    event_bus.subscribe(USEREVENT, _create_handler(calls, "low"), 0)
+    event_bus.subscribe(USEREVENT, _create_handler(calls, "high", consumes=True), 1)
+
+    assert event_bus.dispatch(Event(USEREVENT))
+    assert calls == ["high"]
+
+
+def test_dispatch_by_type():
+    event_bus = EventBus()
+    calls = list()
+    event_bus.subscribe((USEREVENT, KEYDOWN), _create_handler(calls, "both"))
+    event_bus.subscribe(KEYDOWN, _create_handler(calls, "key"))
+
+    event_bus.dispatch(Event(USEREVENT))
+    assert calls == ["both"]
+    assert not event_bus.dispatch(Event(USEREVENT + 1))
+    assert not event_bus.has_subscribers(USEREVENT + 1)
+
+
+def test_unsubscribe():
+    event_bus = EventBus()
+    calls = list()
+    handler = _create_handler(calls, "handler")
+    event_bus.subscribe((USEREVENT, KEYDOWN), handler)
+    event_bus.unsubscribe(USEREVENT, handler)
+
+    event_bus.dispatch(Event(USEREVENT))
+    assert calls == []
+    assert not event_bus.has_subscribers(USEREVENT)
+    assert event_bus.has_subscribers(KEYDOWN)
+    with pytest.raises(ValueError):
+        event_bus.unsubscribe(USEREVENT, handler)
+
+
+def test_subscribe_while_dispatching():
+    event_bus = EventBus()
+    calls = list()
+
+    def handler(event: Event) -> bool:
+        calls.append("handler")
+        event_bus.subscribe(USEREVENT, _create_handler(calls, "new"))
+        return False
+
+    event_bus.subscribe(USEREVENT, handler)
+    event_bus.dispatch(Event(USEREVENT))
+    assert calls == ["handler"]
@@ -0,0 +1,80 @@
+import os
+
+from son.gameplay.map import _map_cache
+from son.gameplay.map._map_cache import read_map_xml_cached
+
+_MAP_XML = '<map size_x="2" size_y="1">{}</map>'
+_CELL_XML = '<cell pos_x="{}" pos_y="0"><terrain>{}</terrain></cell>'
+
+
+def _write_map(path, terrain: str = "grassland") -> str:
+    path.write_text(_MAP_XML.format(_CELL_XML.format(0, terrain) + _CELL_XML.format(1, terrain)), encoding="utf-8")
+    return str(path)
+
+
+def _read(path: str, cache_dir: str) -> bool:
+    map_data = read_map_xml_cached(path, cache_dir)
+    try:
+        return map_data.is_from_cache
+    finally:
+        map_data.close()
+
+
+def test_cache_hit(tmp_path):
+    path = _write_map(tmp_path / "map.map")
+    cache_dir = str(tmp_path / "cache")
+
+    assert not _read(path, cache_dir)
+    assert _read(path, cache_dir)
+
+
+def test_cache_miss_on_changed_content(tmp_path):
+    path = _write_map(tmp_path / "map.map")
+    cache_dir = str(tmp_path / "cache")
+    _read(path, cache_dir)
+
+    _write_map(tmp_path / "map.map", "water")
+    map_data = read_map_xml_cached(path, cache_dir)
+    try:
+        assert not map_data.is_from_cache
+        assert map_data.get_terrain_type((0, 0)) == "water"
+    finally:
+        map_data.close()
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_cache_miss_on_changed_parser_version(tmp_path, monkeypatch):
+    path = _write_map(tmp_path / "map.map")
+    cache_dir = str(tmp_path / "cache")
+    _read(path, cache_dir)
+
+    monkeypatch.setattr(_map_cache, "PARSER_VERSION", _map_cache.PARSER_VERSION + 1)
+    assert not _read(path, cache_dir)
+    assert _read(path, cache_dir)
+
+
+def test_cache_keeps_entries_of_other_maps(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    paths = [_write_map(tmp_path / "a.map"), _write_map(tmp_path / "a.b.map")]
+    os.mkdir(tmp_path / "other")
+    paths.append(_write_map(tmp_path / "other" / "a.map", "water"))
+
+    for path in paths:
+        _read(path, cache_dir)
+
+    assert len(os.listdir(cache_dir)) == 3
+    assert all(_read(path, cache_dir) for path in paths)
+
+
+def test_cache_written_when_outdated_entry_not_removed(tmp_path, monkeypatch):
+    path = _write_map(tmp_path / "map.map")
+    cache_dir = str(tmp_path / "cache")
+    _read(path, cache_dir)
+    _write_map(tmp_path / "map.map", "water")
+
+    def remove(entry_path: str) -> None:
+        raise PermissionError(entry_path)
+
+    monkeypatch.setattr(_map_cache.os, "remove", remove)
+    assert not _read(path, cache_dir)
+    assert _read(path, cache_dir)
@@ -0,0 +1,106 @@
+import struct
+
+import pytest
+
+from son.gameplay.map._map_binary import read_map_binary, write_map_binary, MAGIC, FORMAT_VERSION
+from son.gameplay.map._map_data import MapData, MapObjectSpec, MapParseException
+from son.gameplay.map._map_xml import read_map_xml, write_map_xml
+
+
+def _create_map_data() -> MapData:
+    terrain_grid = bytearray([0, 1, 0,
+                              1, 1, 0])
+    objects = {
+        (0, 0): [MapObjectSpec("tribe")],
+        (2, 1): [MapObjectSpec("forest", {"density": 7, "age_in_turns": 3}), MapObjectSpec("boulders")]
+    }
+    return MapData((3, 2), ["grassland", "water"], terrain_grid, objects)
+
+
+def _write_xml(path, cells, size="3x1") -> str:
+    size_x, size_y = size.split("x")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write('<map size_x="{}" size_y="{}">{}</map>'.format(size_x, size_y, "".join(
+            '<cell pos_x="{}" pos_y="{}"><terrain>grassland</terrain></cell>'.format(x, y) for x, y in cells)))
+    return str(path)
+
+
+def _assert_equal(map_data: MapData, expected: MapData) -> None:
+    assert map_data.size == expected.size
+    for y in range(expected.size[1]):
+        for x in range(expected.size[0]):
+            assert map_data.get_terrain_type((x, y)) == expected.get_terrain_type((x, y))
+    assert map_data.objects == expected.objects
+
+
+def test_xml_binary_round_trip(tmp_path):
+    expected = _create_map_data()
+    path_xml = str(tmp_path / "map.map")
+    path_binary = str(tmp_path / "map.sonmap")
+    path_xml_again = str(tmp_path / "again.map")
+
+    write_map_xml(expected, path_xml)
+    map_data = read_map_xml(path_xml)
+    _assert_equal(map_data, expected)
+
+    write_map_binary(map_data, path_binary)
+    map_data_binary = read_map_binary(path_binary)
+    try:
+        _assert_equal(map_data_binary, expected)
+        write_map_xml(map_data_binary, path_xml_again)
+    finally:
+        map_data_binary.close()
+
+    _assert_equal(read_map_xml(path_xml_again), expected)
+
+
+def test_object_params_preserved(tmp_path):
+    path = str(tmp_path / "map.sonmap")
+    write_map_binary(_create_map_data(), path)
+
+    map_data = read_map_binary(path)
+    try:
+        forest, boulders = map_data.objects[(2, 1)]
+        assert forest.tag == "forest"
+        assert forest.params == {"density": 7, "age_in_turns": 3}
+        assert boulders.params == {}
+    finally:
+        map_data.close()
+
+
+def test_xml_duplicate_cell(tmp_path):
+    path = _write_xml(tmp_path / "map.map", [(0, 0), (1, 0), (1, 0), (2, 0)])
+    with pytest.raises(MapParseException, match="Duplicate cell: 1:0"):
+        read_map_xml(path)
+
+
+def test_xml_missing_cell(tmp_path):
+    path = _write_xml(tmp_path / "map.map", [(0, 0), (2, 0)])
+    with pytest.raises(MapParseException, match="Missing 1 cell"):
+        read_map_xml(path)
+
+
+def test_xml_cell_outside_of_map(tmp_path):
+    path = _write_xml(tmp_path / "map.map", [(0, 0), (1, 0), (3, 0)])
+    with pytest.raises(MapParseException, match="Cell outside of the map: 3:0"):
+        read_map_xml(path)
+
+
+def test_binary_unsupported_version(tmp_path):
+    path = tmp_path / "map.sonmap"
+    write_map_binary(_create_map_data(), str(path))
+
+    content = bytearray(path.read_bytes())
+    struct.pack_into("<H", content, len(MAGIC), FORMAT_VERSION + 1)
+    path.write_bytes(bytes(content))
+
+    with pytest.raises(MapParseException, match="Unsupported map format version"):
+        read_map_binary(str(path))
+
+
+def test_binary_not_a_map(tmp_path):
+    path = tmp_path / "map.sonmap"
+    path.write_bytes(b"<map></map>" * 10)
+
+    with pytest.raises(MapParseException):
+        read_map_binary(str(path))
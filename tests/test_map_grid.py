@@ -0,0 +1,85 @@
+import pytest
+
+from son.gameplay.map._map_data import MapData
+from son.gameplay.map._map_grid import (create_map_grid, numpy, GRID_BACKEND_NUMPY, GRID_BACKEND_ARRAY,
+                                        MOVEMENT_COST_BASE)
+from son.gameplay.map.objects import MapObject, ModifiersHolder
+
+_SIZE = (20, 10)
+
+
+class _Rock(MapObject, ModifiersHolder):
+    MODIFIERS = (("movement_cost", 2), ("defense", 1))
+
+    def __init__(self) -> None:
+        super().__init__("Rock")
+
+    def _get_surface(self) -> None:
+        return None
+
+
+class _Swamp(MapObject, ModifiersHolder):
+    MODIFIERS = (("movement_cost", 3),)
+
+    def __init__(self) -> None:
+        super().__init__("Swamp")
+
+    def _get_surface(self) -> None:
+        return None
+
+
+def _create_grid(backend: str):
+    terrain_grid = bytearray(i % 2 for i in range(_SIZE[0] * _SIZE[1]))
+    return create_map_grid(MapData(_SIZE, ["grassland", "water"], terrain_grid, dict()), backend)
+
+
+def _get_stats(grid):
+    return [(grid.get_movement_cost((x, y)), grid.get_object_count((x, y)), grid.get_terrain_id((x, y)))
+            for y in range(_SIZE[1]) for x in range(_SIZE[0])]
+
+
+def _change(grid, objects) -> None:
+    """
+    Add, move and remove the map objects the same way on any grid, updating the stats in between.
+    """
+    for i, map_object in enumerate(objects):
+        grid.add_object((i * 3 % _SIZE[0], i % _SIZE[1]), map_object)
+    grid.update_stats()
+
+    for map_object in objects[::2]:
+        pos = grid.index.get_pos(map_object)
+        grid.remove_object(pos, map_object)
+        grid.add_object(((pos[0] + 1) % _SIZE[0], pos[1]), map_object)
+    for map_object in objects[1::3]:
+        grid.remove_object(grid.index.get_pos(map_object), map_object)
+    grid.update_stats()
+
+
+@pytest.mark.skipif(numpy is None, reason="NumPy not installed")
+def test_backends_update_the_same_stats():
+    grids = [_create_grid(GRID_BACKEND_NUMPY), _create_grid(GRID_BACKEND_ARRAY)]
+    for grid in grids:
+        _change(grid, [_Rock() if i % 4 else _Swamp() for i in range(40)])
+
+    assert _get_stats(grids[0]) == _get_stats(grids[1])
+
+
+@pytest.mark.parametrize("backend", [GRID_BACKEND_NUMPY, GRID_BACKEND_ARRAY])
+def test_stats_updated_only_by_update_stats(backend):
+    if backend == GRID_BACKEND_NUMPY and numpy is None:
+        pytest.skip("NumPy not installed")
+    grid = _create_grid(backend)
+    rock, swamp = _Rock(), _Swamp()
+
+    grid.add_object((1, 1), rock)
+    grid.add_object((1, 1), swamp)
+    assert grid.get_object_count((1, 1)) == 2
+    assert grid.get_movement_cost((1, 1)) == MOVEMENT_COST_BASE
+
+    grid.update_stats()
+    assert grid.get_movement_cost((1, 1)) == MOVEMENT_COST_BASE + 5
+
+    grid.remove_object((1, 1), swamp)
+    grid.update_stats()
+    assert grid.get_movement_cost((1, 1)) == MOVEMENT_COST_BASE + 2
+    assert grid.get_movement_cost((2, 1)) == MOVEMENT_COST_BASE
@@ -0,0 +1,95 @@
+import pytest
+from pygame import Rect
+
+from son.gameplay.map._map_object_index import MapObjectIndex
+from son.gameplay.map.objects import MapObject
+
+
+class _Rock(MapObject):
+    def __init__(self) -> None:
+        super().__init__("Rock")
+
+    def _get_surface(self) -> None:
+        return None
+
+
+class _Boulder(_Rock):
+    pass
+
+
+class _Tree(MapObject):
+    def __init__(self) -> None:
+        super().__init__("Tree")
+
+    def _get_surface(self) -> None:
+        return None
+
+
+def test_add_and_remove():
+    index = MapObjectIndex()
+    rock = _Rock()
+
+    index.add((3, 4), rock)
+    assert rock in index
+    assert index.get_pos(rock) == (3, 4)
+    assert list(index.get_objects((3, 4))) == [rock]
+    with pytest.raises(ValueError):
+        index.add((5, 5), rock)
+
+    version = index.version
+    index.remove((3, 4), rock)
+    assert rock not in index
+    assert index.version != version
+    assert list(index.get_objects((3, 4))) == []
+    assert list(index.positions) == []
+    with pytest.raises(ValueError):
+        index.remove((3, 4), rock)
+
+
+def test_objects_of_type():
+    index = MapObjectIndex()
+    rock, boulder, tree = _Rock(), _Boulder(), _Tree()
+    index.add((0, 0), rock)
+    index.add((1, 0), boulder)
+    index.add((2, 0), tree)
+
+    assert set(index.get_objects_of_type(_Rock)) == {rock, boulder}
+    assert index.get_objects_of_type(_Boulder) == [boulder]
+
+
+@pytest.mark.parametrize("object_type", [None, _Rock, _Tree])
+def test_find_in_rect(object_type):
+    index = MapObjectIndex()
+    objects = dict()
+    for x in range(0, 100, 7):
+        for y in range(0, 100, 11):
+            map_object = _Rock() if (x + y) % 2 == 0 else _Tree()
+            index.add((x, y), map_object)
+            objects[map_object] = (x, y)
+
+    for rect in [Rect(0, 0, 100, 100), Rect(10, 20, 30, 17), Rect(-50, -50, 60, 80), Rect(99, 99, 1, 1)]:
+        expected = {map_object for map_object, pos in objects.items() if rect.collidepoint(pos)
+                    and (object_type is None or isinstance(map_object, object_type))}
+        assert set(index.find_in_rect(rect, object_type)) == expected
+
+
+def test_find_in_radius():
+    index = MapObjectIndex()
+    near, far = _Rock(), _Rock()
+    index.add((10, 10), near)
+    index.add((15, 12), far)
+
+    assert index.find_in_radius((12, 12), 2) == [near]
+    assert set(index.find_in_radius((12, 12), 3)) == {near, far}
+
+
+def test_occupied_cells_row_by_row():
+    index = MapObjectIndex()
+    positions = [(40, 3), (2, 5), (5, 3), (70, 70), (2, 4)]
+    for pos in positions:
+        index.add(pos, _Rock())
+
+    for first_pos, last_pos in [((0, 0), (79, 79)), ((0, 0), (10, 10)), ((3, 3), (45, 4))]:
+        expected = sorted((pos for pos in positions if first_pos[0] <= pos[0] <= last_pos[0]
+                           and first_pos[1] <= pos[1] <= last_pos[1]), key=lambda pos: (pos[1], pos[0]))
+        assert [pos for pos, _ in index.get_occupied_cells(first_pos, last_pos)] == expected
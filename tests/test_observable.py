@@ -0,0 +1,54 @@
+import pytest
+
+from son.core.observable import ObservableDict
+
+
+def test_observer_called_on_change_only():
+    values = ObservableDict(density=1)
+    changes = list()
+    values.observe("density", changes.append)
+
+    values["density"] = 1
+    values["density"] = 2
+    values["age"] = 5
+    values["density"] = 2
+
+    assert changes == [2]
+    assert dict(values) == {"density": 2, "age": 5}
+
+
+def test_observer_of_new_key():
+    values = ObservableDict()
+    changes = list()
+    values.observe("age", changes.append)
+
+    values["age"] = 0
+    assert changes == [0]
+
+
+def test_unobserve():
+    values = ObservableDict(density=1)
+    changes = list()
+    values.observe("density", changes.append)
+    values.unobserve("density", changes.append)
+
+    values["density"] = 2
+    assert changes == []
+    with pytest.raises(ValueError):
+        values.unobserve("density", changes.append)
+
+
+def test_observer_unobserving_itself():
+    values = ObservableDict()
+    changes = list()
+
+    def observer(value: int) -> None:
+        changes.append(value)
+        values.unobserve("density", observer)
+
+    values.observe("density", observer)
+    values.observe("density", changes.append)
+    values["density"] = 1
+    values["density"] = 2
+
+    assert changes == [1, 1, 2]
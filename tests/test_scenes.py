@@ -0,0 +1,131 @@
+import gc
+import time
+
+import pytest
+from pygame.event import Event
+
+from son.core.events import SCENE_FINISHED
+from son.core.loading import LoadingTask
+from son.core.scenes import SceneManager, SceneBase, SceneLoadingBase
+
+
+class _Menu(SceneBase):
+    pass
+
+
+class _Loaded(SceneBase):
+    requires_loading = True
+    unloaded = list()
+
+    def __init__(self, data: object) -> None:
+        self.data = data
+
+    @staticmethod
+    def load(task: LoadingTask) -> object:
+        return "data"
+
+    @staticmethod
+    def unload(data: object) -> None:
+        _Loaded.unloaded.append(data)
+
+
+class _Failing(_Loaded):
+    @staticmethod
+    def load(task: LoadingTask) -> object:
+        raise OSError("Map not readable")
+
+
+class _Slow(_Loaded):
+    @staticmethod
+    def load(task: LoadingTask) -> object:
+        time.sleep(0.1)
+        return "slow data"
+
+
+class _Loading(SceneLoadingBase):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def _unfreeze_gc():
+    # The loaded scenes freeze the objects in the garbage collector, which must not leak into the other tests
+    yield
+    gc.unfreeze()
+
+
+def _create_scene_manager(loading_scene_name=None) -> SceneManager:
+    scene_manager = SceneManager(initial_scene_name="Menu", loading_scene_name=loading_scene_name)
+    scene_manager.register_scene("Menu", _Menu)
+    scene_manager.register_scene("Loading", _Loading)
+    for scene_class in (_Loaded, _Failing, _Slow):
+        scene_manager.register_scene(scene_class.__name__[1:], scene_class)
+    scene_manager.pre_update()
+    return scene_manager
+
+
+def _finish_scene(scene_manager: SceneManager, next_scene_name: str) -> None:
+    scene_manager.handle_event(Event(SCENE_FINISHED, {"next_scene_name": next_scene_name}))
+    scene_manager.pre_update()
+
+
+def _wait_for_loading(scene_manager: SceneManager) -> None:
+    while scene_manager._loading_task is not None:
+        time.sleep(0.01)
+        scene_manager.pre_update()
+
+
+def _show(scene_manager: SceneManager, name: str) -> None:
+    _finish_scene(scene_manager, name)
+    _wait_for_loading(scene_manager)
+
+
+def test_loaded_scene():
+    scene_manager = _create_scene_manager("Loading")
+    _show(scene_manager, "Loaded")
+
+    assert isinstance(scene_manager._active_scene, _Loaded)
+    assert scene_manager._active_scene.data == "data"
+
+
+@pytest.mark.parametrize("loading_scene_name", [None, "Loading"])
+def test_failed_loading_falls_back(loading_scene_name):
+    scene_manager = _create_scene_manager(loading_scene_name)
+    _show(scene_manager, "Failing")
+
+    assert isinstance(scene_manager._active_scene, _Menu)
+
+
+def test_failed_initial_loading_raises():
+    scene_manager = SceneManager(initial_scene_name="Failing")
+    scene_manager.register_scene("Failing", _Failing)
+
+    with pytest.raises(OSError):
+        scene_manager.pre_update()
+
+
+def test_abandoned_loading_unloaded():
+    _Loaded.unloaded.clear()
+    scene_manager = _create_scene_manager("Loading")
+    _finish_scene(scene_manager, "Slow")
+    _show(scene_manager, "Menu")
+    assert _Loaded.unloaded == []
+
+    time.sleep(0.2)
+    scene_manager.pre_update()
+    assert _Loaded.unloaded == ["slow data"]
+
+
+def test_gc_frozen_only_for_loaded_scene():
+    scene_manager = _create_scene_manager("Loading")
+    assert gc.get_freeze_count() == 0
+
+    _finish_scene(scene_manager, "Slow")
+    assert isinstance(scene_manager._active_scene, _Loading)
+    assert gc.get_freeze_count() == 0
+
+    _wait_for_loading(scene_manager)
+    assert isinstance(scene_manager._active_scene, _Slow)
+    assert gc.get_freeze_count() > 0
+
+    _show(scene_manager, "Menu")
+    assert gc.get_freeze_count() == 0
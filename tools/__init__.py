@@ -0,0 +1,3 @@
+"""
+Development tools. Run them from the root directory of the project, e.g. `python -m tools.convert_maps`.
+"""
@@ -0,0 +1,37 @@
+"""
+Convert XML map files into the binary format.
+
+Usage: python -m tools.convert_maps [name ...]
+
+Without any names all XML maps from the maps directory are converted.
+"""
+
+import os
+import sys
+import time
+
+from son.gameplay.map import convert_map, MapParseException
+from son.gameplay.map._map_parser import MAPS_DIR, EXTENSION_XML
+
+
+def main() -> int:
+    names = sys.argv[1:]
+    if len(names) == 0:
+        names = sorted(os.path.splitext(f)[0] for f in os.listdir(MAPS_DIR) if f.endswith(EXTENSION_XML))
+
+    result = 0
+    for name in names:
+        start = time.perf_counter()
+        try:
+            path = convert_map(name)
+        except (MapParseException, OSError) as e:
+            print("{}: {}".format(name, e), file=sys.stderr)
+            result = 1
+            continue
+        print("{} -> {} ({} bytes, {:.2f} s)".format(name, path, os.path.getsize(path), time.perf_counter() - start))
+
+    return result
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""
+Generate a random map for benchmarks and stress tests.
+
+Usage: python -m tools.generate_map NAME [options]
+
+The same seed and options always produce the same map. Run with --help to see all options.
+"""
+
+import argparse
+import re
+import sys
+import time
+from typing import Tuple
+
+from son.gameplay.map import generate_map, save_map
+
+
+def _parse_size(value: str) -> Tuple[int, int]:
+    match = re.search("^(\\d+)x(\\d+)$", value)
+    if match is None:
+        raise argparse.ArgumentTypeError("size must be given as WIDTHxHEIGHT, e.g. 100x100")
+    return int(match.group(1)), int(match.group(2))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.generate_map", description="Generate a random map.")
+    parser.add_argument("name", help="name of the map file (without extension)")
+    parser.add_argument("--size", type=_parse_size, default=(100, 100), help="size in cells, e.g. 500x500")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random generator")
+    parser.add_argument("--forests", type=float, default=0.1, help="share of the cells with forests")
+    parser.add_argument("--boulders", type=float, default=0.01, help="share of the cells with boulders")
+    parser.add_argument("--tribes", type=float, default=0.0005, help="share of the cells with tribes")
+    parser.add_argument("--terrain", nargs="+", default=["grassland"], help="terrain types to use")
+    parser.add_argument("--binary", action="store_true", help="save the map in the binary format")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        map_data = generate_map(args.size, seed=args.seed, forests=args.forests, boulders=args.boulders,
+                                tribes=args.tribes, terrain_types=args.terrain)
+    except ValueError as e:
+        parser.error(str(e))
+
+    path = save_map(map_data, args.name, binary=args.binary)
+    print("{} ({}x{}, {} objects, {:.2f} s)".format(path, *map_data.size, len(map_data.objects),
+                                                   time.perf_counter() - start))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""
+Report the memory used by a map.
+
+Usage: python -m tools.memory_report NAME [options]
+
+The memory is measured with tracemalloc for the steps of loading the map: parsing the map file, creating the map
+objects, creating the map and loading all its cells. The report can be saved as a baseline, e.g. before a change,
+and later reports compared with it. Run with --help to see all options.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from typing import Dict, Optional
+
+from son.core.resources import ResourceManager, DataPath
+from son.gameplay.map import Map
+from son.gameplay.map._map_parser import parse_map, create_objects
+
+
+class _Measurement:
+    """
+    Memory allocated since the start of the measurement.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize _Measurement.
+        """
+        gc.collect()
+        self._start = tracemalloc.get_traced_memory()[0]
+
+    def stop(self) -> int:
+        """
+        Get the memory allocated since the start of the measurement in bytes.
+        """
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] - self._start
+
+
+def _print_row(title: str, size: int, count: int, unit: str, baseline: Optional[Dict[str, int]]) -> None:
+    row = "{:<24}{:>12.1f} MB{:>12.1f} B/{:<8}".format(title, size / 1024 / 1024, size / max(count, 1), unit)
+    if baseline is not None and baseline.get(title):
+        base_size = baseline[title]
+        row += "{:>12.1f} B/{:<8}{:>+8.1f} %".format(base_size / max(count, 1), unit,
+                                                     (size - base_size) / base_size * 100)
+    print(row)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.memory_report", description="Report the memory of a map.")
+    parser.add_argument("name", help="name of the map or path to a map file")
+    parser.add_argument("--no-cells", action="store_true", help="do not load all cells of the map")
+    parser.add_argument("--save", metavar="FILE", help="save the report as a baseline into a JSON file")
+    parser.add_argument("--baseline", metavar="FILE", help="compare the report with a baseline saved by --save")
+    args = parser.parse_args()
+
+    baseline: Optional[Dict[str, int]] = None
+    if args.baseline is not None:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    resource_manager = ResourceManager([
+        DataPath(path="terrain", prefix="terrain"),
+        DataPath(path="objects", prefix="object"),
+        DataPath(path="units", prefix="unit")
+    ])
+    resource_manager.load_resources()
+
+    tracemalloc.start()
+
+    measurement = _Measurement()
+    map_data = parse_map(args.name)
+    map_data_size = measurement.stop()
+
+    measurement = _Measurement()
+    map_objects = create_objects(map_data, resource_manager)
+    map_objects_size = measurement.stop()
+
+    size_x, size_y = map_data.size
+    cells_count = size_x * size_y
+    objects_count = sum(len(cell_map_objects) for cell_map_objects in map_objects.values())
+    map_data.close()
+    del map_objects, map_data
+
+    measurement = _Measurement()
+    game_map = Map(resource_manager, args.name)
+    map_size = measurement.stop()
+
+    cells_size = 0
+    if not args.no_cells:
+        # The cells are unloaded only while drawing, so all of them stay loaded
+        measurement = _Measurement()
+        for y in range(size_y):
+            for x in range(size_x):
+                game_map.get_cell((x, y))
+        cells_size = measurement.stop()
+
+    tracemalloc.stop()
+    game_map.close()
+
+    sizes = {"Map data": map_data_size, "Map objects": map_objects_size, "Map": map_size}
+    if not args.no_cells:
+        sizes["All cells loaded"] = cells_size
+    sizes["Total"] = map_size + cells_size
+
+    print("Map '{}' ({}x{}, {} objects)".format(args.name, size_x, size_y, objects_count))
+    if baseline is not None:
+        print("{:<62}{:>12}{:>21}".format("", "baseline", "change"))
+    for title, size in sizes.items():
+        if title == "Map objects":
+            _print_row(title, size, objects_count, "object", baseline)
+        else:
+            _print_row(title, size, cells_count, "cell", baseline)
+
+    if args.save is not None:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(sizes, file, indent=4)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
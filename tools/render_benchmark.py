@@ -0,0 +1,227 @@
+"""
+Benchmark the rendering of a map without any display.
+
+Usage: python -m tools.render_benchmark NAME [options]
+
+The game runs in the headless mode, with the SDL dummy video driver and an offscreen surface, so the benchmark works
+on a machine without any display, e.g. on a CI server. The view follows a scripted camera path: at each zoom level
+it is moved along the diagonal of the map from the top left to the bottom right corner, one step per frame. The time
+of the frames is reported as percentiles.
+
+Selected frames can be saved as PNG images and compared against reference images saved by an earlier run, e.g.
+before a change of the rendering. The frames are run with a fixed time delta, so the same options always produce
+the same images. Run with --help to see all options.
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from typing import Tuple, List
+
+import pygame
+from pygame import Surface
+from pygame.event import Event
+
+from son import SpiritOfNationsApp
+from son.core.events import CENTER_VIEW
+from son.core.vectors import VectorInt2D
+from son.gameplay import SceneGameplay
+from son.gameplay.map import ZOOM_LEVELS, DEFAULT_ZOOM_LEVEL
+
+# Percentiles of the frame time reported by the benchmark
+PERCENTILES = (50, 90, 95, 99)
+
+# Zoom level and position of the cell in the center of the view
+CameraStep = Tuple[int, VectorInt2D]
+
+
+def _parse_resolution(value: str) -> Tuple[int, int]:
+    match = re.search("^(\\d+)x(\\d+)$", value)
+    if match is None:
+        raise argparse.ArgumentTypeError("resolution must be given as WIDTHxHEIGHT, e.g. 1280x720")
+    return int(match.group(1)), int(match.group(2))
+
+
+def _parse_zoom_level(value: str) -> int:
+    zoom_level = int(value)
+    if not 0 <= zoom_level < len(ZOOM_LEVELS):
+        raise argparse.ArgumentTypeError("zoom level must be from 0 to {}".format(len(ZOOM_LEVELS) - 1))
+    return zoom_level
+
+
+def create_camera_path(map_size: VectorInt2D, frames: int, zoom_levels: List[int]) -> List[CameraStep]:
+    """
+    Create a camera path moving the view along the diagonal of the map at each of the given zoom levels.
+
+    The frames are split evenly between the zoom levels.
+
+    :param map_size: size of the map in cells
+    :param frames: number of the steps of the path
+    :param zoom_levels: zoom levels in the order of visiting them
+    :return: zoom level and position of the cell in the center of the view for each frame
+    """
+    size_x, size_y = map_size
+    path: List[CameraStep] = list()
+    for index, zoom_level in enumerate(zoom_levels):
+        segment_frames = (frames * (index + 1)) // len(zoom_levels) - (frames * index) // len(zoom_levels)
+        for frame in range(segment_frames):
+            progress = frame / max(segment_frames - 1, 1)
+            path.append((zoom_level, (round(progress * (size_x - 1)), round(progress * (size_y - 1)))))
+    return path
+
+
+def get_percentile(sorted_values: List[float], percentile: float) -> float:
+    """
+    Get the percentile of the values by the nearest-rank method.
+
+    :param sorted_values: values sorted in the ascending order, at least one
+    :param percentile: percentile from 0 to 100
+    """
+    rank = max(int(-(-percentile * len(sorted_values) // 100)), 1)
+    return sorted_values[rank - 1]
+
+
+def compare_images(surface: Surface, reference: Surface) -> int:
+    """
+    Count the pixels that differ between a frame and its reference image.
+
+    :param surface: surface with the frame
+    :param reference: reference image
+    :return: number of the different pixels, all pixels of the frame when the sizes differ
+    """
+    width, height = surface.get_size()
+    if reference.get_size() != (width, height):
+        return width * height
+
+    pixels = pygame.image.tobytes(surface, "RGB")
+    reference_pixels = pygame.image.tobytes(reference, "RGB")
+    if pixels == reference_pixels:
+        return 0
+
+    # Only the different rows are compared pixel by pixel
+    count = 0
+    row_length = 3 * width
+    for start in range(0, len(pixels), row_length):
+        row = pixels[start:start + row_length]
+        reference_row = reference_pixels[start:start + row_length]
+        if row != reference_row:
+            count += sum(1 for i in range(0, row_length, 3) if row[i:i + 3] != reference_row[i:i + 3])
+    return count
+
+
+def _move_camera(app: SpiritOfNationsApp, zoom_level: int, step: CameraStep) -> None:
+    """
+    Move the view to the given step of the camera path before the next frame.
+
+    The input events are handled at once, they post the events zooming and scrolling the map, which are handled
+    by the next frame, so that the frame shows the given step.
+
+    :param app: the benchmarked app
+    :param zoom_level: current zoom level
+    :param step: step of the camera path
+    """
+    step_zoom_level, grid_pos = step
+    if step_zoom_level != zoom_level:
+        # Scrolling the wheel down zooms out, i.e. moves to a higher index in ZOOM_LEVELS
+        pygame.event.post(Event(pygame.MOUSEWHEEL, {"x": 0, "y": zoom_level - step_zoom_level, "flipped": False}))
+    pygame.event.post(Event(CENTER_VIEW, {"grid_pos": grid_pos}))
+    app.handle_events()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m tools.render_benchmark", description="Benchmark the rendering.")
+    parser.add_argument("name", help="name of the map or path to a map file")
+    parser.add_argument("--frames", type=int, default=300, help="number of the measured frames")
+    parser.add_argument("--warmup", type=int, default=10, help="number of the frames run before the measurement")
+    parser.add_argument("--resolution", type=_parse_resolution, default=(1920, 1080), help="e.g. 1280x720")
+    parser.add_argument("--zoom", type=_parse_zoom_level, nargs="+", default=list(range(len(ZOOM_LEVELS))),
+                        help="zoom levels visited by the camera, indexes in {}".format(ZOOM_LEVELS))
+    parser.add_argument("--full-redraw", action="store_true", help="draw the whole screen in each frame")
+    parser.add_argument("--capture", type=int, nargs="+", default=list(), help="indexes of the frames to save")
+    parser.add_argument("--output", default=os.path.join(".cache", "frames"), help="directory of the saved frames")
+    parser.add_argument("--reference", help="directory of the reference images to compare the saved frames with")
+    args = parser.parse_args()
+
+    if args.frames <= 0:
+        parser.error("the number of frames must be positive")
+
+    app = SpiritOfNationsApp(args.resolution, dirty_rendering=not args.full_redraw, headless=True,
+                             map_name=args.name, initial_scene_name="Gameplay")
+    time_delta = 1.0 / app.fps
+
+    # The map is loaded while the loading scene is shown
+    start = time.perf_counter()
+    while app.is_loading:
+        app.run_frame(time_delta)
+        time.sleep(0.01)
+    print("{} loaded ({:.2f} s)".format(args.name, time.perf_counter() - start))
+
+    scene = app.active_scene
+    if not isinstance(scene, SceneGameplay):
+        print("The gameplay scene has not been loaded: {}".format(type(scene).__name__))
+        return 1
+
+    path = create_camera_path(scene.map_size, args.frames, args.zoom)
+
+    zoom_level = DEFAULT_ZOOM_LEVEL
+    for _ in range(args.warmup):
+        _move_camera(app, zoom_level, path[0])
+        zoom_level = path[0][0]
+        app.run_frame(time_delta)
+
+    captured_frames = set(args.capture)
+    if len(captured_frames) > 0:
+        os.makedirs(args.output, exist_ok=True)
+
+    frame_times: List[float] = list()
+    different_frames = 0
+    for frame, step in enumerate(path):
+        _move_camera(app, zoom_level, step)
+        zoom_level = step[0]
+
+        start = time.perf_counter()
+        app.run_frame(time_delta)
+        frame_times.append(time.perf_counter() - start)
+
+        if frame in captured_frames:
+            file_name = "frame_{:04d}.png".format(frame)
+            pygame.image.save(app.surface, os.path.join(args.output, file_name))
+            if args.reference is not None:
+                different_frames += _compare_frame(app.surface, os.path.join(args.reference, file_name))
+
+    frame_times.sort()
+    print("{} frames at {}x{}, zoom levels {}".format(len(frame_times), *args.resolution,
+                                                       " ".join(str(zoom_level) for zoom_level in args.zoom)))
+    print("{:<8}{:>10.2f} ms".format("mean", 1000 * sum(frame_times) / len(frame_times)))
+    for percentile in PERCENTILES:
+        print("{:<8}{:>10.2f} ms".format("p{}".format(percentile), 1000 * get_percentile(frame_times, percentile)))
+    print("{:<8}{:>10.2f} ms".format("max", 1000 * frame_times[-1]))
+
+    return 1 if different_frames > 0 else 0
+
+
+def _compare_frame(surface: Surface, reference_path: str) -> int:
+    """
+    Compare a frame with its reference image and print the result.
+
+    :param surface: surface with the frame
+    :param reference_path: path to the reference image
+    :return: 1 when the frame differs from the reference image or the image is missing, otherwise 0
+    """
+    if not os.path.isfile(reference_path):
+        print("{}: missing reference image".format(reference_path))
+        return 1
+
+    count = compare_images(surface, pygame.image.load(reference_path))
+    if count > 0:
+        print("{}: {} different pixels".format(reference_path, count))
+        return 1
+
+    print("{}: identical".format(reference_path))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())